@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+CSV reader throughput comparison.
+Times a full ChunkIterator pass over a generated CSV file with the pandas C
+engine and the pyarrow streaming engine.
+
+    python benchmarks/csv_engine_throughput.py --rows 2000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(os.path.dirname(current_dir), 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import numpy as np
+import pandas as pd
+
+from operations.delayed_operations import ChunkIterator, CSV_ENGINES
+from operations.schema_inference import infer_csv_schema
+
+def generate_csv(path, rows, seed=0):
+    """Write a mixed text/numeric CSV, including quoted values with newlines."""
+    rng = np.random.default_rng(seed)
+    block = 500000
+    for start in range(0, rows, block):
+        n = min(block, rows - start)
+        ids = np.arange(start, start + n)
+        df = pd.DataFrame({
+            'id': ids,
+            'name': np.char.add('Customer ', ids.astype(str)),
+            'email': np.char.add(np.char.add('user', ids.astype(str)), '@example.com'),
+            'amount': np.round(rng.random(n) * 1000, 2),
+            'qty': rng.integers(0, 100, n),
+            'note': np.where(ids % 1000 == 0, 'multi\nline', 'plain'),
+        })
+        df.to_csv(path, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+
+def time_engine(path, engine, chunk_size, schema):
+    iterator = ChunkIterator(path, chunk_size, schema, engine=engine)
+    rows = 0
+    start = time.perf_counter()
+    for chunk in iterator:
+        rows += len(chunk)
+    return rows, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000, help="rows in the generated file")
+    parser.add_argument('--chunk-size', type=int, default=100000, help="rows per chunk")
+    parser.add_argument('--file', help="benchmark an existing CSV instead of generating one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = args.file
+        if path is None:
+            path = os.path.join(tmpdir, 'bench.csv')
+            generate_csv(path, args.rows)
+        size_mb = os.path.getsize(path) / (1 << 20)
+        schema = infer_csv_schema(path)
+
+        print(f"File: {path} ({size_mb:.1f} MB), chunk size {args.chunk_size:,}")
+        results = {}
+        for engine in CSV_ENGINES:
+            rows, seconds = time_engine(path, engine, args.chunk_size, schema)
+            results[engine] = seconds
+            print(f"{engine:>7}: {rows:,} rows in {seconds:.2f}s  "
+                  f"{rows / seconds:,.0f} rows/s  {size_mb / seconds:.1f} MB/s")
+        print(f"arrow speedup: {results['pandas'] / results['arrow']:.2f}x")
+
+if __name__ == '__main__':
+    main()
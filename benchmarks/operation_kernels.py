@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Operation kernel benchmark.
+Times every operation key in resources/operations_config.json through
+apply_operation_to_partition on synthetic data at several sizes, and records
+rows/s and peak memory. Results can be saved as a JSON baseline and later
+runs compared against it; a drop in rows/s beyond the threshold is reported
+as a regression and makes the script exit with status 1.
+
+    python benchmarks/operation_kernels.py --rows 10000 1000000 --save baseline.json
+    python benchmarks/operation_kernels.py --rows 10000 1000000 --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from datetime import datetime
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import numpy as np
+import pandas as pd
+import psutil
+
+from operations.preview_utils import apply_operation_to_partition
+from synthetic_data import make_frame
+
+CONFIG_PATH = os.path.join(project_root, 'resources', 'operations_config.json')
+DEFAULT_ROWS = (10000, 1000000, 10000000)
+DEFAULT_THRESHOLD = 0.15
+
+# Operation key -> (column, extra parameters); None marks keys that have no
+# partition kernel (they are applied by the UI on the whole sheet)
+OPERATION_CASES = {
+    'op_mask': ('name', {}),
+    'op_mask_email': ('email', {}),
+    'op_mask_words': ('name', {}),
+    'op_trim': ('name', {}),
+    'op_split_delimiter': ('email', {'delimiter': '@'}),
+    'op_split_surname': ('name', {}),
+    'op_upper': ('name', {}),
+    'op_lower': ('name', {}),
+    'op_title': ('name', {}),
+    'op_find_replace': ('url', {'find_text': 'http://', 'replace_text': 'https://'}),
+    'op_remove_specific': ('phone', {'chars_to_remove': '()+'}),
+    'op_remove_non_numeric': ('phone', {}),
+    'op_remove_non_alpha': ('name', {}),
+    'op_concatenate': (None, {'cols_to_concat': ['name', 'email'], 'separator': ' - ', 'new_col_name': 'contact'}),
+    'op_extract_pattern': ('email', {'pattern': r'@([\w.]+)', 'new_col_name': 'domain'}),
+    'op_fill_missing': ('category', {'fill_value': 'unknown'}),
+    'op_mark_duplicates': ('code', {}),
+    'op_remove_duplicates': ('code', {}),
+    'op_merge_columns': None,
+    'op_rename_column': ('name', {'new_col_name': 'full_name'}),
+    'op_round_numbers': ('amount', {'decimals': 1}),
+    'op_calculate_column_constant': ('amount', {'operation': '*', 'constant_value': 1.2}),
+    'op_create_calculated_column': ('amount', {'col1_name': 'amount', 'col2_name': 'qty', 'operation': '*',
+                                               'new_col_name': 'total'}),
+    'op_validate_email': ('email', {}),
+    'op_validate_phone': ('phone', {}),
+    'op_validate_date': ('date', {}),
+    'op_validate_numeric': ('amount', {}),
+    'op_validate_alphanumeric': ('code', {}),
+    'op_validate_url': ('url', {}),
+    'op_distinct_group': ('category', {}),
+}
+
+def operation_keys():
+    with open(CONFIG_PATH, encoding='utf-8') as f:
+        return json.load(f)['operations']
+
+def input_columns(column, params):
+    """Columns an operation reads, in a stable order."""
+    columns = [column] if column else []
+    columns += params.get('cols_to_concat', [])
+    columns += [params[name] for name in ('col1_name', 'col2_name') if name in params]
+    return tuple(dict.fromkeys(columns))
+
+class PeakMemory:
+    """Sample the process RSS on a background thread while the block runs."""
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self._process = psutil.Process()
+
+    def __enter__(self):
+        self.start = self.peak = self._process.memory_info().rss
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.peak = max(self.peak, self._process.memory_info().rss)
+
+    def __exit__(self, *exc):
+        self._stopped.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._process.memory_info().rss)
+
+def time_operation(df, key, column, params, repeat):
+    """Best of ``repeat`` runs; returns (seconds, peak RSS MB, peak RSS growth MB)."""
+    operation = dict(params, type='column_operation', key=key)
+    if column:
+        operation['column'] = column
+    header_mask = pd.Series(False, index=df.index)
+    best = None
+    peak = growth = 0.0
+    for _ in range(repeat):
+        with PeakMemory() as memory:
+            start = time.perf_counter()
+            result = apply_operation_to_partition(df, 'column_operation', operation, header_mask)
+            seconds = time.perf_counter() - start
+        del result
+        best = seconds if best is None else min(best, seconds)
+        peak = max(peak, memory.peak / (1 << 20))
+        growth = max(growth, (memory.peak - memory.start) / (1 << 20))
+    return best, peak, growth
+
+def run(rows_list, keys, repeat, arrow_strings):
+    results = []
+    for rows in rows_list:
+        # Operations reading the same columns share one generated frame
+        groups = {}
+        for key in keys:
+            case = OPERATION_CASES.get(key)
+            if case is None:
+                entry = {'operation': key, 'rows': rows, 'arrow_strings': arrow_strings,
+                         'status': 'skipped: no partition kernel'}
+                results.append(entry)
+                print_result(entry)
+                continue
+            groups.setdefault(input_columns(*case), []).append(key)
+        for columns, group in groups.items():
+            df = make_frame(rows, list(columns), arrow_strings=arrow_strings)
+            for key in group:
+                column, params = OPERATION_CASES[key]
+                runs = repeat or (3 if rows <= 100000 else 1)
+                entry = {'operation': key, 'rows': rows, 'arrow_strings': arrow_strings}
+                try:
+                    seconds, peak, growth = time_operation(df, key, column, params, runs)
+                except Exception as e:
+                    entry['status'] = f'error: {e}'
+                else:
+                    entry.update(status='ok', seconds=round(seconds, 6), rows_per_second=round(rows / seconds),
+                                 peak_rss_mb=round(peak, 1), peak_growth_mb=round(growth, 1))
+                results.append(entry)
+                print_result(entry)
+            del df
+    return results
+
+def print_result(entry):
+    if entry['status'] != 'ok':
+        print(f"{entry['operation']:<30} {entry['rows']:>11,}  {entry['status']}")
+        return
+    print(f"{entry['operation']:<30} {entry['rows']:>11,}  {entry['seconds']:9.3f}s  "
+          f"{entry['rows_per_second']:>13,} rows/s  peak {entry['peak_rss_mb']:8.1f} MB "
+          f"(+{entry['peak_growth_mb']:.1f})")
+
+def compare(results, baseline_path, threshold):
+    """Print the change against a baseline; returns the regressed entries."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(e['operation'], e['rows'], e['arrow_strings']): e
+                for e in baseline['results'] if e.get('status') == 'ok'}
+    regressions = []
+    print(f"\nCompared with {baseline_path} ({baseline['meta']['date']}), threshold {threshold:.0%}")
+    for entry in results:
+        old = previous.get((entry['operation'], entry['rows'], entry['arrow_strings']))
+        if old is None or entry['status'] != 'ok':
+            continue
+        change = entry['rows_per_second'] / old['rows_per_second'] - 1
+        regressed = change < -threshold
+        if regressed:
+            regressions.append(entry)
+        print(f"{entry['operation']:<30} {entry['rows']:>11,}  {change:+7.1%}"
+              f"{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=list(DEFAULT_ROWS), help="data sizes to time")
+    parser.add_argument('--ops', nargs='+', help="operation keys to time (default: all configured)")
+    parser.add_argument('--repeat', type=int, help="runs per measurement, best is kept "
+                                                   "(default: 3 up to 100k rows, else 1)")
+    parser.add_argument('--arrow-strings', action='store_true', help="use string[pyarrow] text columns")
+    parser.add_argument('--save', help="write the results as a JSON baseline")
+    parser.add_argument('--compare', help="compare rows/s against a JSON baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown reported as a regression (fraction, default 0.15)")
+    args = parser.parse_args()
+
+    keys = args.ops or operation_keys()
+    unknown = [key for key in keys if key not in OPERATION_CASES]
+    if unknown:
+        parser.error(f"no benchmark case for: {', '.join(unknown)}")
+
+    results = run(args.rows, keys, args.repeat, args.arrow_strings)
+    if args.save:
+        report = {
+            'meta': {
+                'date': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'pandas': pd.__version__,
+                'numpy': np.__version__,
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+            },
+            'results': results,
+        }
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline written to {args.save}")
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+End-to-end save throughput and scaling benchmark.
+Runs full save_with_operations passes over generated CSV and xlsx inputs for
+every combination of input size, input format, output format, chunk size and
+worker count (compression_workers), and prints throughput plus the speedup
+and parallel efficiency of each worker count over the smallest one. Inputs
+are generated once per size into --data-dir and reused by later runs.
+
+    python benchmarks/save_scaling.py --rows 100000 1000000 --outputs csv csv.gz xlsx
+    python benchmarks/save_scaling.py --rows 30000000 --inputs csv --data-dir /data/bench --save scaling.json
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+src_dir = os.path.join(project_root, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import pandas as pd
+
+from operations.delayed_operations import DelayedOperationManager
+from synthetic_data import make_frame
+
+DEFAULT_ROWS = (100000, 1000000)
+DEFAULT_OUTPUTS = ('csv', 'xlsx', 'parquet')
+# Rows generated and appended per block while writing an input file
+BLOCK_ROWS = 500000
+# Data rows of one worksheet; xlsx inputs are read from the active sheet only
+EXCEL_MAX_ROWS = 1048575
+
+# A typical clean-up pipeline over the generated columns
+PIPELINE = [
+    {'type': 'column_operation', 'key': 'op_trim', 'column': 'name'},
+    {'type': 'column_operation', 'key': 'op_title', 'column': 'name'},
+    {'type': 'column_operation', 'key': 'op_validate_email', 'column': 'email'},
+    {'type': 'column_operation', 'key': 'op_remove_non_numeric', 'column': 'phone'},
+    {'type': 'column_operation', 'key': 'op_find_replace', 'column': 'url',
+     'find_text': 'http://', 'replace_text': 'https://'},
+    {'type': 'column_operation', 'key': 'op_round_numbers', 'column': 'amount', 'decimals': 1},
+    {'type': 'column_operation', 'key': 'op_fill_missing', 'column': 'category', 'fill_value': 'unknown'},
+]
+
+def default_workers():
+    """1, 2, 4, ... up to the core count, plus the core count itself."""
+    cores = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cores:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cores:
+        workers.append(cores)
+    return workers
+
+def generate_csv(path, rows):
+    """Write ``rows`` generated rows block by block, so any size fits in memory."""
+    partial = path + '.partial'
+    for number, start in enumerate(range(0, rows, BLOCK_ROWS)):
+        block = make_frame(min(BLOCK_ROWS, rows - start), seed=number)
+        block.to_csv(partial, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+    os.replace(partial, path)
+
+def generate_xlsx(path, csv_path):
+    """Convert a generated CSV with a save without operations (the streaming xlsx writer)."""
+    manager = DelayedOperationManager()
+    manager.result_cache_dir = None
+    manager.write_run_report = False
+    manager.load_preview(csv_path, 'head')
+    if not manager.save_with_operations(path):
+        raise RuntimeError(f"Could not write {path}")
+
+def input_file(data_dir, rows, input_format):
+    """Path of the generated input, created on first use."""
+    csv_path = os.path.join(data_dir, f'input_{rows}.csv')
+    if not os.path.exists(csv_path):
+        print(f"Generating {csv_path} ...", flush=True)
+        generate_csv(csv_path, rows)
+    if input_format == 'csv':
+        return csv_path
+    xlsx_path = os.path.join(data_dir, f'input_{rows}.xlsx')
+    if not os.path.exists(xlsx_path):
+        print(f"Generating {xlsx_path} ...", flush=True)
+        generate_xlsx(xlsx_path, csv_path)
+    return xlsx_path
+
+def run_save(input_path, output_path, chunk_size, workers, operations):
+    """One full save; returns the result entry (timings from the run report)."""
+    manager = DelayedOperationManager()
+    manager.result_cache_dir = None
+    manager.write_run_report = False
+    manager.count_changed_cells = False
+    manager.chunk_size = chunk_size
+    manager.compression_workers = workers
+    manager.load_preview(input_path, 'head')
+    for op in operations:
+        manager.add_operation(op)
+    start = time.perf_counter()
+    ok = manager.save_with_operations(output_path)
+    seconds = time.perf_counter() - start
+    report = manager.last_run_report or {}
+    entry = {
+        'status': report.get('status', 'completed' if ok else 'failed'),
+        'seconds': round(seconds, 3),
+        'peak_rss_mb': round(report.get('peak_rss_bytes', 0) / (1 << 20), 1),
+        'stage_seconds': {name: stage['seconds'] for name, stage in report.get('stages', {}).items()},
+    }
+    if report.get('error'):
+        entry['error'] = report['error']
+    rows = report.get('rows_read')
+    if ok and rows:
+        entry.update(rows_read=rows, rows_per_second=round(rows / seconds),
+                     mb_per_second=round(os.path.getsize(input_path) / (1 << 20) / seconds, 2),
+                     output_mb=round(os.path.getsize(output_path) / (1 << 20), 1))
+    return entry
+
+def run(args):
+    results = []
+    operations = [] if args.no_ops else PIPELINE
+    with tempfile.TemporaryDirectory(dir=args.output_dir) as output_dir:
+        for rows in args.rows:
+            for input_format in args.inputs:
+                if input_format == 'xlsx' and rows > EXCEL_MAX_ROWS:
+                    print(f"Skipping xlsx input with {rows:,} rows (one sheet holds {EXCEL_MAX_ROWS:,})")
+                    continue
+                input_path = input_file(args.data_dir, rows, input_format)
+                input_mb = os.path.getsize(input_path) / (1 << 20)
+                for output_format in args.outputs:
+                    output_path = os.path.join(output_dir, f'output.{output_format}')
+                    for chunk_size in args.chunk_sizes:
+                        for workers in args.workers:
+                            entry = {'rows': rows, 'input': input_format, 'input_mb': round(input_mb, 1),
+                                     'output': output_format, 'chunk_size': chunk_size or 'auto',
+                                     'workers': workers}
+                            entry.update(run_save(input_path, output_path, chunk_size or None, workers, operations))
+                            if os.path.exists(output_path):
+                                os.remove(output_path)
+                            results.append(entry)
+                            print_result(entry)
+    add_speedups(results)
+    return results
+
+def print_result(entry):
+    case = (f"{entry['rows']:>11,} {entry['input']:>5} -> {entry['output']:<8} "
+            f"chunk {str(entry['chunk_size']):>8}  workers {entry['workers']:>3}")
+    if 'rows_per_second' not in entry:
+        print(f"{case}  {entry['status']}: {entry.get('error', '')}")
+        return
+    print(f"{case}  {entry['seconds']:8.2f}s  {entry['rows_per_second']:>11,} rows/s  "
+          f"{entry['mb_per_second']:7.1f} MB/s  peak {entry['peak_rss_mb']:8.1f} MB")
+
+def add_speedups(results):
+    """Speedup and efficiency of every run over the fewest workers of the same case."""
+    baselines = {}
+    for entry in sorted(results, key=lambda e: e['workers']):
+        if 'rows_per_second' not in entry:
+            continue
+        case = (entry['rows'], entry['input'], entry['output'], entry['chunk_size'])
+        base = baselines.setdefault(case, entry)
+        entry['speedup'] = round(base['seconds'] / entry['seconds'], 3)
+        entry['efficiency'] = round(entry['speedup'] * base['workers'] / entry['workers'], 3)
+
+def print_scaling(results):
+    """One speedup curve per case; flags where adding workers stops paying off."""
+    cases = {}
+    for entry in results:
+        if 'speedup' in entry:
+            cases.setdefault((entry['rows'], entry['input'], entry['output'], entry['chunk_size']), []).append(entry)
+    if not any(len(curve) > 1 for curve in cases.values()):
+        return
+    print("\nSpeedup over the fewest workers (efficiency)")
+    for (rows, input_format, output_format, chunk_size), curve in cases.items():
+        points = []
+        previous = None
+        for entry in sorted(curve, key=lambda e: e['workers']):
+            point = f"{entry['workers']}: {entry['speedup']:.2f}x ({entry['efficiency']:.0%})"
+            if previous is not None and entry['speedup'] < previous * 1.05:
+                point += ' flat'
+            points.append(point)
+            previous = entry['speedup']
+        print(f"{rows:>11,} {input_format:>5} -> {output_format:<8} chunk {str(chunk_size):>8}  "
+              + ', '.join(points))
+
+def write_curves(results, path):
+    """Flat CSV of the results, one row per run, for plotting."""
+    fields = ['rows', 'input', 'input_mb', 'output', 'chunk_size', 'workers', 'status', 'seconds',
+              'rows_per_second', 'mb_per_second', 'speedup', 'efficiency', 'peak_rss_mb', 'output_mb']
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fields, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(results)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=list(DEFAULT_ROWS),
+                        help="input sizes in rows (about 110 bytes of CSV per row)")
+    parser.add_argument('--inputs', nargs='+', choices=['csv', 'xlsx'], default=['csv', 'xlsx'],
+                        help="input formats")
+    parser.add_argument('--outputs', nargs='+', default=list(DEFAULT_OUTPUTS),
+                        help="output suffixes, e.g. csv csv.gz csv.zst xlsx parquet jsonl")
+    parser.add_argument('--chunk-sizes', type=int, nargs='+', default=[0],
+                        help="rows per chunk (0 = sized from the file, the default)")
+    parser.add_argument('--workers', type=int, nargs='+', default=default_workers(),
+                        help="compression worker counts (default: powers of two up to the core count)")
+    parser.add_argument('--no-ops', action='store_true', help="save without operations (pure I/O)")
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'exceltabletools-bench'),
+                        help="where generated inputs are kept between runs")
+    parser.add_argument('--output-dir', help="directory for the temporary outputs (default: system temp)")
+    parser.add_argument('--save', help="write the results as JSON")
+    parser.add_argument('--curves', help="write the results as CSV for plotting")
+    args = parser.parse_args()
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    print(f"Workers {args.workers}, chunk sizes {[c or 'auto' for c in args.chunk_sizes]}, "
+          f"{'no' if args.no_ops else len(PIPELINE)} operations")
+    results = run(args)
+    print_scaling(results)
+    if args.save:
+        report = {
+            'meta': {
+                'date': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'pandas': pd.__version__,
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'operations': [] if args.no_ops else PIPELINE,
+            },
+            'results': results,
+        }
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.save}")
+    if args.curves:
+        write_curves(results, args.curves)
+        print(f"Curves written to {args.curves}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Synthetic column generators for the benchmarks.
+Every generator takes a row count and a numpy Generator and returns a
+pandas Series with realistic dirt mixed in: stray spaces, invalid values
+and missing cells, so validations and clean-up operations have work to do.
+"""
+
+import numpy as np
+import pandas as pd
+
+FIRST_NAMES = np.array([
+    'John', 'Mary', 'Ahmet', 'Ayşe', 'Ivan', 'Olga', 'Li', 'Wei', 'Maria', 'José',
+    'Anna', 'Peter', 'Fatma', 'Mehmet', 'Elena', 'Sergei', 'Emma', 'Noah', 'Sofia', 'Lucas',
+], dtype=object)
+LAST_NAMES = np.array([
+    'Smith', 'Johnson', 'Yılmaz', 'Kaya', 'Ivanov', 'Petrova', 'Wang', 'Zhang', 'García', 'Müller',
+    'van der Berg', 'O\'Brien', 'Demir', 'Sokolov', 'Rossi', 'Brown', 'Taylor', 'Martin', 'Silva', 'Novak',
+], dtype=object)
+DOMAINS = np.array(['gmail.com', 'example.com', 'company.co.uk', 'mail.ru', 'yahoo.com', 'outlook.com'], dtype=object)
+TLDS = np.array(['com', 'org', 'net', 'io', 'co.uk', 'de'], dtype=object)
+CATEGORIES = np.array(['red', 'green', 'blue', 'yellow', 'black'], dtype=object)
+
+def _numbers_as_text(values: np.ndarray) -> np.ndarray:
+    return values.astype(str).astype(object)
+
+def _with_missing(values: np.ndarray, rng: np.random.Generator, share: float = 0.01) -> pd.Series:
+    series = pd.Series(values, dtype=object)
+    series[rng.random(len(series)) < share] = None
+    return series
+
+def names(rows: int, rng: np.random.Generator) -> pd.Series:
+    """Full names, a fifth of them padded with spaces."""
+    full = rng.choice(FIRST_NAMES, rows) + ' ' + rng.choice(LAST_NAMES, rows)
+    padded = rng.random(rows) < 0.2
+    full[padded] = '  ' + full[padded] + ' '
+    return _with_missing(full, rng)
+
+def emails(rows: int, rng: np.random.Generator) -> pd.Series:
+    """Addresses with about 5% malformed ones."""
+    users = np.char.lower(rng.choice(FIRST_NAMES, rows).astype(str)).astype(object)
+    values = users + '.' + _numbers_as_text(rng.integers(0, 100000, rows)) + '@' + rng.choice(DOMAINS, rows)
+    broken = rng.random(rows) < 0.05
+    values[broken] = users[broken] + '_at_nowhere'
+    return _with_missing(values, rng)
+
+def phones(rows: int, rng: np.random.Generator) -> pd.Series:
+    """International, national and too-short phone numbers."""
+    digits = _numbers_as_text(rng.integers(1000000, 9999999, rows))
+    prefix = rng.choice(np.array(['+1 555 ', '+44 20 ', '0212 ', '(555) '], dtype=object), rows)
+    values = prefix + digits
+    short = rng.random(rows) < 0.05
+    values[short] = np.array([d[:4] for d in digits[short]], dtype=object)
+    return _with_missing(values, rng)
+
+def dates(rows: int, rng: np.random.Generator) -> pd.Series:
+    """ISO dates with some impossible ones."""
+    days = rng.integers(0, 365 * 30, rows)
+    values = (np.datetime64('1995-01-01') + days.astype('timedelta64[D]')).astype(str).astype(object)
+    invalid = rng.random(rows) < 0.03
+    values[invalid] = '2021-02-30'
+    return _with_missing(values, rng)
+
+def urls(rows: int, rng: np.random.Generator) -> pd.Series:
+    """http(s) URLs with paths, and a few bare words."""
+    scheme = rng.choice(np.array(['https://', 'http://', 'https://www.'], dtype=object), rows)
+    host = np.char.lower(rng.choice(LAST_NAMES, rows).astype(str))
+    host = np.char.replace(np.char.replace(host, ' ', ''), "'", '').astype(object)
+    values = scheme + host + '.' + rng.choice(TLDS, rows) + '/page/' + _numbers_as_text(rng.integers(0, 1000, rows))
+    bare = rng.random(rows) < 0.03
+    values[bare] = host[bare]
+    return _with_missing(values, rng)
+
+def decimals(rows: int, rng: np.random.Generator) -> pd.Series:
+    """Floats with up to four decimals and missing values."""
+    scale = 10.0 ** rng.integers(0, 5, rows)
+    values = np.round(rng.normal(1000, 250, rows) * scale) / scale
+    values[rng.random(rows) < 0.01] = np.nan
+    return pd.Series(values)
+
+def integers(rows: int, rng: np.random.Generator) -> pd.Series:
+    return pd.Series(rng.integers(0, 1000, rows))
+
+def low_cardinality(rows: int, rng: np.random.Generator) -> pd.Series:
+    """A handful of repeating labels."""
+    return _with_missing(rng.choice(CATEGORIES, rows), rng)
+
+def high_cardinality(rows: int, rng: np.random.Generator) -> pd.Series:
+    """Codes with about one distinct value per ten rows."""
+    codes = rng.integers(0, max(rows // 10, 1), rows)
+    return _with_missing('C-' + _numbers_as_text(codes), rng)
+
+# Column name -> generator
+GENERATORS = {
+    'name': names,
+    'email': emails,
+    'phone': phones,
+    'date': dates,
+    'url': urls,
+    'amount': decimals,
+    'qty': integers,
+    'category': low_cardinality,
+    'code': high_cardinality,
+}
+
+def make_frame(rows: int, columns=None, seed: int = 0, arrow_strings: bool = False) -> pd.DataFrame:
+    """Build a frame of ``columns`` (default: all of ``GENERATORS``) with ``rows`` rows.
+
+    With ``arrow_strings`` the text columns use ``string[pyarrow]``, as when
+    files are read with arrow-backed strings.
+    """
+    frame = {}
+    known = list(GENERATORS)
+    for column in columns or known:
+        # A seed per column keeps a column identical whatever else is generated
+        series = GENERATORS[column](rows, np.random.default_rng((seed, known.index(column))))
+        if arrow_strings and series.dtype == object:
+            series = series.astype(pd.StringDtype('pyarrow'))
+        frame[column] = series
+    return pd.DataFrame(frame)
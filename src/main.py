@@ -19,7 +19,10 @@ if project_root not in sys.path:
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-from operations.delayed_operations import DelayedOperationManager
+from operations.delayed_operations import DelayedOperationManager, read_file_columns
+from operations.checkpoint import checkpoint_path
+from operations.run_metrics import configure_logging
+from operations.compression import split_compression
 
 # Import operations
 from operations.masking import mask_data, mask_email, mask_words  
@@ -128,6 +131,10 @@ class ExcelEditorApp:
                                        command=self.refresh_preview)
         refresh_preview_btn.pack(side=tk.LEFT, padx=5)
 
+        select_columns_btn = ttk.Button(preview_frame, text=self.texts['select_columns_button'],
+                                       command=self.select_columns)
+        select_columns_btn.pack(side=tk.LEFT, padx=5)
+
         # Bind preview control changes
         position_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_preview())
 
@@ -189,7 +196,7 @@ class ExcelEditorApp:
 
         # Add a dropdown to choose output file extension
         self.output_extension = tk.StringVar(value="xlsx")  # Set default value
-        self.output_formats = ["xlsx", "xls", "csv", "json", "html", "md"]
+        self.output_formats = ["xlsx", "xls", "csv", "csv.gz", "csv.zst", "parquet", "json", "jsonl", "html", "md"]
         
         ttk.Label(save_frame, text=self.texts['output_format']).pack(side="right", padx=(5,0))
         self.extension_dropdown = ttk.Combobox(save_frame, textvariable=self.output_extension,
@@ -201,6 +208,12 @@ class ExcelEditorApp:
         self.save_button = ttk.Button(save_frame, text=self.texts['save_changes'], command=self.save_file)
         self.save_button.pack(side="right", padx=5)
 
+        # Checkpoint every chunk so an interrupted save can be continued later
+        self.resumable_save = tk.BooleanVar(value=self.operation_manager.resumable_saves)
+        self.resumable_check = ttk.Checkbutton(save_frame, text=self.texts['resumable_save'],
+                                               variable=self.resumable_save)
+        self.resumable_check.pack(side="right", padx=5)
+
         # --- Status Area (CLI-like) ---
         self.status_frame = ttk.LabelFrame(root, text=self.texts['status_log'])
         self.status_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(5, 10))
@@ -247,6 +260,7 @@ class ExcelEditorApp:
         self.preview_button.config(text=self.texts['operation_preview_button'])
         self.output_preview_button.config(text=self.texts['output_preview_button'])
         self.save_button.config(text=self.texts['save_changes'])
+        self.resumable_check.config(text=self.texts['resumable_save'])
         self.refresh_button.config(text=self.texts['refresh'])
         self.lang_label.config(text=self.texts['language'] + ":")
         
@@ -422,11 +436,13 @@ class ExcelEditorApp:
         path = filedialog.askopenfilename(
             initialdir=self.last_dir,
             title=self.texts['select_excel_file'],
-            filetypes=[(self.texts['excel_files'], "*.xlsx *.xls *.csv")]
+            filetypes=[(self.texts['excel_files'], "*.xlsx *.xls *.csv *.csv.gz *.csv.bz2 *.csv.zst *.parquet")]
         )
         if path:
             self.last_dir = os.path.dirname(path)
             self.save_last_directory()
+            # A new file starts with all of its columns
+            self.operation_manager.projected_columns = None
             self.file_path.set(path)
             self.load_preview()
         else:
@@ -477,6 +493,65 @@ class ExcelEditorApp:
         if self.file_path.get():
             self.load_preview()
 
+    def select_columns(self):
+        """Choose which input columns are loaded, processed and saved."""
+        path = self.file_path.get()
+        if not path:
+            messagebox.showwarning(self.texts['warning'], self.texts['no_file'])
+            return
+        try:
+            all_columns = read_file_columns(path)
+        except Exception as e:
+            messagebox.showerror(self.texts['error'], self.texts['error_loading'].format(error=e))
+            return
+
+        from tkinter import Toplevel, Listbox, MULTIPLE
+
+        dialog = Toplevel(self.root)
+        dialog.title(self.texts['select_columns_title'])
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.geometry("400x400")
+
+        ttk.Label(dialog, text=self.texts['select_columns_prompt']).pack(pady=5)
+
+        listbox = Listbox(dialog, selectmode=MULTIPLE, height=15, exportselection=False)
+        current = self.operation_manager.projected_columns
+        for i, col_name in enumerate(all_columns):
+            listbox.insert(tk.END, col_name)
+            if current is None or col_name in current:
+                listbox.selection_set(i)
+        listbox.pack(pady=5, padx=10, fill=tk.BOTH, expand=True)
+
+        selected = None
+
+        def on_ok():
+            nonlocal selected
+            indices = listbox.curselection()
+            if len(indices) < 1:
+                messagebox.showwarning(self.texts['warning'], self.texts['select_columns_none'])
+                return
+            selected = [all_columns[i] for i in indices]
+            dialog.destroy()
+
+        def on_cancel():
+            dialog.destroy()
+
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(pady=10)
+        ttk.Button(button_frame, text="All", command=lambda: listbox.selection_set(0, tk.END)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="OK", command=on_ok).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side=tk.LEFT, padx=5)
+
+        dialog.wait_window()
+
+        if selected is None:
+            return
+        # Selecting every column is the same as no projection
+        self.operation_manager.projected_columns = None if len(selected) == len(all_columns) else selected
+        self.update_status(self.texts['columns_selected'].format(count=len(selected), total=len(all_columns)))
+        self.load_preview()
+
     def preview_operation(self):
         """Show side-by-side preview: original loaded sample vs current output sample."""
         if self.dataframe is None or self.dataframe.empty:
@@ -1585,7 +1660,7 @@ class ExcelEditorApp:
         # Get the selected extension from the dropdown
         output_ext = self.output_extension.get()
         
-        original_name = os.path.splitext(os.path.basename(self.file_path.get()))[0]
+        original_name = os.path.splitext(split_compression(os.path.basename(self.file_path.get()))[0])[0]
         suggested_name = f"{original_name}_modified.{output_ext}"
 
         save_path = filedialog.asksaveasfilename(
@@ -1598,7 +1673,10 @@ class ExcelEditorApp:
                 ("Excel Files (*.xlsx)", "*.xlsx"),
                 ("Excel 97-2003 (*.xls)", "*.xls"),
                 ("CSV Files (*.csv)", "*.csv"),
+                ("Compressed CSV (*.csv.gz, *.csv.zst, *.csv.bz2)", "*.csv.gz *.csv.zst *.csv.bz2"),
+                ("Parquet Files (*.parquet)", "*.parquet"),
                 ("JSON Files (*.json)", "*.json"),
+                ("JSON Lines Files (*.jsonl)", "*.jsonl"),
                 ("HTML Files (*.html)", "*.html"),
                 ("Markdown Files (*.md)", "*.md")
             ]
@@ -1608,6 +1686,13 @@ class ExcelEditorApp:
             self.update_status(self.texts['save_cancelled'])
             return
 
+        # An interrupted resumable save of this file left a checkpoint behind
+        resume = os.path.exists(checkpoint_path(save_path)) and messagebox.askyesno(
+            self.texts['resume_save_title'],
+            self.texts['resume_save_message']
+        )
+        self.operation_manager.resumable_saves = self.resumable_save.get()
+
         # Create progress dialog
         progress_window = tk.Toplevel(self.root)
         progress_window.title("Saving File")
@@ -1643,7 +1728,8 @@ class ExcelEditorApp:
             try:
                 success = self.operation_manager.save_with_operations(
                     save_path,
-                    progress_callback=update_progress
+                    progress_callback=update_progress,
+                    resume=resume
                 )
                 
                 progress_window.after(0, progress_window.destroy)
@@ -1668,6 +1754,7 @@ class ExcelEditorApp:
 
 # Add the main block to start the application
 if __name__ == "__main__":
+    configure_logging()
     root = tk.Tk()
     app = ExcelEditorApp(root)
     
@@ -0,0 +1,157 @@
+# operations/arrow_csv.py
+import re
+from typing import Dict, List, Optional
+
+from .schema_inference import RAW_TEXT_DTYPE, header_na_values
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+except ImportError:  # pyarrow ships with dask[complete], but keep the pandas engine usable without it
+    pa = None
+    pc = None
+    pa_csv = None
+
+# Smallest and largest Arrow read block; one block must hold at least one full row
+MIN_BLOCK_SIZE = 1 << 20
+MAX_BLOCK_SIZE = 64 << 20
+
+def arrow_available() -> bool:
+    return pa is not None
+
+def block_size_for_chunk(file_size: int, total_rows: int, chunk_size: int) -> int:
+    """Size Arrow read blocks so one block holds roughly one chunk of rows."""
+    bytes_per_row = file_size / max(total_rows, 1)
+    return int(min(MAX_BLOCK_SIZE, max(MIN_BLOCK_SIZE, bytes_per_row * chunk_size)))
+
+def _arrow_column_types(schema: Optional[Dict[str, str]]) -> Dict:
+    """Translate schema dtype strings (see infer_csv_schema) to Arrow types."""
+    arrow_types = {
+        'Int64': pa.int64(),
+        'Float64': pa.float64(),
+        'boolean': pa.bool_(),
+        'string': pa.string(),
+        'string[pyarrow]': pa.string(),
+        RAW_TEXT_DTYPE: pa.string(),
+    }
+    return {col: arrow_types[dtype] for col, dtype in (schema or {}).items() if dtype in arrow_types}
+
+def failed_column(error: Exception, columns) -> Optional[str]:
+    """Return the column named in an Arrow CSV conversion error, if any."""
+    match = re.search(r'In CSV column #(\d+)', str(error))
+    columns = list(columns)
+    if match and int(match.group(1)) < len(columns):
+        return columns[int(match.group(1))]
+    return None
+
+class ArrowCsvChunkReader:
+    """Stream a CSV file with pyarrow's multithreaded parser and yield pandas chunks.
+
+    Arrow record batches are accumulated until ``chunk_size`` rows are
+    available and only then converted to pandas, using the same nullable
+    dtypes as the pandas reader (``Int64``, ``Float64``, ``boolean``, string).
+    Quoted newlines are allowed in values, as with the pandas C engine.
+    Columns typed ``RAW_TEXT_DTYPE`` are kept verbatim; Arrow has no
+    per-column null values, so the other string columns then get their
+    empty and NA-like values turned into nulls after reading, as the
+    pandas reader does. Typed columns read the names of typed columns as
+    null, so repeated header lines don't break their dtypes.
+    """
+    def __init__(self, file_path: str, chunk_size: int, block_size: int,
+                 schema: Optional[Dict[str, str]] = None, arrow_strings: bool = False,
+                 encoding: str = 'utf-8', skip_rows: int = 0, columns: Optional[List[str]] = None):
+        if pa is None:
+            raise ImportError("The 'arrow' CSV engine requires pyarrow to be installed.")
+        self.chunk_size = chunk_size
+        self.arrow_strings = arrow_strings
+        self._row_offset = skip_rows
+        self._pending = None
+        self._exhausted = False
+        self._reader = None
+        self._raw_columns = {col for col, dtype in (schema or {}).items() if dtype == RAW_TEXT_DTYPE}
+        self._open_args = (file_path, block_size, schema, encoding, skip_rows, columns)
+
+    def _open(self):
+        # Opening parses the first block, so it happens on the first read where
+        # conversion errors surface like any other chunk error
+        file_path, block_size, schema, encoding, skip_rows, columns = self._open_args
+        return pa_csv.open_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(
+                use_threads=True,
+                block_size=block_size,
+                encoding=encoding,
+                skip_rows_after_names=skip_rows
+            ),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=_arrow_column_types(schema),
+                include_columns=columns or [],
+                null_values=self._null_values(schema),
+                strings_can_be_null=not self._raw_columns
+            )
+        )
+
+    @staticmethod
+    def _null_values(schema: Optional[Dict[str, str]]) -> List[str]:
+        # Arrow's defaults plus the names of typed columns (header echoes)
+        names = [name for values in header_na_values(schema or {}).values() for name in values]
+        return list(pa_csv.ConvertOptions().null_values) + names
+
+    def _null_strings(self, table):
+        """Turn null markers into nulls in the string columns that are not raw."""
+        nulls = pa.array(pa_csv.ConvertOptions().null_values, type=pa.string())
+        for index, field in enumerate(table.schema):
+            if field.name in self._raw_columns or not pa.types.is_string(field.type):
+                continue
+            column = table.column(index)
+            table = table.set_column(index, field, pc.if_else(pc.is_in(column, value_set=nulls),
+                                                              pa.scalar(None, pa.string()), column))
+        return table
+
+    def _types_mapper(self, arrow_type):
+        if pa.types.is_integer(arrow_type):
+            return pd.Int64Dtype()
+        if pa.types.is_floating(arrow_type):
+            return pd.Float64Dtype()
+        if pa.types.is_boolean(arrow_type):
+            return pd.BooleanDtype()
+        if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+            return pd.StringDtype('pyarrow' if self.arrow_strings else 'python')
+        return None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> pd.DataFrame:
+        if self._reader is None:
+            self._reader = self._open()
+        batches = [self._pending] if self._pending is not None else []
+        rows = self._pending.num_rows if self._pending is not None else 0
+        self._pending = None
+        while rows < self.chunk_size and not self._exhausted:
+            try:
+                batch = self._reader.read_next_batch()
+            except StopIteration:
+                self._exhausted = True
+                break
+            batches.append(batch)
+            rows += batch.num_rows
+        if rows == 0:
+            raise StopIteration
+
+        table = pa.Table.from_batches(batches)
+        if table.num_rows > self.chunk_size:
+            self._pending = table.slice(self.chunk_size).combine_chunks().to_batches()[0]
+            table = table.slice(0, self.chunk_size)
+
+        if self._raw_columns:
+            table = self._null_strings(table)
+        chunk_df = table.to_pandas(types_mapper=self._types_mapper)
+        # Continue the row numbering across chunks like the pandas reader does
+        chunk_df.index = pd.RangeIndex(self._row_offset, self._row_offset + len(chunk_df))
+        self._row_offset += len(chunk_df)
+        return chunk_df
@@ -0,0 +1,47 @@
+# operations/checkpoint.py
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+# Bump when the checkpoint layout changes; older checkpoints are then ignored
+CHECKPOINT_VERSION = 1
+
+def checkpoint_path(output_path: str) -> str:
+    """Checkpoint file of a resumable save, kept next to its (first) output."""
+    return f"{output_path}.checkpoint.json"
+
+def parts_dir(output_path: str) -> str:
+    """Directory holding the committed parts of a resumable Parquet or Excel output."""
+    return f"{output_path}.parts"
+
+def input_fingerprint(file_path: str) -> Dict[str, Any]:
+    """Identify the input file by path, size and modification time."""
+    stat = os.stat(file_path)
+    return {'path': os.path.abspath(file_path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def operations_digest(operations: List[Dict[str, Any]]) -> str:
+    """Stable hash of an operation list."""
+    text = json.dumps(operations, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def write_checkpoint(path: str, state: Dict[str, Any]):
+    """Write the checkpoint atomically, so a crash leaves the previous one intact."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(state, version=CHECKPOINT_VERSION), f)
+    os.replace(temp_path, path)
+
+def read_checkpoint(path: str) -> Optional[Dict[str, Any]]:
+    """Return the checkpoint at ``path``, or None if there is no usable one."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if state.get('version') == CHECKPOINT_VERSION else None
+
+def remove_checkpoint(path: str):
+    for stale in (path, f"{path}.tmp"):
+        if os.path.exists(stale):
+            os.remove(stale)
@@ -0,0 +1,139 @@
+# operations/compression.py
+import bz2
+import gzip
+import io
+import os
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Optional
+
+from .tracing import span
+
+try:
+    import zstandard
+except ImportError:  # only .zst files need it
+    zstandard = None
+
+# Compressed file suffix -> codec name
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.zst': 'zstd',
+}
+
+# Uncompressed bytes handed to one compression task
+DEFAULT_BLOCK_SIZE = 4 << 20
+
+def split_compression(file_path: str):
+    """Split ``data.csv.gz`` into (``data.csv``, ``'gzip'``); uncompressed paths get ``None``."""
+    base, ext = os.path.splitext(file_path)
+    codec = COMPRESSION_EXTENSIONS.get(ext.lower())
+    if codec is None:
+        return file_path, None
+    return base, codec
+
+def get_compression(file_path: str) -> Optional[str]:
+    """Return the codec implied by the file suffix, or None."""
+    return split_compression(file_path)[1]
+
+def _require_codec(codec: str):
+    if codec == 'zstd' and zstandard is None:
+        raise ImportError("Reading or writing .zst files requires the zstandard package to be installed.")
+
+def open_input(file_path: str) -> BinaryIO:
+    """Open a file for binary reading, decompressing on the fly when needed."""
+    codec = get_compression(file_path)
+    if codec == 'gzip':
+        return gzip.open(file_path, 'rb')
+    if codec == 'bz2':
+        return bz2.open(file_path, 'rb')
+    if codec == 'zstd':
+        _require_codec(codec)
+        # The zstandard reader has no line iteration of its own
+        return io.BufferedReader(zstandard.open(file_path, 'rb'))
+    return open(file_path, 'rb')
+
+def count_data_rows(file_path: str) -> int:
+    """Count lines after the header, streaming through compressed files."""
+    with open_input(file_path) as f:
+        return sum(1 for _ in f) - 1
+
+def compress_block(data: bytes, codec: str, level: int) -> bytes:
+    """Compress one block as a complete gzip member, bz2 stream or zstd frame.
+
+    Each format allows members to be concatenated, so the blocks written one
+    after another form a single valid file for any standard decompressor.
+    """
+    if codec == 'gzip':
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+    if codec == 'bz2':
+        return bz2.compress(data, max(1, min(level, 9)))
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    raise ValueError(f"Unsupported compression: {codec}")
+
+class ParallelCompressedWriter:
+    """Binary file writer that compresses independent blocks on a thread pool.
+
+    Written bytes are cut into ``block_size`` blocks; each block is
+    compressed on its own by a worker (zlib, bz2 and zstandard release the
+    GIL while compressing) and written to disk in order. At most two blocks
+    per worker are in flight, which bounds memory use. With ``append`` the
+    blocks are added to the end of an existing file.
+    """
+    def __init__(self, output_path: str, codec: str, level: int = 6,
+                 workers: Optional[int] = None, block_size: int = DEFAULT_BLOCK_SIZE,
+                 append: bool = False):
+        if codec not in COMPRESSION_EXTENSIONS.values():
+            raise ValueError(f"Unsupported compression: {codec}")
+        _require_codec(codec)
+        self.codec = codec
+        self.level = level
+        self.block_size = block_size
+        self.workers = workers or os.cpu_count() or 1
+        self._file = open(output_path, 'ab' if append else 'wb')
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._pending = deque()
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[:self.block_size]))
+            del self._buffer[:self.block_size]
+        return len(data)
+
+    def _compress(self, block: bytes) -> bytes:
+        with span(f'compress {self.codec}', 'compression', bytes=len(block)):
+            return compress_block(block, self.codec, self.level)
+
+    def _submit(self, block: bytes):
+        self._pending.append(self._executor.submit(self._compress, block))
+        while len(self._pending) > 2 * self.workers:
+            self._file.write(self._pending.popleft().result())
+
+    def flush(self):
+        """Compress the buffered bytes as a block of their own and write out every pending block."""
+        with span('flush compressed blocks', 'compression'):
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._file.write(self._pending.popleft().result())
+            self._file.flush()
+
+    def tell(self) -> int:
+        """Compressed bytes written so far; exact after ``flush``."""
+        return self._file.tell()
+
+    def close(self):
+        if self._file is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._file.close()
+            self._file = None
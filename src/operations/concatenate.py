@@ -1,20 +1,19 @@
 # operations/concatenate.py
 import pandas as pd
 
-def _safe_str(val):
-    # Prevent float->int conversion like 123.0 -> '123'
-    if isinstance(val, float) and val.is_integer():
-        return str(int(val))
-    return str(val)
-
 def apply_concatenate(dataframe, cols_to_concat, new_col_name, separator, texts):
     """Concatenates multiple columns into a new one."""
+    if not cols_to_concat:
+        return dataframe, ('error', texts['no_columns_selected'])
     missing_cols = [col for col in cols_to_concat if col not in dataframe.columns]
     if missing_cols:
         return dataframe, ('error', texts['column_not_found'].format(col=", ".join(missing_cols)))
 
     new_df = dataframe.copy()
-    # Use _safe_str for each value to avoid .0 for integers
-    new_df[new_col_name] = new_df[cols_to_concat].apply(lambda row: separator.join(_safe_str(val) for val in row), axis=1)
+    # Integer columns keep an integer dtype (fixed schema), so plain str() is enough;
+    # astype(str) renders every value like str(val), for object and Arrow columns alike
+    parts = new_df[cols_to_concat].astype(str)
+    new_df[new_col_name] = parts.iloc[:, 0].str.cat([parts.iloc[:, i] for i in range(1, parts.shape[1])],
+                                                     sep=separator)
 
     return new_df, ('success', texts['concatenate_success'].format(new_col=new_col_name, count=len(cols_to_concat)))
@@ -0,0 +1,178 @@
+# operations/csv_sink.py
+import os
+import threading
+import time
+from queue import Queue
+from typing import Optional
+
+import pandas as pd
+
+from .compression import ParallelCompressedWriter, split_compression
+from .tracing import span
+
+# Write buffer of the output file handle
+DEFAULT_BUFFER_SIZE = 8 << 20
+
+# Formatted chunks waiting for the writer thread; bounds memory use
+MAX_QUEUED_CHUNKS = 2
+
+class TextChunkWriter:
+    """Write processed chunks to one text file through a single open handle.
+
+    Chunks are formatted and written by a background thread, so the caller
+    can read and process the next chunk meanwhile. The file is opened once
+    with a large write buffer; ``.gz``/``.bz2``/``.zst`` paths are
+    compressed with ``ParallelCompressedWriter``. With ``atomic`` the data
+    goes to a temporary file next to ``output_path`` that replaces it only
+    when ``close`` commits, so a failed or cancelled save never leaves a
+    truncated output behind.
+
+    Subclasses render one chunk in ``_format_chunk`` and may add text
+    before the first and after the last chunk (``_prefix``/``_suffix``).
+    When no chunk was written at all, ``close`` formats an empty chunk
+    with ``header_columns`` (if set), so the file still gets its header.
+
+    ``checkpoint`` waits for the queued chunks and returns the state a
+    resumed save needs; ``resume_state`` cuts the partial file back to that
+    point and continues appending to it.
+    """
+    format_name = 'text'
+    # Attributes restored from a checkpoint
+    _state_attributes = ('_first', 'rows_written', 'bytes_written', '_busy', '_chunks_written')
+
+    def __init__(self, output_path: str, atomic: bool = True, compression_level: int = 6,
+                 compression_workers: Optional[int] = None, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 encoding: str = 'utf-8', resume_state: Optional[dict] = None):
+        self.output_path = output_path
+        self.encoding = encoding
+        self.bytes_written = 0
+        self.rows_written = 0
+        self._path = f"{output_path}.part" if atomic else output_path
+        self._first = True
+        self._busy = 0.0
+        self._chunks_written = 0
+        # Columns of the header written by close when no chunk arrived
+        self.header_columns = None
+        if resume_state is not None:
+            # Drop whatever was written after the checkpoint
+            os.truncate(self._path, resume_state['file_size'])
+            for name in self._state_attributes:
+                setattr(self, name, resume_state[name])
+        codec = split_compression(output_path)[1]
+        if codec is not None:
+            self._file = ParallelCompressedWriter(self._path, codec, compression_level, compression_workers,
+                                                  append=resume_state is not None)
+        else:
+            self._file = open(self._path, 'ab' if resume_state is not None else 'wb', buffering=buffer_size)
+        self._queue = Queue(maxsize=MAX_QUEUED_CHUNKS)
+        self._error = None
+        if resume_state is None:
+            self._write_text(self._prefix())
+        self._thread = threading.Thread(target=self._run, name=f'{self.format_name}-sink', daemon=True)
+        self._thread.start()
+
+    def _prefix(self) -> str:
+        return ''
+
+    def _suffix(self) -> str:
+        return ''
+
+    def _format_chunk(self, chunk: pd.DataFrame, first: bool) -> str:
+        """Render one chunk; ``first`` is True until a chunk with rows has been written."""
+        raise NotImplementedError
+
+    def _write_text(self, text: str):
+        if text:
+            data = text.encode(self.encoding)
+            self._file.write(data)
+            self.bytes_written += len(data)
+
+    def _run(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                self._queue.task_done()
+                return
+            if self._error is None:
+                started = time.perf_counter()
+                try:
+                    with span(f'format {self.format_name}', 'sink', rows=len(chunk)):
+                        text = self._format_chunk(chunk, self._first)
+                    with span(f'write {self.format_name}', 'sink'):
+                        self._write_text(text)
+                    if len(chunk):
+                        self._first = False
+                    self.rows_written += len(chunk)
+                    self._chunks_written += 1
+                except Exception as e:
+                    self._error = e
+                self._busy += time.perf_counter() - started
+            self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def write(self, chunk: pd.DataFrame):
+        """Queue a chunk for writing; blocks while the writer is behind."""
+        self._raise_error()
+        self._queue.put(chunk)
+
+    def checkpoint(self) -> dict:
+        """Wait for the queued chunks, flush them to disk and return the state to resume from."""
+        self._queue.join()
+        self._raise_error()
+        self._file.flush()
+        state = {name: getattr(self, name) for name in self._state_attributes}
+        state['file_size'] = self._file.tell()
+        return state
+
+    def suspend(self):
+        """Stop writing and close the file, keeping the partial output for a resumed save."""
+        if self._file is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            self._file.close()
+        finally:
+            self._file = None
+
+    def close(self, commit: bool = True):
+        """Flush and close the file. Without ``commit`` the temporary file is removed."""
+        if self._file is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            if commit and self._error is None:
+                if not self._chunks_written and self.header_columns is not None:
+                    self._write_text(self._format_chunk(pd.DataFrame(columns=self.header_columns), True))
+                self._write_text(self._suffix())
+            self._file.close()
+        finally:
+            self._file = None
+        if self._error is not None:
+            commit = False
+        if self._path != self.output_path:
+            if commit:
+                os.replace(self._path, self.output_path)
+            elif os.path.exists(self._path):
+                os.remove(self._path)
+        self._raise_error()
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Output bytes (before compression) formatted and written per second of writer time."""
+        return self.bytes_written / self._busy if self._busy > 0 else 0.0
+
+class CsvChunkWriter(TextChunkWriter):
+    """CSV sink; the header row is written with the first chunk, even an empty one."""
+    format_name = 'csv'
+    _header_written = False
+    _state_attributes = TextChunkWriter._state_attributes + ('_header_written',)
+
+    def _format_chunk(self, chunk: pd.DataFrame, first: bool) -> str:
+        text = chunk.to_csv(header=not self._header_written, index=False)
+        self._header_written = True
+        return text
@@ -1,17 +1,85 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Sequence, Union
 import threading
 from queue import Queue
 import time
 import os
 import gc
+import json
+import logging
 import psutil
 from functools import lru_cache
 import openpyxl
 from concurrent.futures import ThreadPoolExecutor
 import math
-from .preview_utils import apply_operation_to_partition
+import shutil
+import tempfile
+from contextlib import ExitStack, nullcontext
+from .preview_utils import apply_operation_to_partition, detect_header_rows
+from pandas._libs.parsers import STR_NA_VALUES
+from .schema_inference import (header_na_values, infer_csv_schema, is_id_like, parse_raw_text, relax_schema,
+                               RAW_TEXT_DTYPE, TYPED_DTYPES)
+from .arrow_csv import ArrowCsvChunkReader, block_size_for_chunk, failed_column
+from .parquet_io import ParquetChunkReader, ParquetChunkWriter, parquet_columns, parquet_row_count, read_parquet_rows
+from .checkpoint import (
+    checkpoint_path, input_fingerprint, operations_digest, parts_dir, read_checkpoint, remove_checkpoint,
+    write_checkpoint
+)
+from .compression import count_data_rows, split_compression
+from .csv_sink import CsvChunkWriter, TextChunkWriter
+from .fanout import FanOutWriter, ThreadedSink
+from .result_cache import DEFAULT_CACHE_BYTES, ResultCache, prefix_keys
+from .run_metrics import RunMetrics, report_path
+from .tracing import span, start_tracing, stop_tracing, trace_path
+from .profiling import PROFILE_VARIABLE, make_profiler, profile_dir, profile_settings, write_profiles
+from .text_sinks import (
+    HtmlChunkWriter, JsonChunkWriter, JsonLinesChunkWriter, MarkdownChunkWriter, column_masks
+)
+from .xlsx_writer import XlsxChunkWriter, workbook_part_path
+
+logger = logging.getLogger(__name__)
+
+# Parsers ChunkIterator can use for CSV input
+CSV_ENGINES = ('pandas', 'arrow')
+
+# Output suffix (after any compression suffix) -> streaming text sink
+TEXT_SINKS = {
+    '.csv': CsvChunkWriter,
+    '.json': JsonChunkWriter,
+    '.jsonl': JsonLinesChunkWriter,
+    '.html': HtmlChunkWriter,
+    '.md': MarkdownChunkWriter,
+}
+
+def get_file_type(file_path: str) -> str:
+    """Determine file type from extension.
+
+    CSV files may carry a compression suffix (``.csv.gz``, ``.csv.bz2``,
+    ``.csv.zst``); they are decompressed while streaming.
+    """
+    base, codec = split_compression(file_path)
+    ext = os.path.splitext(base)[1].lower()
+    if ext == '.csv':
+        return 'csv'
+    elif codec is not None:
+        raise ValueError(f"Unsupported compressed file type: {ext}{os.path.splitext(file_path)[1]}")
+    elif ext in ['.xls', '.xlsx']:
+        return 'excel'
+    elif ext == '.parquet':
+        return 'parquet'
+    else:
+        raise ValueError(f"Unsupported file type: {ext}")
+
+def sheet_row_count(sheet) -> int:
+    """Rows of a read-only worksheet, excluding the header.
+
+    Sheets written by streaming writers (XlsxChunkWriter among them) carry
+    no dimension record, so their rows are counted by scanning the sheet.
+    """
+    if sheet.max_row is None:
+        sheet.calculate_dimension(force=True)
+    return max(sheet.max_row - 1, 0)
 
 def calculate_optimal_chunk_size(file_size: int) -> int:
     """Calculate optimal chunk size based on file size and available memory."""
@@ -19,63 +87,270 @@ def calculate_optimal_chunk_size(file_size: int) -> int:
     base_chunk_size = min(1000000, max(1000, file_size // 100))
     return min(base_chunk_size, available_memory // 10)  # Use at most 10% of available memory
 
+def to_native_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Store numbers and dates in native nullable dtypes instead of Python objects.
+
+    Excel rows arrive as Python objects; converting them here gives xlsx and
+    CSV inputs the same column types. Floats are kept at 64-bit precision so
+    values survive the round trip unchanged.
+    """
+    return df.convert_dtypes(dtype_backend='numpy_nullable')
+
+def to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Store text columns as ``string[pyarrow]`` instead of Python ``str`` objects.
+
+    Object columns are only converted when every non-missing value is a
+    string, so mixed columns keep their original values.
+    """
+    for col in df.columns:
+        column = df[col]
+        if isinstance(column.dtype, pd.StringDtype):
+            if column.dtype.storage != 'pyarrow':
+                df[col] = column.astype('string[pyarrow]')
+        elif pd.api.types.is_object_dtype(column) and pd.api.types.infer_dtype(column, skipna=True) == 'string':
+            df[col] = column.astype('string[pyarrow]')
+    return df
+
+# Operation parameters that name input columns
+_OPERATION_COLUMN_KEYS = ('column', 'col1_name', 'col2_name')
+_OPERATION_COLUMN_LIST_KEYS = ('cols_to_concat', 'selected_columns')
+
+def operation_columns(operations: List[Dict[str, Any]]) -> List[str]:
+    """Return every column name the operations read, in first-use order."""
+    columns = []
+    for op in operations:
+        names = [op.get(key) for key in _OPERATION_COLUMN_KEYS]
+        for key in _OPERATION_COLUMN_LIST_KEYS:
+            names.extend(op.get(key) or [])
+        for name in names:
+            if name and name not in columns:
+                columns.append(name)
+    return columns
+
+class OperationError(Exception):
+    """An operation failed on a chunk; ``column`` is the column it was applied to."""
+    def __init__(self, message: str, column: Optional[str] = None):
+        super().__init__(message)
+        self.column = column
+
+def validation_reason(op: Dict[str, Any]) -> Optional[str]:
+    """Reject reason for the cells a validating operation marks invalid, None for other operations."""
+    key = op.get('key', '')
+    if key.startswith('op_validate_'):
+        return f"invalid {key[len('op_validate_'):]}"
+    if key == 'op_mask_email':
+        return 'invalid email'
+    return None
+
+def select_rows(df: pd.DataFrame, keep: np.ndarray) -> pd.DataFrame:
+    """Boolean row selection that carries the per-column highlight masks along."""
+    result = df[keep]
+    for attr in ('_styled_columns', '_modified_columns'):
+        masks = getattr(df, attr, None)
+        if masks:
+            object.__setattr__(result, attr, {
+                col: np.asarray(mask)[keep] for col, mask in masks.items() if len(mask) == len(keep)
+            })
+    return result
+
+def read_file_columns(file_path: str) -> List[str]:
+    """Read only the header row of a supported file."""
+    file_type = get_file_type(file_path)
+    if file_type == 'csv':
+        return list(pd.read_csv(file_path, nrows=0).columns)
+    if file_type == 'parquet':
+        return parquet_columns(file_path)
+    wb = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        header = next(wb.active.iter_rows(min_row=1, max_row=1, values_only=True), ())
+    finally:
+        wb.close()
+    return list(header)
+
 class ChunkIterator:
-    """Memory-efficient iterator for processing file chunks."""
-    def __init__(self, file_path: str, chunk_size: int):
+    """Memory-efficient iterator for processing file chunks.
+
+    For CSV files ``schema`` (see ``infer_csv_schema``) is passed as ``dtype=``
+    to every chunk so all chunks share the same column types. With
+    ``arrow_strings`` text columns are produced as ``string[pyarrow]``.
+    ``engine`` selects the CSV parser: ``'pandas'`` (C engine, one thread)
+    or ``'arrow'`` (pyarrow streaming reader, multithreaded). ``columns``
+    limits every reader to those columns; the others are never parsed.
+    ``raw_columns`` are read from CSV as the exact text of each field, with
+    no type or NA inference, so they can be written back unchanged.
+    Iteration begins at data row ``start_row`` (resumed saves).
+    """
+    def __init__(self, file_path: str, chunk_size: int, schema: Optional[Dict[str, str]] = None,
+                 arrow_strings: bool = False, engine: str = 'pandas', encoding: str = 'utf-8',
+                 columns: Optional[List[str]] = None, raw_columns: Optional[List[str]] = None,
+                 start_row: int = 0):
+        if engine not in CSV_ENGINES:
+            raise ValueError(f"Unknown CSV engine: {engine}")
         self.file_path = file_path
+        self.file_type = get_file_type(file_path)
+        self.columns = columns
         self.chunk_size = chunk_size
+        self.start_row = start_row
+        self.arrow_strings = arrow_strings
+        self.engine = engine
+        self.encoding = encoding
+        if schema is not None and arrow_strings:
+            schema = {col: 'string[pyarrow]' if dtype == 'string' else dtype for col, dtype in schema.items()}
+        self.raw_columns = list(raw_columns or [])
+        if self.raw_columns:
+            schema = dict(schema or {})
+            schema.update({col: RAW_TEXT_DTYPE for col in self.raw_columns})
+        self.schema = schema
         self.total_rows = 0
         self._count_rows()
         self._iterator = None
     
     def _count_rows(self):
         """Count total rows efficiently."""
-        if self.file_path.lower().endswith('.csv'):
-            with open(self.file_path, 'rb') as f:
-                self.total_rows = sum(1 for _ in f) - 1
+        if self.file_type == 'csv':
+            self.total_rows = count_data_rows(self.file_path)
+        elif self.file_type == 'parquet':
+            self.total_rows = parquet_row_count(self.file_path)
         else:
-            with openpyxl.load_workbook(self.file_path, read_only=True) as wb:
-                self.total_rows = wb.active.max_row - 1
+            wb = openpyxl.load_workbook(self.file_path, read_only=True)
+            self.total_rows = sheet_row_count(wb.active)
+            wb.close()
 
-    def __iter__(self):
-        """Initialize and return the iterator."""
-        if self.file_path.lower().endswith('.csv'):
-            self._iterator = pd.read_csv(
+    def _na_options(self) -> Dict[str, Any]:
+        """NA handling that leaves raw columns verbatim and parses the rest as usual.
+
+        Typed columns also read their own name as missing, so repeated
+        header lines keep their text only in the text columns.
+        """
+        header_values = header_na_values(self.schema or {})
+        if not self.raw_columns:
+            return {'na_values': header_values} if header_values else {}
+        return {
+            'keep_default_na': False,
+            'na_values': {col: list(STR_NA_VALUES) + header_values.get(col, [])
+                          for col in self.schema if col not in self.raw_columns},
+        }
+
+    def _open_csv_reader(self, skip_rows: int = 0):
+        """Open the chunked CSV reader, optionally skipping already-read data rows."""
+        if self.engine == 'arrow':
+            block_size = block_size_for_chunk(os.path.getsize(self.file_path), self.total_rows, self.chunk_size)
+            return ArrowCsvChunkReader(
+                self.file_path,
+                self.chunk_size,
+                block_size,
+                schema=self.schema,
+                arrow_strings=self.arrow_strings,
+                encoding=self.encoding,
+                skip_rows=skip_rows,
+                columns=self.columns
+            )
+        return pd.read_csv(
+            self.file_path,
+            chunksize=self.chunk_size,
+            skiprows=range(1, skip_rows + 1) if skip_rows else None,
+            usecols=self.columns,
+            dtype=self.schema,
+            encoding=self.encoding,
+            low_memory=False,
+            dtype_backend='numpy_nullable',
+            engine='c',
+            **self._na_options()
+        )
+
+    def _next_csv_chunk(self) -> pd.DataFrame:
+        """Read the next CSV chunk, relaxing the schema if the chunk doesn't fit it."""
+        try:
+            chunk_df = next(self._reader)
+        except (ValueError, TypeError, OverflowError) as e:
+            if self.schema is None:
+                raise
+            # A value outside the sampled rows broke the inferred dtypes:
+            # demote the offending columns and re-read from this chunk on
+            raw_chunk = pd.read_csv(
                 self.file_path,
-                chunksize=self.chunk_size,
-                low_memory=False,
-                dtype_backend='numpy_nullable',
-                engine='c'
+                skiprows=range(1, self._rows_read + 1) if self._rows_read else None,
+                nrows=self.chunk_size,
+                usecols=self.columns,
+                dtype=str,
+                encoding=self.encoding
             )
+            relaxed = relax_schema(self.schema, raw_chunk)
+            if relaxed == self.schema:
+                # Arrow parses whole blocks, so the bad value may lie past this
+                # chunk; its error message names the column
+                column = failed_column(e, self.schema) if self.engine == 'arrow' else None
+                if column is not None:
+                    relaxed[column] = 'string'
+                else:
+                    relaxed = {col: 'string' if dtype in TYPED_DTYPES else dtype
+                               for col, dtype in self.schema.items()}
+                if relaxed == self.schema:
+                    raise
+            self.schema = relaxed
+            self._reader = self._open_csv_reader(self._rows_read)
+            return self._next_csv_chunk()
+        chunk_df.index = pd.RangeIndex(self._rows_read, self._rows_read + len(chunk_df))
+        self._rows_read += len(chunk_df)
+        return chunk_df
+
+    def __iter__(self):
+        """Initialize and return the iterator."""
+        if self.file_type == 'csv':
+            self._rows_read = self.start_row
+            self._reader = self._open_csv_reader(self.start_row)
+        elif self.file_type == 'parquet':
+            self._reader = ParquetChunkReader(self.file_path, self.chunk_size, self.columns, self.arrow_strings,
+                                              start=self.start_row)
         else:
             wb = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
             sheet = wb.active
             self.headers = [cell.value for cell in sheet[1]]
+            self._pick_columns = None
+            if self.columns is not None:
+                # openpyxl parses whole rows; keep only the projected cells
+                indices = [i for i, name in enumerate(self.headers) if name in self.columns]
+                self.headers = [self.headers[i] for i in indices]
+                self._pick_columns = lambda row: tuple(row[i] if i < len(row) else None for i in indices)
             self.current_chunk = []
-            self.row_generator = sheet.iter_rows(min_row=2, values_only=True)
-            self._iterator = self
+            self.row_generator = sheet.iter_rows(min_row=2 + self.start_row, values_only=True)
+        self.header_mask = None
+        self._iterator = self
             
         return self._iterator
 
     def __next__(self):
-        """Return the next chunk of data."""
-        if self.file_path.lower().endswith('.csv'):
-            # For CSV files, delegate to pandas iterator
-            return next(self._iterator)
+        """Return the next chunk of data.
+
+        After each call ``header_mask`` holds the repeated-header row mask of
+        the returned chunk, so operations don't have to detect it themselves.
+        """
+        if self.file_type == 'csv':
+            # For CSV files, delegate to the pandas or Arrow reader
+            chunk_df = self._next_csv_chunk()
+        elif self.file_type == 'parquet':
+            # Parquet is read one row group at a time
+            chunk_df = next(self._reader)
         else:
             # For Excel files, handle chunking manually
             try:
                 while len(self.current_chunk) < self.chunk_size:
                     row = next(self.row_generator)
+                    if self._pick_columns is not None:
+                        row = self._pick_columns(row)
                     self.current_chunk.append(row)
             except StopIteration:
                 if not self.current_chunk:
                     raise StopIteration
             
             # Create DataFrame from accumulated rows
-            chunk_df = pd.DataFrame(self.current_chunk, columns=self.headers)
+            chunk_df = to_native_dtypes(pd.DataFrame(self.current_chunk, columns=self.headers))
             self.current_chunk = []  # Clear for next iteration
-            return chunk_df
+
+        if self.arrow_strings:
+            chunk_df = to_arrow_strings(chunk_df)
+        self.header_mask = detect_header_rows(chunk_df)
+        return chunk_df
 
 class DelayedOperationManager:
     def __init__(self):
@@ -85,16 +360,157 @@ class DelayedOperationManager:
         self._cancel_flag = False
         self._progress_queue = Queue()
         self.input_file_type = None
+        # CSV schema inference: keep ID-like columns (see is_id_like) as text
+        self.ids_as_text = False
+        # Opt-in: keep text columns as string[pyarrow] (less memory, Arrow string kernels)
+        self.arrow_strings = False
+        # CSV parser for saves, one of CSV_ENGINES
+        self.csv_engine = 'pandas'
+        # Codec for Parquet output, one of PARQUET_COMPRESSIONS
+        self.parquet_compression = 'snappy'
+        # Input columns to load, process and save; None keeps every column
+        self.projected_columns = None
+        # CSV input: carry columns no operation reads through to CSV outputs as
+        # raw text (other targets of the same save get them parsed as usual)
+        self.raw_passthrough = True
+        # Output compression (.csv.gz/.csv.bz2/.csv.zst and the xlsx container):
+        # codec level and compression threads (None = all cores)
+        self.compression_level = 6
+        self.compression_workers = None
+        # Rows per chunk for saves (None sizes chunks from the file size, see
+        # calculate_optimal_chunk_size)
+        self.chunk_size = None
+        # Columns written to xlsx as text cells instead of numbers or dates
+        self.text_columns = []
+        # Long runs of highlighted xlsx cells become conditional-format ranges
+        self.highlight_ranges = True
+        # Past Excel's row limit start a new workbook file instead of a new sheet
+        self.split_workbooks = False
+        # Write CSV output to a temporary file and rename it into place when complete
+        self.atomic_save = True
+        # Route rows failing a validation or an operation to this file instead of
+        # the output (any save format; None keeps them in the output)
+        self.rejects_path = None
+        # Checkpoint after every chunk so an interrupted save can continue
+        # (save_with_operations(..., resume=True)); costs the overlap of
+        # processing and writing
+        self.resumable_saves = False
+        # Opt-in: keep processed chunks per operation prefix in this directory
+        # (e.g. result_cache.DEFAULT_CACHE_DIR), so a re-save after adding operations runs
+        # only the new ones; None disables the cache
+        self.result_cache_dir = None
+        self.result_cache_max_bytes = DEFAULT_CACHE_BYTES
+        # Write a JSON run report (timings, rows, changed cells, memory per
+        # stage and operation) next to the first output after every save
+        self.write_run_report = True
+        # Count the cells each operation changes for the report (a column
+        # comparison per operation and chunk)
+        self.count_changed_cells = True
+        # Record a timeline of every save to <output>.trace.json (Chrome
+        # trace events; open it in chrome://tracing or Perfetto)
+        self.trace_saves = False
+        # Profile every operation ("operation") or whole chunks ("chunk") during
+        # saves, with cProfile ("deterministic") or stack sampling ("sampling");
+        # the .pstats files and hotspots.txt go to <output>.profile
+        try:
+            self.profile_scope, self.profile_mode = profile_settings(os.environ.get(PROFILE_VARIABLE))
+        except ValueError as e:
+            logger.warning("%s; profiling is off", e)
+            self.profile_scope, self.profile_mode = None, 'deterministic'
+        self._profiler = None
+        self.last_run_report = None
+        self._metrics = None
+        self._schema_cache = {}
 
     def _get_file_type(self, file_path: str) -> str:
         """Determine file type from extension."""
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext == '.csv':
-            return 'csv'
-        elif ext in ['.xls', '.xlsx']:
-            return 'excel'
-        else:
-            raise ValueError(f"Unsupported file type: {ext}")
+        return get_file_type(file_path)
+
+    def _load_columns(self, file_path: str) -> Optional[List[str]]:
+        """Columns to parse: the projection plus every input column an operation reads."""
+        if self.projected_columns is None:
+            return None
+        needed = set(self.projected_columns) | set(operation_columns(self.operations))
+        return [col for col in read_file_columns(file_path) if col in needed]
+
+    def _passthrough_columns(self, output_paths: List[str], load_columns: Optional[List[str]]) -> List[str]:
+        """Input columns that can be copied verbatim from a CSV input to CSV outputs.
+
+        The columns are read as raw text whenever any target is CSV; the
+        other targets get them parsed (see ``_parse_raw_columns``), so every
+        output is the same as when it is saved on its own.
+        """
+        if not self.raw_passthrough:
+            return []
+        if self._get_file_type(self.full_file_path) != 'csv' or not any(map(self._is_csv_output, output_paths)):
+            return []
+        touched = set(operation_columns(self.operations))
+        columns = load_columns if load_columns is not None else read_file_columns(self.full_file_path)
+        return [col for col in columns if col not in touched]
+
+    def _raw_column_dtypes(self, raw_columns: List[str]) -> Dict[str, str]:
+        """Dtypes the raw passthrough columns would have been read with."""
+        schema = self.get_csv_schema(self.full_file_path)
+        dtypes = {}
+        for col in raw_columns:
+            dtype = schema.get(col, 'string')
+            dtypes[col] = 'string[pyarrow]' if dtype == 'string' and self.arrow_strings else dtype
+        return dtypes
+
+    @staticmethod
+    def _parse_raw_columns(chunk: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+        """Copy of ``chunk`` with its raw passthrough columns parsed, for targets other than CSV.
+
+        A column whose values don't fit its dtype is demoted to text in
+        ``dtypes`` from then on, as the CSV reader relaxes its schema.
+        """
+        parsed = chunk.copy(deep=False)
+        for col, dtype in dtypes.items():
+            if col not in parsed.columns:
+                continue
+            try:
+                parsed[col] = parse_raw_text(chunk[col], dtype, col)
+            except (ValueError, TypeError, OverflowError):
+                dtypes[col] = 'string[pyarrow]' if dtype == 'string[pyarrow]' else 'string'
+                parsed[col] = parse_raw_text(chunk[col], dtypes[col], col)
+        for attr in ('_styled_columns', '_modified_columns'):
+            if hasattr(chunk, attr):
+                object.__setattr__(parsed, attr, getattr(chunk, attr))
+        return parsed
+
+    def _is_csv_output(self, output_path: str) -> bool:
+        """True for ``.csv`` outputs, compressed or not."""
+        return self._text_sink(output_path) is CsvChunkWriter
+
+    def _text_sink(self, output_path: str):
+        """Streaming text sink class for the output suffix, or None for Parquet and Excel."""
+        base = split_compression(output_path)[0]
+        return TEXT_SINKS.get(os.path.splitext(base)[1].lower())
+
+    def _xlsx_text_columns(self) -> List[str]:
+        """Columns the user asked to keep as text, plus ID-like names when ``ids_as_text`` is set."""
+        columns = list(self.text_columns)
+        if self.ids_as_text:
+            columns.extend(col for col in read_file_columns(self.full_file_path) if is_id_like(col))
+        return columns
+
+    def get_csv_schema(self, file_path: str) -> Dict[str, str]:
+        """Infer the CSV schema once per file and reuse it for preview and save."""
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, self.ids_as_text)
+        if key not in self._schema_cache:
+            self._schema_cache[key] = infer_csv_schema(file_path, ids_as_text=self.ids_as_text)
+        return self._schema_cache[key]
+
+    def _read_csv_sample(self, file_path: str, schema: Dict[str, str], columns: Optional[List[str]],
+                         **kwargs) -> pd.DataFrame:
+        """Read part of a CSV with the inferred schema, falling back to pandas inference."""
+        kwargs['usecols'] = columns
+        try:
+            return pd.read_csv(file_path, dtype=schema, na_values=header_na_values(schema) or None,
+                               low_memory=False, dtype_backend='numpy_nullable', **kwargs)
+        except (ValueError, TypeError, OverflowError):
+            return pd.read_csv(file_path, low_memory=False, dtype_backend='numpy_nullable', **kwargs)
 
     @lru_cache(maxsize=32)
     def _get_column_metadata(self, column_name: str) -> Dict:
@@ -107,13 +523,7 @@ class DelayedOperationManager:
 
     def _optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
         """Optimize DataFrame memory usage by choosing appropriate dtypes."""
-        dtype_map = {
-            'float64': 'float32',
-            'int64': 'int32'
-        }
-        
-        return df.astype({col: dtype_map.get(str(dtype), dtype) 
-                         for col, dtype in df.dtypes.items()})
+        return to_native_dtypes(df)
 
     def load_preview(self, file_path: str, position: str) -> pd.DataFrame:
         """Load a preview of the file based on position."""
@@ -123,26 +533,38 @@ class DelayedOperationManager:
         nrows = 1000  # Fixed preview size
         
         try:
+            columns = self._load_columns(file_path)
             if self.input_file_type == 'csv':
-                total_rows = sum(1 for _ in open(file_path)) - 1
+                schema = self.get_csv_schema(file_path)
+                total_rows = count_data_rows(file_path)
                 if position == "head":
-                    df = pd.read_csv(file_path, nrows=nrows, low_memory=False)
+                    df = self._read_csv_sample(file_path, schema, columns, nrows=nrows)
                 elif position == "tail":
                     if total_rows <= nrows:
-                        df = pd.read_csv(file_path, low_memory=False)
+                        df = self._read_csv_sample(file_path, schema, columns)
                     else:
                         skiprows = range(1, total_rows - nrows + 1)
-                        df = pd.read_csv(file_path, skiprows=skiprows, low_memory=False)
+                        df = self._read_csv_sample(file_path, schema, columns, skiprows=skiprows)
                 else:  # middle
                     if total_rows <= nrows:
-                        df = pd.read_csv(file_path, low_memory=False)
+                        df = self._read_csv_sample(file_path, schema, columns)
                     else:
                         skiprows = range(1, (total_rows - nrows) // 2)
-                        df = pd.read_csv(file_path, skiprows=skiprows, nrows=nrows, low_memory=False)
+                        df = self._read_csv_sample(file_path, schema, columns, skiprows=skiprows, nrows=nrows)
+            elif self.input_file_type == 'parquet':
+                # Only the row groups holding the requested rows are read
+                total_rows = parquet_row_count(file_path)
+                if position == "head":
+                    start = 0
+                elif position == "tail":
+                    start = max(total_rows - nrows, 0)
+                else:  # middle
+                    start = max((total_rows - nrows) // 2, 0)
+                df = read_parquet_rows(file_path, start, nrows, columns)
             else:
                 wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
                 sheet = wb.active
-                total_rows = sheet.max_row - 1  # Exclude header
+                total_rows = sheet_row_count(sheet)
 
                 if position == "head":
                     data = list(sheet.iter_rows(min_row=1, max_row=nrows+1, values_only=True))
@@ -164,9 +586,13 @@ class DelayedOperationManager:
                 headers = data[0]
                 df = pd.DataFrame(data[1:], columns=headers)
                 wb.close()
+                if columns is not None:
+                    df = df[columns]
 
             # Optimize memory usage
             df = self._optimize_dtypes(df)
+            if self.arrow_strings:
+                df = to_arrow_strings(df)
             return df
 
         except Exception as e:
@@ -177,9 +603,7 @@ class DelayedOperationManager:
         if operation['type'] == 'column_operation':
             # Store the complete operation with all parameters
             op_copy = operation.copy()
-            # Debug: Print operation details to ensure delimiter is preserved
-            if 'delimiter' in op_copy:
-                print(f"DEBUG: Adding operation with delimiter='{op_copy['delimiter']}'")
+            logger.debug("Adding operation %s", op_copy)
             self.operations.append(op_copy)
 
     def clear_operations(self):
@@ -187,6 +611,8 @@ class DelayedOperationManager:
         self.operations = []
         self._cancel_flag = False
         self.full_file_path = None
+        self.projected_columns = None
+        self._schema_cache.clear()
         
         # Clear any cached data
         if hasattr(self, '_get_column_metadata'):
@@ -199,243 +625,471 @@ class DelayedOperationManager:
         """Cancel the current processing operation."""
         self._cancel_flag = True
 
-    def _process_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
-        """Process a single chunk with all operations."""
+    def _drop_helper_columns(self, chunk: pd.DataFrame, input_columns: List[str]) -> pd.DataFrame:
+        """Drop input columns that were only loaded for operations to read."""
+        if self.projected_columns is None:
+            return chunk
+        helper_columns = [col for col in input_columns
+                          if col not in self.projected_columns and col in chunk.columns]
+        return chunk.drop(columns=helper_columns)
+
+    def _profile_section(self, label: str, scope: str):
+        """Profile a block as section ``label`` when the save profiles ``scope``."""
+        if self._profiler is None or self.profile_scope != scope:
+            return nullcontext()
+        return self._profiler.section(label)
+
+    def _process_chunk(self, chunk: pd.DataFrame, header_mask: Optional[pd.Series] = None,
+                       failures: Optional[List[Tuple[str, str, pd.Index]]] = None, first_op: int = 0,
+                       input_columns: Optional[List[str]] = None,
+                       keep_helper_columns: bool = False) -> pd.DataFrame:
+        """Process a single chunk with all operations.
+
+        With ``failures``, every validating operation appends (column, reason,
+        labels of the rows it marked invalid); repeated header rows are left out.
+        A chunk restored from the result cache already went through the
+        operations before ``first_op``; ``input_columns`` are then the columns
+        originally read. ``keep_helper_columns`` skips the projection drop.
+        """
+        if header_mask is None:
+            header_mask = detect_header_rows(chunk)
+        if input_columns is None:
+            input_columns = list(chunk.columns)
         try:
-            print(f"DEBUG: Starting to process chunk with {len(chunk)} rows")
-            for i, op in enumerate(self.operations):
+            for i, op in enumerate(self.operations[first_op:], start=first_op):
                 if self._cancel_flag:
                     return None
-                
-                # Debug: Print operation details before processing
-                if 'delimiter' in op:
-                    print(f"DEBUG: Processing operation {i} with delimiter='{op['delimiter']}'")
-                else:
-                    print(f"DEBUG: Processing operation {i} of type '{op.get('key', 'unknown')}'")
-                
-                print(f"DEBUG: Chunk shape before operation {i}: {chunk.shape}")
-                print(f"DEBUG: Chunk columns: {list(chunk.columns)}")
-                
+
+                start = time.perf_counter()
                 try:
-                    chunk = apply_operation_to_partition(chunk, op['type'], op)
-                    print(f"DEBUG: Successfully completed operation {i}")
-                    print(f"DEBUG: Chunk shape after operation {i}: {chunk.shape}")
+                    with span(op.get('key', 'unknown'), 'operation', index=i, column=op.get('column'),
+                              rows=len(chunk)), \
+                            self._profile_section(f"op-{i:02d}-{op.get('key', 'unknown')}", 'operation'):
+                        processed = apply_operation_to_partition(chunk, op['type'], op, header_mask)
                 except Exception as e:
-                    print(f"ERROR: Operation {i} failed with error: {e}")
-                    print(f"ERROR: Operation details: {op}")
-                    raise Exception(f"Operation {i} ({op.get('key', 'unknown')}) failed: {e}")
+                    logger.debug("Operation %d failed: %s", i, op, exc_info=True)
+                    raise OperationError(f"Operation {i} ({op.get('key', 'unknown')}) failed: {e}", op.get('column'))
+                if self._metrics is not None:
+                    self._metrics.record_operation(i, op, time.perf_counter() - start, chunk, processed)
+                chunk = processed
+
+                reason = validation_reason(op)
+                if failures is not None and reason is not None:
+                    # Later operations copy the frame and drop the mask, so take it now
+                    invalid = getattr(chunk, '_styled_columns', {}).get(op.get('column'))
+                    if invalid is not None:
+                        invalid = pd.Series(invalid, index=chunk.index).fillna(False).astype(bool)
+                        if header_mask is not None:
+                            invalid &= ~header_mask.reindex(chunk.index, fill_value=False).astype(bool)
+                        failures.append((op.get('column'), reason, chunk.index[invalid.to_numpy()]))
                     
-            print(f"DEBUG: Successfully processed chunk, final shape: {chunk.shape}")
+            if not keep_helper_columns:
+                chunk = self._drop_helper_columns(chunk, input_columns)
+
+            logger.debug("Processed chunk, final shape %s", chunk.shape)
             return chunk
-        except Exception as e:
-            print(f"FATAL ERROR in _process_chunk: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
         finally:
-            gc.collect()
+            with span('gc', 'stage'):
+                gc.collect()
+
+    def _open_parts_dir(self, output_path: str, resume_state: Optional[dict]) -> str:
+        """Persistent directory for the parts of a resumable output; emptied unless resuming."""
+        directory = parts_dir(output_path)
+        if resume_state is None:
+            shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def _open_sink(self, output_path: str, tmpdirs: ExitStack, resumable: bool = False,
+                   resume_state: Optional[dict] = None):
+        """Open the streaming sink for one output target.
+
+        With ``resumable`` Parquet and Excel parts go to a directory that
+        survives an interrupted save; ``resume_state`` continues a sink from
+        its last checkpoint.
+        """
+        text_sink = self._text_sink(output_path)
+        if text_sink is not None:
+            # Formats and writes on its own background thread
+            return text_sink(
+                output_path,
+                atomic=self.atomic_save,
+                compression_level=self.compression_level,
+                compression_workers=self.compression_workers,
+                resume_state=resume_state
+            )
+        if output_path.lower().endswith('.parquet'):
+            parquet_parts = self._open_parts_dir(output_path, resume_state) if resumable else None
+            return ThreadedSink(ParquetChunkWriter(output_path, self.parquet_compression, parquet_parts,
+                                                   resume_state), 'parquet')
+
+        # Excel: typed cells, sheet XML spooled in a temporary directory next to the output
+        if resumable:
+            tmpdir = self._open_parts_dir(output_path, resume_state)
+        else:
+            tmpdir = tmpdirs.enter_context(tempfile.TemporaryDirectory(dir=os.path.dirname(output_path)))
+        xlsx_writer = XlsxChunkWriter(
+            os.path.join(tmpdir, 'temp.xlsx'),
+            tmpdir=tmpdir,
+            text_columns=self._xlsx_text_columns(),
+            highlight_ranges=self.highlight_ranges,
+            split_workbooks=self.split_workbooks,
+            compression_level=self.compression_level,
+            compression_workers=self.compression_workers,
+            resume_state=resume_state
+        )
+
+        def write_xlsx(chunk: pd.DataFrame):
+            # Highlight masks as position -> bool array (invalid takes priority)
+            xlsx_writer.write(
+                chunk,
+                invalid=column_masks(chunk, '_styled_columns'),
+                modified=column_masks(chunk, '_modified_columns')
+            )
+        return ThreadedSink(xlsx_writer, 'xlsx', write=write_xlsx)
+
+    def _process_chunk_with_rejects(self, chunk: pd.DataFrame, header_mask: Optional[pd.Series] = None
+                                    ) -> Tuple[Optional[pd.DataFrame], pd.DataFrame]:
+        """Process a chunk and split off the rows that fail a validation or an operation.
+
+        Returns (clean rows, rejected rows). Rejected rows are the input rows
+        as read, plus ``_reject_column`` and ``_reject_reason``. An operation
+        error rejects the whole chunk and the clean part is None.
+        """
+        failures = []
+        try:
+            processed = self._process_chunk(chunk, header_mask, failures)
+        except OperationError as e:
+            return None, chunk.assign(_reject_column=e.column or '', _reject_reason=str(e))
+        if processed is None:
+            return None, chunk.iloc[:0]
+
+        columns = pd.Series('', index=chunk.index, dtype=object)
+        reasons = pd.Series('', index=chunk.index, dtype=object)
+        for column, reason, labels in failures:
+            labels = labels.intersection(chunk.index)
+            previous = columns.loc[labels]
+            first = (previous == '').to_numpy()
+            columns.loc[labels] = np.where(first, column, previous + '; ' + column)
+            reasons.loc[labels] = np.where(first, reason, reasons.loc[labels] + '; ' + reason)
+        rejected = (columns != '').to_numpy()
+        if not rejected.any():
+            return processed, chunk.iloc[:0]
+        rejects = chunk[rejected].assign(_reject_column=columns[rejected], _reject_reason=reasons[rejected])
+        keep = ~processed.index.isin(chunk.index[rejected])
+        return select_rows(processed, keep), rejects
+
+    def _checkpoint_settings(self, target_paths: List[str]) -> Dict[str, Any]:
+        """Everything a checkpoint must match to be resumed, normalised as stored in JSON."""
+        settings = {
+            'input': input_fingerprint(self.full_file_path),
+            'operations': operations_digest(self.operations),
+            'targets': [os.path.abspath(path) for path in target_paths],
+            'options': [
+                self.ids_as_text, self.arrow_strings, self.csv_engine, self.parquet_compression,
+                self.projected_columns, self.raw_passthrough, self.compression_level, self.text_columns,
+                self.highlight_ranges, self.split_workbooks, self.atomic_save,
+            ],
+        }
+        return json.loads(json.dumps(settings, default=str))
+
+    def _open_result_cache(self, chunk_size: int, schema: Optional[Dict[str, Any]],
+                           load_columns: Optional[List[str]], raw_columns: Optional[List[str]]):
+        """Return (cache, prefix keys) for this input and these operations, or (None, None)."""
+        if self.result_cache_dir is None:
+            return None, None
+        try:
+            cache = ResultCache(self.result_cache_dir, self.result_cache_max_bytes)
+        except (ImportError, OSError) as e:
+            logger.warning("Result cache disabled: %s", e)
+            return None, None
+        base = {
+            'input': input_fingerprint(self.full_file_path),
+            'chunk_size': chunk_size,
+            'schema': schema,
+            'columns': [load_columns, raw_columns],
+            'options': [self.arrow_strings, self.csv_engine, self.ids_as_text],
+        }
+        return cache, prefix_keys(base, self.operations)
+
+    def save_with_operations(self, output_path: Union[str, Sequence[str]], progress_callback=None,
+                             resume: bool = False) -> bool:
+        """Apply all operations to the full file and save the result.
+
+        ``output_path`` may be a list of targets in different formats; the
+        file is then read and transformed once and every processed chunk is
+        written to all of them concurrently. With ``rejects_path`` set, rows
+        failing a validation or an operation go to that file instead, and a
+        failing chunk no longer aborts the save.
+
+        With ``resumable_saves`` a checkpoint (input offset, sink positions)
+        is written after every chunk, and a failed or cancelled save keeps
+        its partial output. ``resume`` continues from that checkpoint when
+        the input, operations and targets are unchanged, and otherwise
+        starts from the first row.
+
+        Unless rows are rejected or a save is resumed, the processed chunks
+        also go to the result cache (``result_cache_dir``); a later save of
+        the same input whose operations start with the same ones reads them
+        back from there and only runs the operations added since.
+
+        Every save collects a run report (see ``RunMetrics``), kept in
+        ``last_run_report`` and, with ``write_run_report``, written next to
+        the first output whether the save completed, was cancelled or failed.
+        With ``trace_saves`` a span timeline of the reader, the operations
+        and the writer threads goes next to it as well, and with
+        ``profile_scope`` the profiles of the operations or chunks.
+        """
+        output_paths = [output_path] if isinstance(output_path, str) else list(output_path)
+        if not output_paths:
+            raise ValueError("No output path given")
+        # The rejects file is opened and closed together with the outputs
+        target_paths = output_paths + ([self.rejects_path] if self.rejects_path else [])
+        if len(set(map(os.path.abspath, target_paths))) != len(target_paths):
+            raise ValueError("The same output path is given more than once")
 
-    def save_with_operations(self, output_path: str, progress_callback=None) -> bool:
-        """Apply all operations to the full file and save the result."""
         self._cancel_flag = False
+        resumable = self.resumable_saves or resume
+        checkpoint_file = checkpoint_path(output_paths[0])
+        settings = self._checkpoint_settings(target_paths) if resumable else None
+        checkpoint = read_checkpoint(checkpoint_file) if resume else None
+        if checkpoint is not None and checkpoint['settings'] != settings:
+            checkpoint = None
         file_size = os.path.getsize(self.full_file_path)
-        chunk_size = calculate_optimal_chunk_size(file_size)
-        
-        try:
-            chunk_iterator = ChunkIterator(self.full_file_path, chunk_size)
-            total_rows = chunk_iterator.total_rows
-            processed_rows = 0
+        if checkpoint:
+            chunk_size = checkpoint['chunk_size']
+        else:
+            chunk_size = self.chunk_size or calculate_optimal_chunk_size(file_size)
+        metrics = self._metrics = RunMetrics(self.full_file_path, target_paths, self.count_changed_cells)
+        tracer = start_tracing() if self.trace_saves else None
+        self._profiler = make_profiler(self.profile_mode) if self.profile_scope else None
 
-            if progress_callback:
-                progress_callback(0, f"Starting file processing ({total_rows:,} total rows)...")
-
-            # For CSV output
-            if output_path.lower().endswith('.csv'):
-                first_chunk = True
-                for chunk in chunk_iterator:
-                    if self._cancel_flag:
-                        return False
-
-                    # Process chunk
-                    processed_chunk = self._process_chunk(chunk)
-                    if processed_chunk is None:
-                        return False
-
-                    # Write chunk to CSV
-                    processed_chunk.to_csv(
-                        output_path,
-                        mode='w' if first_chunk else 'a',
-                        header=first_chunk,
-                        index=False
-                    )
+        try:
+            if checkpoint is not None:
+                # The schema may have been relaxed while reading the committed rows
+                schema = checkpoint['schema']
+            else:
+                schema = self.get_csv_schema(self.full_file_path) if self._get_file_type(self.full_file_path) == 'csv' else None
+            load_columns = self._load_columns(self.full_file_path)
+            raw_columns = self._passthrough_columns(target_paths, load_columns)
 
-                    processed_rows += len(chunk)
-                    if progress_callback:
-                        progress = processed_rows / total_rows
-                        progress_callback(
-                            progress,
-                            f"Processed {processed_rows:,} of {total_rows:,} rows ({progress*100:.1f}%)..."
-                        )
+            cache, cache_keys = None, None
+            if checkpoint is None and not self.rejects_path:
+                cache, cache_keys = self._open_result_cache(chunk_size, schema, load_columns, raw_columns)
+            cached_ops, cache_meta = cache.longest_prefix(cache_keys) if cache is not None else (0, None)
+            # Store the result of all operations unless it is what was found
+            fill_cache = cache is not None and cached_ops < len(self.operations)
+            cache_entry = None
 
-                    first_chunk = False
-                    del chunk, processed_chunk
-                    gc.collect()
+            for index in range(cached_ops):
+                metrics.operation(index, self.operations[index])['cached'] = True
 
-            # For Excel output - highly optimized version with fast save
+            if cache_meta is not None:
+                chunk_iterator = None
+                source = cache.read(cache_keys[cached_ops], cache_meta)
+                input_columns = cache_meta['input_columns']
+                total_rows = sum(cache_meta['chunk_rows'])
             else:
-                import tempfile
-                import shutil
-                
-                # Create a temporary directory for faster disk I/O
-                with tempfile.TemporaryDirectory(dir=os.path.dirname(output_path)) as tmpdir:
-                    temp_path = os.path.join(tmpdir, 'temp.xlsx')
-                    
-                    # Create Excel writer with optimized settings
-                    workbook_options = {
-                        'constant_memory': True,
-                        'strings_to_numbers': False,
-                        'use_zip64': True,
-                        'in_memory': False,  # Write directly to disk for better memory usage
-                        'default_row_height': 15,
-                        'optimization': 1,
-                        'tmpdir': tmpdir  # Use the same temp directory
-                    }
-                    
-                    writer = pd.ExcelWriter(
-                        temp_path,
-                        engine='xlsxwriter',
-                        engine_kwargs={'options': workbook_options}
+                with metrics.stage('open'):
+                    chunk_iterator = ChunkIterator(
+                        self.full_file_path, chunk_size, schema, self.arrow_strings, engine=self.csv_engine,
+                        columns=load_columns, raw_columns=raw_columns,
+                        start_row=checkpoint['rows_read'] if checkpoint else 0
                     )
-                    
-                    workbook = writer.book
-                    worksheet = workbook.add_worksheet('Sheet1')
-                    
-                    # Pre-allocate format objects
-                    default_format = workbook.add_format({
-                        'num_format': '@',
-                        'text_wrap': False
-                    })
-                    invalid_format = workbook.add_format({
-                        'bg_color': '#FFCCCC',
-                        'font_color': '#000000',
-                        'num_format': '@',
-                        'text_wrap': False
-                    })
-                    modified_format = workbook.add_format({
-                        'bg_color': '#FFFFCC',
-                        'font_color': '#000000',
-                        'num_format': '@',
-                        'text_wrap': False
-                    })
-                    
-                    # Process chunks and write directly
-                    current_row = 0
-                    headers_written = False
-                    
-                    # Buffer for batch writing
-                    write_buffer = []
-                    BUFFER_SIZE = 10000  # Number of cells to buffer before writing
-                    
-                    def flush_buffer():
-                        nonlocal write_buffer
-                        if write_buffer:
-                            for row, col, value, fmt in write_buffer:
-                                worksheet.write(row, col, value, fmt)
-                            write_buffer = []
-                    
-                    for chunk in chunk_iterator:
+                # header_mask is read after each chunk is produced
+                source = ((chunk, chunk_iterator.header_mask, len(chunk)) for chunk in chunk_iterator)
+                input_columns = None
+                total_rows = chunk_iterator.total_rows
+            processed_rows = checkpoint['rows_read'] if checkpoint else 0
+            rejected_rows = checkpoint['rejected_rows'] if checkpoint else 0
+
+            if progress_callback:
+                if checkpoint is not None:
+                    progress_callback(
+                        processed_rows / total_rows if total_rows else 0,
+                        f"Resuming after row {processed_rows:,} of {total_rows:,}..."
+                    )
+                else:
+                    progress_callback(0, f"Starting file processing ({total_rows:,} total rows)...")
+
+            with ExitStack() as tmpdirs:
+                sinks = []
+                try:
+                    with metrics.stage('open'):
+                        for index, path in enumerate(target_paths):
+                            sinks.append(self._open_sink(path, tmpdirs, resumable,
+                                                         checkpoint['sinks'][index] if checkpoint else None))
+                except Exception:
+                    if resumable:
+                        FanOutWriter(sinks).suspend()
+                    else:
+                        FanOutWriter(sinks).close(commit=False)
+                    raise
+                # Targets other than CSV get the raw passthrough columns parsed
+                raw_dtypes = self._raw_column_dtypes(raw_columns) if raw_columns else {}
+                parsed = [bool(raw_dtypes) and not self._is_csv_output(path) for path in target_paths]
+                writer = FanOutWriter([sink for sink, p in zip(sinks, parsed[:len(output_paths)]) if not p])
+                parsed_writer = FanOutWriter([sink for sink, p in zip(sinks, parsed[:len(output_paths)]) if p])
+                rejects_writer = sinks[len(output_paths)] if self.rejects_path else None
+                has_excel = any(isinstance(sink, ThreadedSink) and isinstance(sink.sink, XlsxChunkWriter)
+                                for sink in sinks)
+
+                completed = False
+                header_columns_set = False
+                try:
+                    for chunk, header_mask, input_rows in metrics.timed('read', source):
                         if self._cancel_flag:
                             return False
-                            
+                        if not header_columns_set:
+                            # Headers for text outputs that end up without a single chunk
+                            for sink in sinks[:len(output_paths)]:
+                                if isinstance(sink, TextChunkWriter):
+                                    sink.header_columns = list(input_columns or chunk.columns)
+                            if isinstance(rejects_writer, TextChunkWriter):
+                                rejects_writer.header_columns = list(chunk.columns) + ['_reject_column',
+                                                                                       '_reject_reason']
+                            header_columns_set = True
+
                         # Process chunk
-                        processed_chunk = self._process_chunk(chunk)
-                        if processed_chunk is None:
-                            return False
-                        
-                        # Write headers if not written yet
-                        if not headers_written:
-                            for col_idx, col_name in enumerate(processed_chunk.columns):
-                                worksheet.write_string(0, col_idx, str(col_name), default_format)
-                            current_row = 1
-                            headers_written = True
-                        
-                        # Get numpy array of values for faster access
-                        chunk_values = processed_chunk.values
-                        chunk_rows, chunk_cols = chunk_values.shape
-                        
-                        # Pre-process styling information
-                        style_masks = {}
-                        modified_masks = {}
-                        if hasattr(processed_chunk, '_styled_columns'):
-                            for col_name, mask in processed_chunk._styled_columns.items():
-                                if col_name in processed_chunk.columns:
-                                    col_idx = processed_chunk.columns.get_loc(col_name)
-                                    style_masks[col_idx] = mask.values
-                        
-                        if hasattr(processed_chunk, '_modified_columns'):
-                            for col_name, mask in processed_chunk._modified_columns.items():
-                                if col_name in processed_chunk.columns:
-                                    col_idx = processed_chunk.columns.get_loc(col_name)
-                                    modified_masks[col_idx] = mask.values
-                        
-                        # Write data row by row for better memory efficiency
-                        for row_idx in range(chunk_rows):
-                            row_data = chunk_values[row_idx]
-                            for col_idx in range(chunk_cols):
-                                value = row_data[col_idx]
-                                is_invalid = (col_idx in style_masks and style_masks[col_idx][row_idx])
-                                is_modified = (col_idx in modified_masks and modified_masks[col_idx][row_idx])
-                                
-                                # Choose format based on cell state (invalid takes priority)
-                                if is_invalid:
-                                    fmt = invalid_format
-                                elif is_modified:
-                                    fmt = modified_format
-                                else:
-                                    fmt = default_format
-                                
-                                write_buffer.append([current_row + row_idx, col_idx, str(value), fmt])
-                                if len(write_buffer) >= BUFFER_SIZE:
-                                    flush_buffer()
-                        
-                        # Update position and progress
-                        current_row += chunk_rows
-                        processed_rows += chunk_rows
-                        
+                        if rejects_writer is not None:
+                            with metrics.stage('process'), self._profile_section('chunks', 'chunk'):
+                                processed_chunk, rejects = self._process_chunk_with_rejects(chunk, header_mask)
+                            if self._cancel_flag:
+                                return False
+                            if len(rejects):
+                                with metrics.stage('write'):
+                                    if parsed[-1]:
+                                        rejects = self._parse_raw_columns(rejects, raw_dtypes)
+                                    rejects_writer.write(rejects)
+                                rejected_rows += len(rejects)
+                            del rejects
+                        else:
+                            chunk_columns = input_columns or list(chunk.columns)
+                            with metrics.stage('process'), self._profile_section('chunks', 'chunk'):
+                                processed_chunk = self._process_chunk(
+                                    chunk, header_mask, first_op=cached_ops, input_columns=chunk_columns,
+                                    keep_helper_columns=fill_cache
+                                )
+                            if processed_chunk is None:
+                                return False
+                            if fill_cache:
+                                with metrics.stage('cache'):
+                                    if cache_entry is None:
+                                        cache_entry = cache.writer(cache_keys[-1], chunk_columns)
+                                    cache_entry.write(processed_chunk, header_mask, input_rows)
+                                processed_chunk = self._drop_helper_columns(processed_chunk, chunk_columns)
+
+                        if processed_chunk is not None:
+                            with metrics.stage('write'):
+                                writer.write(processed_chunk)
+                                if parsed_writer.sinks:
+                                    parsed_writer.write(self._parse_raw_columns(processed_chunk, raw_dtypes))
+
+                        processed_rows += input_rows
+                        if resumable:
+                            # Waits until every sink has written this chunk
+                            with metrics.stage('checkpoint'):
+                                write_checkpoint(checkpoint_file, {
+                                    'settings': settings,
+                                    'chunk_size': chunk_size,
+                                    'schema': chunk_iterator.schema if chunk_iterator else schema,
+                                    'rows_read': processed_rows,
+                                    'rejected_rows': rejected_rows,
+                                    'sinks': FanOutWriter(sinks).checkpoint(),
+                                })
                         if progress_callback:
                             progress = processed_rows / total_rows
                             progress_callback(
                                 progress,
                                 f"Processed {processed_rows:,} of {total_rows:,} rows ({progress*100:.1f}%)..."
                             )
-                        
-                        # Clean up
-                        del processed_chunk, chunk_values
-                        if style_masks:
-                            del style_masks
-                        if modified_masks:
-                            del modified_masks
-                        gc.collect()
-                    
-                    # Flush any remaining data
-                    flush_buffer()
-                    
-                    if progress_callback:
+
+                        del chunk, processed_chunk
+                        with metrics.stage('gc'):
+                            gc.collect()
+
+                    if progress_callback and has_excel:
                         progress_callback(0.95, "Saving Excel file...")
-                    
-                    # Close the workbook to ensure all data is written
-                    writer.close()
-                    
-                    # Move the temporary file to the final destination
-                    if progress_callback:
-                        progress_callback(0.98, "Moving file to final location...")
-                    shutil.move(temp_path, output_path)
+                    completed = True
+                finally:
+                    if cache_entry is not None:
+                        with metrics.stage('cache'):
+                            if completed:
+                                cache_entry.commit()
+                            else:
+                                cache_entry.abandon()
+                    with metrics.stage('close'):
+                        if completed or not resumable:
+                            # Waits for every sink; after a failure only removes partial output
+                            FanOutWriter(sinks).close(commit=completed)
+                        else:
+                            # Keep the partial output for a resumed save
+                            FanOutWriter(sinks).suspend()
+
+                # Rows actually read (the same whether they came from the input or the cache)
+                completion_message = f"Complete! Processed {processed_rows:,} rows."
+                if cached_ops:
+                    completion_message += f" Reused cached results of {cached_ops} operations."
+                for index, (path, sink) in enumerate(zip(target_paths, sinks)):
+                    if isinstance(sink, TextChunkWriter):
+                        if index >= len(output_paths):
+                            # The rejects file is reported on its own line below
+                            continue
+                        completion_message += (
+                            f" Wrote {sink.bytes_written / (1 << 20):,.1f} MB of {sink.format_name.upper()}"
+                            f" at {sink.bytes_per_second / (1 << 20):,.1f} MB/s."
+                        )
+                    elif isinstance(sink.sink, XlsxChunkWriter):
+                        # Move the temporary file(s) to the final destination
+                        if progress_callback:
+                            progress_callback(0.98, "Moving file to final location...")
+                        part_paths = sink.sink.output_paths
+                        with metrics.stage('close'):
+                            for index, part_path in enumerate(part_paths, start=1):
+                                shutil.move(part_path, workbook_part_path(path, index))
+                        if len(part_paths) > 1:
+                            completion_message += f" Split into {len(part_paths)} workbooks."
+
+            if resumable:
+                remove_checkpoint(checkpoint_file)
+                for path in target_paths:
+                    shutil.rmtree(parts_dir(path), ignore_errors=True)
 
+            if self.rejects_path:
+                # The rejects file is not an output; report it on its own line
+                completion_message += f"\nRejected {rejected_rows:,} rows to {self.rejects_path}."
+
+            metrics.finish('completed', rows_read=processed_rows, rejected_rows=rejected_rows,
+                           cached_operations=cached_ops)
             if progress_callback:
-                progress_callback(1.0, f"Complete! Processed {total_rows:,} rows.")
+                progress_callback(1.0, completion_message)
 
             return True
 
         except Exception as e:
-            print(f"Error during save operation: {e}")
-            raise
\ No newline at end of file
+            logger.error("Error during save operation: %s", e, exc_info=True)
+            metrics.finish('failed', error=str(e))
+            raise
+        finally:
+            self._metrics = None
+            if tracer is not None:
+                stop_tracing()
+                try:
+                    tracer.write(trace_path(output_paths[0]))
+                except OSError as e:
+                    logger.warning("Could not write the trace: %s", e)
+            if metrics.info['status'] == 'running':
+                metrics.finish('cancelled')
+            profiler, self._profiler = self._profiler, None
+            if profiler is not None:
+                try:
+                    metrics.info['profile_summary'] = write_profiles(profiler, profile_dir(output_paths[0]))
+                except OSError as e:
+                    logger.warning("Could not write the profiles: %s", e)
+            self.last_run_report = metrics.report()
+            if self.write_run_report:
+                try:
+                    with open(report_path(output_paths[0]), 'w', encoding='utf-8') as f:
+                        json.dump(self.last_run_report, f, indent=2, default=str)
+                except OSError as e:
+                    logger.warning("Could not write the run report: %s", e)
\ No newline at end of file
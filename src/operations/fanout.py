@@ -0,0 +1,114 @@
+# operations/fanout.py
+import threading
+from queue import Queue
+from typing import Callable, List, Optional
+
+import pandas as pd
+
+from .tracing import span
+
+# Chunks waiting for a threaded sink; bounds memory use
+MAX_QUEUED_CHUNKS = 2
+
+class ThreadedSink:
+    """Run a synchronous sink's writes on a background thread.
+
+    ``sink`` needs ``close(commit)``; chunks go to ``write`` (default
+    ``sink.write``). The first error stops further writes and is raised
+    from the next ``write`` or from ``close``.
+    """
+    def __init__(self, sink, name: str, write: Optional[Callable[[pd.DataFrame], None]] = None):
+        self.sink = sink
+        self._write = write or sink.write
+        self._queue = Queue(maxsize=MAX_QUEUED_CHUNKS)
+        self._error = None
+        self._name = name
+        self._thread = threading.Thread(target=self._run, name=f'{name}-sink', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                self._queue.task_done()
+                return
+            if self._error is None:
+                try:
+                    with span(f'write {self._name}', 'sink', rows=len(chunk)):
+                        self._write(chunk)
+                except Exception as e:
+                    self._error = e
+            self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def write(self, chunk: pd.DataFrame):
+        """Queue a chunk for writing; blocks while the sink is behind."""
+        self._raise_error()
+        self._queue.put(chunk)
+
+    def checkpoint(self) -> dict:
+        """Wait for the queued chunks and return the sink's checkpoint state."""
+        self._queue.join()
+        self._raise_error()
+        return self.sink.checkpoint()
+
+    def suspend(self):
+        """Stop the thread and suspend the sink, keeping its partial output."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self.sink.suspend()
+
+    def close(self, commit: bool = True):
+        """Wait for queued chunks, then close the sink (without ``commit`` after an error)."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        with span(f'close {self._name}', 'sink'):
+            self.sink.close(commit=commit and self._error is None)
+        self._raise_error()
+
+class FanOutWriter:
+    """Feed every chunk to several sinks that write concurrently.
+
+    Each sink writes on its own thread and queues a couple of chunks, so a
+    save takes about one read and transform pass plus the slowest sink.
+    Chunks are shared between sinks, which must not modify them. A sink
+    error raised while writing aborts the save and every output is
+    discarded. Sinks are closed in order; if one fails while closing, the
+    sinks after it are closed without committing.
+    """
+    def __init__(self, sinks: List):
+        self.sinks = sinks
+
+    def write(self, chunk: pd.DataFrame):
+        for sink in self.sinks:
+            sink.write(chunk)
+
+    def checkpoint(self) -> List[dict]:
+        """Wait until every sink has written all chunks so far; returns their states in order."""
+        return [sink.checkpoint() for sink in self.sinks]
+
+    def suspend(self):
+        """Stop every sink, keeping the partial outputs for a resumed save."""
+        for sink in self.sinks:
+            sink.suspend()
+
+    def close(self, commit: bool = True):
+        """Close every sink and raise the first error; sinks after a failed one are not committed."""
+        error = None
+        for sink in self.sinks:
+            try:
+                sink.close(commit=commit and error is None)
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
@@ -2,17 +2,35 @@ import pandas as pd
 import numpy as np
 
 def _to_numeric_coerce(series):
+    # Columns that are already numeric don't need to be parsed again
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series
     return pd.to_numeric(series, errors='coerce')
 
-def apply_round_numbers(dataframe, col, decimals, texts):
+def _assign_processed(new_df, col, skip_mask, values):
+    """Write processed values back, keeping the native dtype when no rows were skipped."""
+    if skip_mask.any():
+        new_df.loc[~skip_mask, col] = values
+    else:
+        new_df[col] = values
+
+def _skip_mask(dataframe, header_mask):
+    if header_mask is None:
+        return pd.Series(False, index=dataframe.index)
+    return header_mask.reindex(dataframe.index, fill_value=False)
+
+def apply_round_numbers(dataframe, col, decimals, texts, header_mask=None):
     """Rounds numbers in a column to specified decimal places."""
     if col not in dataframe.columns:
         return dataframe, ('error', texts['column_not_found'].format(col=col))
     
     new_df = dataframe.copy()
     
-    # Identify rows where value equals column name (as string)
-    skip_mask = (new_df[col].astype(str) == str(col))
+    # Skip rows that repeat the header line
+    skip_mask = _skip_mask(new_df, header_mask)
+    if skip_mask.any():
+        # Header text and numbers have to share the column
+        new_df[col] = new_df[col].astype(object)
     
     # Process only non-skipped rows
     col_to_process = new_df.loc[~skip_mask, col]
@@ -26,18 +44,21 @@ def apply_round_numbers(dataframe, col, decimals, texts):
         # This means all rows that were attempted to be processed became NaN
         return dataframe, ('warning', texts['column_not_numeric'].format(col=col) + " (for non-skipped rows)")
 
-    new_df.loc[~skip_mask, col] = numeric_col_processed.round(decimals)
+    _assign_processed(new_df, col, skip_mask, numeric_col_processed.round(decimals))
     return new_df, ('success', texts['rounding_success'].format(col=col, decimals=decimals))
 
-def apply_calculate_column_constant(dataframe, col, operation, value, texts):
+def apply_calculate_column_constant(dataframe, col, operation, value, texts, header_mask=None):
     """Performs a calculation (add, subtract, multiply, divide) on a column with a constant."""
     if col not in dataframe.columns:
         return dataframe, ('error', texts['column_not_found'].format(col=col))
 
     new_df = dataframe.copy()
 
-    # Identify rows where value equals column name (as string)
-    skip_mask = (new_df[col].astype(str) == str(col))
+    # Skip rows that repeat the header line
+    skip_mask = _skip_mask(new_df, header_mask)
+    if skip_mask.any():
+        # Header text and numbers have to share the column
+        new_df[col] = new_df[col].astype(object)
     
     # Process only non-skipped rows
     col_to_process = new_df.loc[~skip_mask, col]
@@ -76,9 +97,7 @@ def apply_calculate_column_constant(dataframe, col, operation, value, texts):
     else:
         return dataframe, ('error', f"Unknown operation: {operation}")
     
-    # Explicitly cast to float to avoid dtype warning
-    calculated_values = calculated_values.astype(float)
-    new_df.loc[~skip_mask, col] = calculated_values
+    _assign_processed(new_df, col, skip_mask, calculated_values)
         
     return new_df, ('success', texts['calculation_success'].format(col=col))
 
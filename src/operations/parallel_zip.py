@@ -0,0 +1,176 @@
+# operations/parallel_zip.py
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from .tracing import span
+
+# Uncompressed bytes deflated by one task
+DEFAULT_BLOCK_SIZE = 4 << 20
+
+# Deflate window; each block is primed with this much of the data before it
+_WINDOW = 32 << 10
+
+# Sizes and offsets above this need ZIP64 records; the marker takes their place
+_ZIP64_LIMIT = 0xFFFFFFFF
+_ZIP64_MARKER = 0xFFFFFFFF
+_ZIP_STORED = 0
+_ZIP_DEFLATED = 8
+
+def deflate_block(data: bytes, level: int, dictionary: bytes, last: bool) -> bytes:
+    """Deflate one block so that consecutive blocks concatenate into one raw deflate stream.
+
+    Non-final blocks end with a sync flush (byte aligned, not marked last);
+    ``dictionary`` is the tail of the previous block, so matches can reach
+    back across the block boundary as in a single-threaded stream.
+    """
+    if dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+def _dos_datetime(timestamp: float):
+    t = time.localtime(timestamp)
+    dos_date = (max(t.tm_year, 1980) - 1980) << 9 | t.tm_mon << 5 | t.tm_mday
+    dos_time = t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2
+    return dos_time, dos_date
+
+class ParallelZipWriter:
+    """Write a zip archive whose large members are deflated on a thread pool.
+
+    ``write_file`` cuts a file into ``block_size`` blocks and deflates them
+    concurrently (zlib releases the GIL), then writes them in order as one
+    member; ``writestr`` handles small members in the calling thread.
+    ``level`` 0 stores members uncompressed. Members and archives larger
+    than 4 GiB get ZIP64 records.
+    """
+    def __init__(self, path: str, level: int = 6, workers: Optional[int] = None,
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        self.level = level
+        self.workers = workers or os.cpu_count() or 1
+        self.block_size = block_size
+        self._file = open(path, 'wb')
+        self._entries = []
+        self._dos_time, self._dos_date = _dos_datetime(time.time())
+
+    def _start_entry(self, name: str, zip64: bool) -> dict:
+        entry = {
+            'name': name.encode('utf-8'),
+            'offset': self._file.tell(),
+            'method': _ZIP_DEFLATED if self.level > 0 else _ZIP_STORED,
+            'zip64': zip64,
+        }
+        self._file.write(self._local_header(entry, 0, 0, 0))
+        entry['data_start'] = self._file.tell()
+        return entry
+
+    def _local_header(self, entry: dict, crc: int, compressed: int, size: int) -> bytes:
+        if entry['zip64']:
+            extra = struct.pack('<HHQQ', 0x0001, 16, size, compressed)
+            compressed = size = _ZIP64_MARKER
+        else:
+            extra = b''
+        return struct.pack(
+            '<IHHHHHIIIHH', 0x04034b50, 45 if entry['zip64'] else 20, 0x800, entry['method'],
+            self._dos_time, self._dos_date, crc, compressed, size, len(entry['name']), len(extra)
+        ) + entry['name'] + extra
+
+    def _finish_entry(self, entry: dict, crc: int, size: int):
+        compressed = self._file.tell() - entry['data_start']
+        if not entry['zip64'] and (compressed > _ZIP64_LIMIT or size > _ZIP64_LIMIT):
+            raise OverflowError(f"Zip member {entry['name'].decode()} grew past 4 GiB without ZIP64")
+        entry.update(crc=crc, compressed=compressed, size=size)
+        # Patch the real CRC and sizes into the local header
+        end = self._file.tell()
+        self._file.seek(entry['offset'])
+        self._file.write(self._local_header(entry, crc, compressed, size))
+        self._file.seek(end)
+        self._entries.append(entry)
+
+    def writestr(self, name: str, data):
+        """Add a small member from a string or bytes."""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        entry = self._start_entry(name, len(data) > _ZIP64_LIMIT)
+        if entry['method'] == _ZIP_DEFLATED:
+            self._file.write(deflate_block(data, self.level, b'', True))
+        else:
+            self._file.write(data)
+        self._finish_entry(entry, zlib.crc32(data), len(data))
+
+    def write_file(self, src_path: str, name: str):
+        """Add a file as a member, deflating its blocks in parallel."""
+        entry = self._start_entry(name, os.path.getsize(src_path) >= _ZIP64_LIMIT)
+        crc = 0
+        size = 0
+        with span(f'zip {name}', 'compression'), open(src_path, 'rb') as src:
+            if entry['method'] == _ZIP_STORED:
+                for block in iter(lambda: src.read(self.block_size), b''):
+                    crc = zlib.crc32(block, crc)
+                    size += len(block)
+                    self._file.write(block)
+            else:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    pending = deque()
+                    dictionary = b''
+                    block = src.read(self.block_size)
+                    while True:
+                        next_block = src.read(self.block_size)
+                        last = not next_block
+                        crc = zlib.crc32(block, crc)
+                        size += len(block)
+                        pending.append(executor.submit(deflate_block, block, self.level, dictionary, last))
+                        # At most two blocks per worker in flight bounds memory use
+                        while len(pending) > 2 * self.workers:
+                            self._file.write(pending.popleft().result())
+                        if last:
+                            break
+                        dictionary = block[-_WINDOW:]
+                        block = next_block
+                    while pending:
+                        self._file.write(pending.popleft().result())
+        self._finish_entry(entry, crc, size)
+
+    def close(self):
+        """Write the central directory and close the archive."""
+        if self._file is None:
+            return
+        directory_start = self._file.tell()
+        for entry in self._entries:
+            extra_fields = []
+            size, compressed, offset = entry['size'], entry['compressed'], entry['offset']
+            if entry['zip64'] or size > _ZIP64_LIMIT:
+                extra_fields.append(size)
+                size = _ZIP64_MARKER
+            if entry['zip64'] or compressed > _ZIP64_LIMIT:
+                extra_fields.append(compressed)
+                compressed = _ZIP64_MARKER
+            if offset > _ZIP64_LIMIT:
+                extra_fields.append(offset)
+                offset = _ZIP64_MARKER
+            extra = struct.pack(f'<HH{len(extra_fields)}Q', 0x0001, 8 * len(extra_fields), *extra_fields) if extra_fields else b''
+            version = 45 if extra_fields else 20
+            self._file.write(struct.pack(
+                '<IHHHHHHIIIHHHHHII', 0x02014b50, (3 << 8) | version, version, 0x800, entry['method'],
+                self._dos_time, self._dos_date, entry['crc'], compressed, size,
+                len(entry['name']), len(extra), 0, 0, 0, 0o644 << 16, offset
+            ) + entry['name'] + extra)
+        directory_end = self._file.tell()
+        directory_size = directory_end - directory_start
+        count = len(self._entries)
+        if directory_start > _ZIP64_LIMIT or directory_size > _ZIP64_LIMIT or count > 0xFFFF:
+            self._file.write(struct.pack(
+                '<IQHHIIQQQQ', 0x06064b50, 44, 45, 45, 0, 0, count, count, directory_size, directory_start
+            ))
+            self._file.write(struct.pack('<IIQI', 0x07064b50, 0, directory_end, 1))
+        self._file.write(struct.pack(
+            '<IHHHHIIH', 0x06054b50, 0, 0, min(count, 0xFFFF), min(count, 0xFFFF),
+            min(directory_size, _ZIP64_MARKER), min(directory_start, _ZIP64_MARKER), 0
+        ))
+        self._file.close()
+        self._file = None
@@ -0,0 +1,302 @@
+# operations/parquet_io.py
+import json
+import os
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow ships with dask[complete]; only Parquet files need it
+    pa = None
+    pq = None
+
+# Codecs offered for Parquet output
+PARQUET_COMPRESSIONS = ('snappy', 'zstd', 'gzip', 'brotli', 'lz4', 'none')
+
+def _require_pyarrow():
+    if pq is None:
+        raise ImportError("Reading or writing Parquet files requires pyarrow to be installed.")
+
+def _to_pandas(table, arrow_strings: bool = False) -> pd.DataFrame:
+    """Convert an Arrow table using the same nullable dtypes as the CSV readers."""
+    def types_mapper(arrow_type):
+        if pa.types.is_integer(arrow_type):
+            return pd.Int64Dtype()
+        if pa.types.is_floating(arrow_type):
+            return pd.Float64Dtype()
+        if pa.types.is_boolean(arrow_type):
+            return pd.BooleanDtype()
+        if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+            return pd.StringDtype('pyarrow' if arrow_strings else 'python')
+        return None
+    return table.to_pandas(types_mapper=types_mapper)
+
+def parquet_row_count(file_path: str) -> int:
+    """Return the number of rows from the file footer without reading any data."""
+    _require_pyarrow()
+    return pq.ParquetFile(file_path).metadata.num_rows
+
+def parquet_columns(file_path: str) -> List[str]:
+    """Return the column names from the file footer."""
+    _require_pyarrow()
+    return pq.ParquetFile(file_path).schema_arrow.names
+
+def read_parquet_rows(file_path: str, start: int, nrows: int,
+                      columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read rows ``start`` to ``start + nrows`` touching only the row groups that hold them."""
+    _require_pyarrow()
+    pf = pq.ParquetFile(file_path)
+    metadata = pf.metadata
+    groups = []
+    group_start = 0
+    first_group_start = None
+    for i in range(metadata.num_row_groups):
+        group_rows = metadata.row_group(i).num_rows
+        if group_start + group_rows > start and group_start < start + nrows:
+            if first_group_start is None:
+                first_group_start = group_start
+            groups.append(i)
+        group_start += group_rows
+    if not groups:
+        return _to_pandas(pf.schema_arrow.empty_table().select(columns) if columns else pf.schema_arrow.empty_table())
+    table = pf.read_row_groups(groups, columns=columns)
+    return _to_pandas(table.slice(start - first_group_start, nrows))
+
+class ParquetChunkReader:
+    """Yield pandas chunks from a Parquet file one row group at a time.
+
+    Only ``columns`` are decoded when given. Row groups larger than
+    ``chunk_size`` are split so chunks never exceed it. Reading begins at
+    row ``start``; row groups before it are never decoded.
+    """
+    def __init__(self, file_path: str, chunk_size: int, columns: Optional[List[str]] = None,
+                 arrow_strings: bool = False, start: int = 0):
+        _require_pyarrow()
+        self.chunk_size = chunk_size
+        self.columns = columns
+        self.arrow_strings = arrow_strings
+        self._file = pq.ParquetFile(file_path)
+        self._group = 0
+        self._pending = None
+        self._row_offset = start
+        metadata = self._file.metadata
+        while self._group < metadata.num_row_groups and start >= metadata.row_group(self._group).num_rows:
+            start -= metadata.row_group(self._group).num_rows
+            self._group += 1
+        if start:
+            self._pending = self._file.read_row_group(self._group, columns=self.columns).slice(start)
+            self._group += 1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> pd.DataFrame:
+        if self._pending is None or self._pending.num_rows == 0:
+            if self._group >= self._file.num_row_groups:
+                raise StopIteration
+            self._pending = self._file.read_row_group(self._group, columns=self.columns)
+            self._group += 1
+        table = self._pending.slice(0, self.chunk_size)
+        self._pending = self._pending.slice(self.chunk_size)
+
+        chunk_df = _to_pandas(table, self.arrow_strings)
+        chunk_df.index = pd.RangeIndex(self._row_offset, self._row_offset + len(chunk_df))
+        self._row_offset += len(chunk_df)
+        return chunk_df
+
+def _text_values(column: pd.Series) -> pd.Series:
+    """A column as Python strings, keeping missing values."""
+    return pd.Series([None if pd.isna(value) else str(value) for value in column], index=column.index, dtype=object)
+
+def _column_type(column: pd.Series):
+    """Arrow type of a column on its own, or None when Arrow can't convert it (mixed object values)."""
+    try:
+        return pa.array(column, from_pandas=True).type
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+def _common_type(first, second):
+    """Narrowest type holding values of both types: int64, float64 or, failing those, string."""
+    if first is None or second is None:
+        return pa.string()
+    if first == second or pa.types.is_null(second):
+        return first
+    if pa.types.is_null(first):
+        return second
+    if pa.types.is_integer(first) and pa.types.is_integer(second):
+        return pa.int64()
+    if all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in (first, second)):
+        return pa.float64()
+    return pa.string()
+
+def _pandas_metadata(metadata, types: dict):
+    """Update the pandas schema metadata of the columns whose type changed."""
+    if not metadata or b'pandas' not in metadata:
+        return metadata
+    pandas_metadata = json.loads(metadata[b'pandas'])
+    for column in pandas_metadata['columns']:
+        if column['name'] in types:
+            if pa.types.is_string(types[column['name']]):
+                column.update(pandas_type='unicode', numpy_type='object')
+            else:
+                name = types[column['name']].to_pandas_dtype().__name__
+                column.update(pandas_type=name, numpy_type=name)
+    metadata = dict(metadata)
+    metadata[b'pandas'] = json.dumps(pandas_metadata).encode()
+    return metadata
+
+def _widened_schema(schema, types: list):
+    """``schema`` with every field widened to hold the matching type of ``types``."""
+    fields = [field.with_type(_common_type(field.type, column_type)) for field, column_type in zip(schema, types)]
+    changed = {field.name: field.type for field, old in zip(fields, schema) if field.type != old.type}
+    if not changed:
+        return schema
+    return pa.schema(fields, metadata=_pandas_metadata(schema.metadata, changed))
+
+def _conformed(chunk: pd.DataFrame, schema) -> pd.DataFrame:
+    """Render the columns that the schema stores as text but the chunk doesn't hold as strings."""
+    converted = chunk.copy(deep=False)
+    for col_idx, field in enumerate(schema):
+        column = chunk.iloc[:, col_idx]
+        if pa.types.is_string(field.type) and pd.api.types.infer_dtype(column, skipna=True) not in ('string', 'empty'):
+            converted.isetitem(col_idx, _text_values(column))
+    return converted
+
+def _cast_table(table, schema):
+    """Convert a table written with an older schema to a widened one; text renders like ``str``."""
+    columns = []
+    for column, field in zip(table.columns, schema):
+        if column.type == field.type:
+            columns.append(column)
+        elif pa.types.is_string(field.type):
+            columns.append(pa.array([None if value is None else str(value) for value in column.to_pylist()],
+                                    type=pa.string()))
+        else:
+            columns.append(column.cast(field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+class ParquetChunkWriter:
+    """Write processed chunks to a Parquet file, one row group per chunk.
+
+    The first chunk sets the file schema and later chunks are converted to
+    it, so a column never changes type inside the file. When a chunk does
+    not fit (a column relaxed to text, integers followed by decimals or
+    mixed object values), the column is widened to float64 or string and
+    the row groups already written are converted to the new schema.
+
+    With ``parts_dir`` (resumable saves) every chunk becomes a complete
+    Parquet file of its own in that directory, so the chunks written up to
+    a ``checkpoint`` survive a crash; ``close`` copies their row groups into
+    ``output_path``. ``resume_state`` continues from such a checkpoint.
+    """
+    def __init__(self, output_path: str, compression: str = 'snappy', parts_dir: Optional[str] = None,
+                 resume_state: Optional[dict] = None):
+        _require_pyarrow()
+        if compression not in PARQUET_COMPRESSIONS:
+            raise ValueError(f"Unsupported Parquet compression: {compression}")
+        self.output_path = output_path
+        self.compression = compression
+        self.parts_dir = parts_dir
+        self._writer = None
+        self._schema = None
+        self._parts = 0
+        if resume_state is not None:
+            self._parts = resume_state['parts']
+            for index in range(self._parts):
+                part_schema = pq.read_schema(self._part_path(index))
+                self._schema = part_schema if self._schema is None else \
+                    _widened_schema(self._schema, part_schema.types)
+            # Drop chunks written after the checkpoint
+            for name in os.listdir(self.parts_dir):
+                if name.endswith('.parquet') and int(name[5:-8]) >= self._parts:
+                    os.remove(os.path.join(self.parts_dir, name))
+
+    def _part_path(self, index: int) -> str:
+        return os.path.join(self.parts_dir, f'part-{index:06d}.parquet')
+
+    def _table(self, chunk: pd.DataFrame):
+        try:
+            return pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+        types = [_column_type(chunk.iloc[:, col_idx]) for col_idx in range(chunk.shape[1])]
+        if self._schema is None:
+            schema = pa.schema([pa.field(str(name), column_type or pa.string())
+                                for name, column_type in zip(chunk.columns, types)])
+        else:
+            schema = _widened_schema(self._schema, types)
+            if schema is not self._schema:
+                self._widen(schema)
+        return pa.Table.from_pandas(_conformed(chunk, schema), schema=schema, preserve_index=False)
+
+    def _widen(self, schema):
+        """Switch to a wider schema, converting the row groups written directly so far."""
+        self._schema = schema
+        if self._writer is None:
+            # Part files are converted when they are merged
+            return
+        self._writer.close()
+        previous_path = f"{self.output_path}.narrow"
+        os.replace(self.output_path, previous_path)
+        self._writer = pq.ParquetWriter(self.output_path, schema, compression=self.compression)
+        with pq.ParquetFile(previous_path) as previous:
+            for group in range(previous.num_row_groups):
+                table = _cast_table(previous.read_row_group(group), schema)
+                self._writer.write_table(table, row_group_size=max(table.num_rows, 1))
+        os.remove(previous_path)
+
+    def write(self, chunk: pd.DataFrame):
+        table = self._table(chunk)
+        if self._schema is None:
+            self._schema = table.schema
+        if self.parts_dir is not None:
+            pq.write_table(table, self._part_path(self._parts), compression=self.compression,
+                           row_group_size=max(len(chunk), 1))
+            self._parts += 1
+            return
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.output_path, self._schema, compression=self.compression)
+        self._writer.write_table(table, row_group_size=max(len(chunk), 1))
+
+    def checkpoint(self) -> dict:
+        """State to resume from; every chunk written so far is already a complete part file."""
+        return {'parts': self._parts}
+
+    def suspend(self):
+        """Stop without finishing the output, keeping the part files for a resumed save."""
+
+    def _merge_parts(self):
+        writer = None
+        try:
+            for index in range(self._parts):
+                part = pq.ParquetFile(self._part_path(index))
+                if writer is None:
+                    writer = pq.ParquetWriter(self.output_path, self._schema, compression=self.compression)
+                for group in range(part.num_row_groups):
+                    writer.write_table(_cast_table(part.read_row_group(group), self._schema))
+        except Exception:
+            if writer is not None:
+                writer.close()
+                os.remove(self.output_path)
+            raise
+        if writer is not None:
+            writer.close()
+
+    def close(self, commit: bool = True):
+        """Close the file. Without ``commit`` the partly written file is removed."""
+        if self.parts_dir is not None:
+            try:
+                if commit:
+                    self._merge_parts()
+            finally:
+                for index in range(self._parts):
+                    if os.path.exists(self._part_path(index)):
+                        os.remove(self._part_path(index))
+            return
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            if not commit:
+                os.remove(self.output_path)
@@ -1,4 +1,5 @@
 import re
+import logging
 import pandas as pd
 from tkinter import simpledialog, messagebox
 
@@ -18,6 +19,8 @@ from .numeric_operations import apply_round_numbers, apply_calculate_column_cons
 from .validate_inputs import apply_validation
 from .distinct_group import apply_distinct_group_encoding, preview_distinct_group
 
+logger = logging.getLogger(__name__)
+
 # Minimal texts dictionary for preview operations
 PREVIEW_TEXTS = {
     'column_not_found': "Column '{col}' not found.",
@@ -48,26 +51,127 @@ PREVIEW_TEXTS = {
     'division_by_zero': "Division by zero attempted in column '{col}'."
 }
 
-def apply_operation_to_partition(df, operation_type, operation_params):
-    """Helper function to apply operation to a partition."""
+def detect_header_rows(df):
+    """Return a boolean row mask marking rows that repeat the header line.
+
+    A row counts as a header echo when every non-empty cell equals its own
+    column name, e.g. the header lines left behind when several exports are
+    concatenated. Only text columns can hold a header value, so numeric
+    columns are compared by null-ness alone and never stringified.
+    """
+    if df.empty:
+        return pd.Series(False, index=df.index)
+
+    all_match = pd.Series(True, index=df.index)
+    any_match = pd.Series(False, index=df.index)
+    for col in df.columns:
+        values = df[col]
+        missing = values.isna()
+        if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+            matches = (values == str(col)).fillna(False).astype(bool)
+            # Columns read as raw text keep empty fields as ''
+            missing |= (values == '').fillna(False).astype(bool)
+        else:
+            matches = pd.Series(False, index=df.index)
+        all_match &= matches | missing
+        any_match |= matches
+        if not all_match.any():
+            break
+    return all_match & any_match
+
+def _apply_to_body(series, header_mask, func, **kwargs):
+    """Apply a per-cell function to every row except header echoes."""
+    if header_mask is None or not header_mask.any():
+        return series.apply(func, **kwargs)
+    result = series.astype(object)
+    body = ~header_mask
+    result[body] = series[body].apply(func, **kwargs)
+    return result
+
+def is_arrow_string(series):
+    """Return True if the series is stored as ``string[pyarrow]``."""
+    return isinstance(series.dtype, pd.StringDtype) and series.dtype.storage == 'pyarrow'
+
+def _remove_specific_kernel(series, params):
+    chars = params.get('chars_to_remove', '')
+    if not chars:
+        return None
+    return series.str.replace('[' + re.escape(chars) + ']', '', regex=True)
+
+def _find_replace_kernel(series, params):
+    find_text = params.get('find_text', '')
+    if not find_text:
+        # str.replace('') inserts between every character; keep the per-cell path
+        return None
+    return series.str.replace(find_text, params.get('replace_text', ''), regex=False)
+
+# Vectorized text operations for string[pyarrow] columns. pandas runs these on
+# Arrow compute kernels; a kernel may return None to fall back to the per-cell path.
+ARROW_TEXT_KERNELS = {
+    'op_trim': lambda s, p: s.str.strip(),
+    'op_upper': lambda s, p: s.str.upper(),
+    'op_lower': lambda s, p: s.str.lower(),
+    'op_title': lambda s, p: s.str.title(),
+    'op_find_replace': _find_replace_kernel,
+    'op_remove_specific': _remove_specific_kernel,
+    'op_remove_non_numeric': lambda s, p: s.str.replace(r'[^0-9.-]', '', regex=True),
+    'op_remove_non_alpha': lambda s, p: s.str.replace(r'[^\p{L}\s]', '', regex=True),
+}
+
+# Operations whose changed cells are highlighted, and whether they also count as modified
+_TRACKED_TEXT_OPS = {
+    'op_trim': False,
+    'op_find_replace': True,
+    'op_remove_specific': True,
+    'op_remove_non_numeric': True,
+    'op_remove_non_alpha': True,
+}
+
+def _apply_arrow_kernel(df, column, op_key, operation_params, header_mask):
+    """Run a vectorized text kernel in place. Returns False if the column isn't Arrow-backed."""
+    orig = df[column]
+    if not is_arrow_string(orig):
+        return False
+    result = ARROW_TEXT_KERNELS[op_key](orig, operation_params)
+    if result is None:
+        return False
+    if header_mask is not None and header_mask.any():
+        result = result.where(~header_mask, orig)
+    df[column] = result
+
+    if op_key in _TRACKED_TEXT_OPS:
+        changed = (orig != result).fillna(False).astype(bool)
+        if _TRACKED_TEXT_OPS[op_key]:
+            if not hasattr(df, '_modified_columns'):
+                object.__setattr__(df, '_modified_columns', {})
+            df._modified_columns[column] = changed
+        if not hasattr(df, '_styled_columns'):
+            object.__setattr__(df, '_styled_columns', {})
+        df._styled_columns[column] = changed
+    return True
+
+def apply_operation_to_partition(df, operation_type, operation_params, header_mask=None):
+    """Helper function to apply operation to a partition.
+
+    ``header_mask`` marks rows that repeat the header line (see
+    ``detect_header_rows``). Chunk readers compute it once per chunk; when it
+    is not supplied it is detected here so preview callers keep working.
+    """
     try:
-        print(f"DEBUG: apply_operation_to_partition called with operation_type='{operation_type}'")
-        print(f"DEBUG: operation_params: {operation_params}")
-        print(f"DEBUG: DataFrame shape: {df.shape}")
-        
         if operation_type == 'column_operation':
             op_key = operation_params.get('key')
-            
-            print(f"DEBUG: Processing operation '{op_key}'")
-            
+
+            if header_mask is None:
+                header_mask = detect_header_rows(df)
+            else:
+                header_mask = header_mask.reindex(df.index, fill_value=False)
+            logger.debug("Applying %s to %s (%d rows)", op_key, operation_params.get('column'), len(df))
+
             # Create a copy of the dataframe to avoid modifying the original
-            print(f"DEBUG: Creating DataFrame copy...")
             df = df.copy()
-            print(f"DEBUG: DataFrame copy created successfully")
             
             # Handle operations that don't use a single column parameter
             if op_key == "op_concatenate":
-                print(f"DEBUG: Applying concatenate operation")
                 from operations.concatenate import apply_concatenate
                 cols_to_concat = operation_params.get('cols_to_concat', [])
                 separator = operation_params.get('separator', '')
@@ -84,29 +188,22 @@ def apply_operation_to_partition(df, operation_type, operation_params):
             else:
                 # For all other operations, get the column parameter
                 column = operation_params.get('column')
-                
-                print(f"DEBUG: Processing column '{column}' with operation '{op_key}'")
-                
+
                 # Check if column exists in DataFrame
                 if column not in df.columns:
                     raise KeyError(f"Column '{column}' not found in the DataFrame.")
-            
-                # Create a copy of the dataframe to avoid modifying the original
-                print(f"DEBUG: Creating DataFrame copy...")
-                df = df.copy()
-                print(f"DEBUG: DataFrame copy created successfully")
-                
+
                 # Import necessary functions based on operation type
-                if op_key == "op_mask":
-                    print(f"DEBUG: Applying mask operation")
+                if op_key in ARROW_TEXT_KERNELS and _apply_arrow_kernel(df, column, op_key, operation_params, header_mask):
+                    logger.debug("Applied Arrow compute kernel for %s", op_key)
+                elif op_key == "op_mask":
                     from operations.masking import mask_data
-                    df[column] = df[column].astype(str).apply(mask_data, column_name=column)
+                    df[column] = _apply_to_body(df[column].astype(str), header_mask, mask_data)
                 elif op_key == "op_mask_email":
-                    print(f"DEBUG: Applying email mask operation")
                     from operations.masking import mask_data
                     invalid_mask = pd.Series(False, index=df.index)
-                    result_series = df[column].astype(str).apply(
-                        lambda x: mask_data(x, mode='email', column_name=column, track_invalid=True)
+                    result_series = _apply_to_body(
+                        df[column].astype(str), header_mask, mask_data, mode='email', track_invalid=True
                     )
                     df[column] = result_series.apply(lambda x: x[0] if isinstance(x, tuple) else x)
                     invalid_mask = result_series.apply(lambda x: isinstance(x, tuple) and not x[1])
@@ -114,36 +211,30 @@ def apply_operation_to_partition(df, operation_type, operation_params):
                         object.__setattr__(df, '_styled_columns', {})
                     df._styled_columns[column] = invalid_mask
                 elif op_key == "op_mask_words":
-                    print(f"DEBUG: Applying word mask operation")
                     from operations.masking import mask_words
-                    df[column] = df[column].astype(str).apply(mask_words, column_name=column)
+                    df[column] = _apply_to_body(df[column].astype(str), header_mask, mask_words)
                 elif op_key == "op_trim":
-                    print(f"DEBUG: Applying trim operation")
                     from operations.trimming import trim_spaces
                     orig = df[column].astype(str)
-                    df[column] = orig.apply(trim_spaces, column_name=column)
+                    df[column] = _apply_to_body(orig, header_mask, trim_spaces)
                     # Track changes for highlighting
                     changed = orig != df[column]
                     if not hasattr(df, '_styled_columns'):
                         object.__setattr__(df, '_styled_columns', {})
                     df._styled_columns[column] = changed
                 elif op_key == "op_upper":
-                    print(f"DEBUG: Applying upper case operation")
                     from operations.case_change import change_case
-                    df[column] = df[column].astype(str).apply(change_case, case_type='upper', column_name=column)
+                    df[column] = _apply_to_body(df[column].astype(str), header_mask, change_case, case_type='upper')
                 elif op_key == "op_lower":
-                    print(f"DEBUG: Applying lower case operation")
                     from operations.case_change import change_case
-                    df[column] = df[column].astype(str).apply(change_case, case_type='lower', column_name=column)
+                    df[column] = _apply_to_body(df[column].astype(str), header_mask, change_case, case_type='lower')
                 elif op_key == "op_title":
-                    print(f"DEBUG: Applying title case operation")
                     from operations.case_change import change_case
-                    df[column] = df[column].astype(str).apply(change_case, case_type='title', column_name=column)
+                    df[column] = _apply_to_body(df[column].astype(str), header_mask, change_case, case_type='title')
                 elif op_key == "op_remove_non_numeric":
-                    print(f"DEBUG: Applying remove non-numeric operation")
                     from operations.remove_chars import remove_chars
                     orig = df[column].astype(str)
-                    result_series = orig.apply(remove_chars, mode='non_numeric', column_name=column)
+                    result_series = _apply_to_body(orig, header_mask, remove_chars, mode='non_numeric')
                     
                     # Extract the modified values and change tracking
                     df[column] = result_series.apply(lambda x: x[0] if isinstance(x, tuple) else x)
@@ -159,10 +250,9 @@ def apply_operation_to_partition(df, operation_type, operation_params):
                         object.__setattr__(df, '_styled_columns', {})
                     df._styled_columns[column] = changed
                 elif op_key == "op_remove_non_alpha":
-                    print(f"DEBUG: Applying remove non-alphabetic operation")
                     from operations.remove_chars import remove_chars
                     orig = df[column].astype(str)
-                    result_series = orig.apply(remove_chars, mode='non_alphabetic', column_name=column)
+                    result_series = _apply_to_body(orig, header_mask, remove_chars, mode='non_alphabetic')
                     
                     # Extract the modified values and change tracking
                     df[column] = result_series.apply(lambda x: x[0] if isinstance(x, tuple) else x)
@@ -178,14 +268,13 @@ def apply_operation_to_partition(df, operation_type, operation_params):
                         object.__setattr__(df, '_styled_columns', {})
                     df._styled_columns[column] = changed
                 elif op_key == "op_find_replace":
-                    print(f"DEBUG: Applying find/replace operation")
                     from operations.find_replace import find_replace
                     find_text = operation_params.get('find_text', '')
                     replace_text = operation_params.get('replace_text', '')
                     
                     # Apply find_replace and track changes
                     orig = df[column].astype(str)
-                    result_series = orig.apply(find_replace, find_text=find_text, replace_text=replace_text, column_name=column)
+                    result_series = _apply_to_body(orig, header_mask, find_replace, find_text=find_text, replace_text=replace_text)
                     
                     # Extract the modified values and change tracking
                     df[column] = result_series.apply(lambda x: x[0] if isinstance(x, tuple) else x)
@@ -201,33 +290,28 @@ def apply_operation_to_partition(df, operation_type, operation_params):
                         object.__setattr__(df, '_styled_columns', {})
                     df._styled_columns[column] = changed
                 elif op_key == "op_split_delimiter":
-                    print(f"DEBUG: Applying split by delimiter operation")
                     delimiter = operation_params.get('delimiter', '')
-                    print(f"DEBUG: Delimiter parameter: '{delimiter}'")
+                    logger.debug("Split delimiter: %r", delimiter)
                     from operations.splitting import apply_split_by_delimiter
                     modified_df, result = apply_split_by_delimiter(df, column, delimiter, PREVIEW_TEXTS)
                     if result[0] == 'success':
                         df = modified_df
-                        print(f"DEBUG: Split operation successful")
                     else:
-                        print(f"DEBUG: Split operation failed: {result[1]}")
                         raise Exception(result[1])
                 elif op_key == "op_split_surname":
-                    print(f"DEBUG: Applying split surname operation")
                     from operations.splitting import apply_split_surname
-                    modified_df, result = apply_split_surname(df, column, PREVIEW_TEXTS)
+                    modified_df, result = apply_split_surname(df, column, PREVIEW_TEXTS, header_mask)
                     if result[0] == 'success':
                         df = modified_df
                     else:
                         raise Exception(result[1])
                 elif op_key == "op_remove_specific":
-                    print(f"DEBUG: Applying remove specific characters operation")
                     from operations.remove_chars import remove_chars
                     chars_to_remove = operation_params.get('chars_to_remove', '')
                     
                     # Apply remove_chars and track changes
                     orig = df[column].astype(str)
-                    result_series = orig.apply(remove_chars, mode='specific', chars_to_remove=chars_to_remove, column_name=column)
+                    result_series = _apply_to_body(orig, header_mask, remove_chars, mode='specific', chars_to_remove=chars_to_remove)
                     
                     # Extract the modified values and change tracking
                     df[column] = result_series.apply(lambda x: x[0] if isinstance(x, tuple) else x)
@@ -243,12 +327,18 @@ def apply_operation_to_partition(df, operation_type, operation_params):
                         object.__setattr__(df, '_styled_columns', {})
                     df._styled_columns[column] = changed
                 elif op_key == "op_fill_missing":
-                    print(f"DEBUG: Applying fill missing operation")
                     from operations.fill_missing import fill_missing
                     fill_value = operation_params.get('fill_value', '')
-                    df[column] = df[column].apply(fill_missing, fill_value=fill_value, column_name=column)
+                    numeric_fill = pd.to_numeric(pd.Series([fill_value]), errors='coerce').iloc[0]
+                    if pd.api.types.is_numeric_dtype(df[column]) and pd.notna(numeric_fill):
+                        # Numeric column and numeric fill value: keep the native dtype
+                        try:
+                            df[column] = df[column].fillna(numeric_fill)
+                        except (TypeError, ValueError):
+                            df[column] = df[column].apply(fill_missing, fill_value=fill_value)
+                    else:
+                        df[column] = df[column].apply(fill_missing, fill_value=fill_value)
                 elif op_key == "op_extract_pattern":
-                    print(f"DEBUG: Applying extract pattern operation")
                     from operations.extract_pattern import apply_extract_pattern
                     pattern = operation_params.get('pattern', '')
                     new_col_name = operation_params.get('new_col_name', '')
@@ -256,14 +346,12 @@ def apply_operation_to_partition(df, operation_type, operation_params):
                     if result[0] != 'success':
                         raise Exception(result[1])
                 elif op_key.startswith("op_validate_"):
-                    print(f"DEBUG: Applying validation operation")
                     from operations.validate_inputs import apply_validation
                     validation_type = op_key.replace("op_validate_", "")
-                    df, result = apply_validation(df, column, validation_type, PREVIEW_TEXTS)
+                    df, result = apply_validation(df, column, validation_type, PREVIEW_TEXTS, header_mask)
                     if result[0] != 'success':
                         raise Exception(result[1])
                 elif op_key == "op_mark_duplicates":
-                    print(f"DEBUG: Applying mark duplicates operation")
                     from operations.duplicates import apply_mark_duplicates
                     new_col_name = ""  # Not used in mark duplicates
                     selected_columns = operation_params.get('selected_columns', None)
@@ -271,39 +359,33 @@ def apply_operation_to_partition(df, operation_type, operation_params):
                     if result[0] != 'success':
                         raise Exception(result[1])
                 elif op_key == "op_remove_duplicates":
-                    print(f"DEBUG: Applying remove duplicates operation")
                     from operations.duplicates import apply_remove_duplicates
                     df, result = apply_remove_duplicates(df, column, PREVIEW_TEXTS)
                     if result[0] != 'success':
                         raise Exception(result[1])
                 elif op_key == "op_distinct_group":
-                    print(f"DEBUG: Applying distinct group operation")
                     from operations.distinct_group import apply_distinct_group_encoding
                     df, metadata = apply_distinct_group_encoding(df, column)
                 elif op_key == "op_rename_column":
-                    print(f"DEBUG: Applying rename column operation")
                     from operations.rename_column import apply_rename_column
                     new_col_name = operation_params.get('new_col_name', '')
                     df, result = apply_rename_column(df, column, new_col_name, PREVIEW_TEXTS)
                     if result[0] != 'success':
                         raise Exception(result[1])
                 elif op_key == 'op_round_numbers':
-                    print(f"DEBUG: Applying round numbers operation")
                     from operations.numeric_operations import apply_round_numbers
                     decimals = operation_params.get('decimals', 2)  # Default to 2 decimal places
-                    df, result = apply_round_numbers(df, column, decimals, PREVIEW_TEXTS)
+                    df, result = apply_round_numbers(df, column, decimals, PREVIEW_TEXTS, header_mask)
                     if result[0] != 'success':
                         raise Exception(result[1])
                 elif op_key == 'op_calculate_column_constant':
-                    print(f"DEBUG: Applying calculate column constant operation")
                     from operations.numeric_operations import apply_calculate_column_constant
                     operation_type = operation_params.get('operation', '+')
                     constant_value = operation_params.get('constant_value', 0)
-                    df, result = apply_calculate_column_constant(df, column, operation_type, constant_value, PREVIEW_TEXTS)
+                    df, result = apply_calculate_column_constant(df, column, operation_type, constant_value, PREVIEW_TEXTS, header_mask)
                     if result[0] != 'success':
                         raise Exception(result[1])
                 elif op_key == 'op_create_calculated_column':
-                    print(f"DEBUG: Applying create calculated column operation")
                     from operations.numeric_operations import apply_create_calculated_column
                     col1_name = operation_params.get('col1_name', column)
                     col2_name = operation_params.get('col2_name', '')
@@ -313,15 +395,12 @@ def apply_operation_to_partition(df, operation_type, operation_params):
                     if result[0] != 'success':
                         raise Exception(result[1])
                 else:
-                    print(f"WARNING: Unknown operation key: {op_key}")
-                
-        print(f"DEBUG: Operation completed successfully, returning DataFrame with shape: {df.shape}")
+                    logger.warning("Unknown operation key: %s", op_key)
+
         return df
         
     except Exception as e:
-        print(f"FATAL ERROR in apply_operation_to_partition: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("apply_operation_to_partition failed for %s", operation_params, exc_info=True)
         raise Exception(f"Failed to apply operation: {e}")
 
 def generate_preview(app, op_key, selected_col, current_preview_df, PREVIEW_ROWS, operation_params=None):
@@ -0,0 +1,174 @@
+# operations/profiling.py
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+# Environment variable selecting the profiler: "<scope>[:<mode>]", e.g. "operation" or "chunk:sampling"
+PROFILE_VARIABLE = 'EXCELTABLETOOLS_PROFILE'
+
+# What one profile covers: every operation on its own, or whole chunks
+PROFILE_SCOPES = ('operation', 'chunk')
+# cProfile (exact call counts, slows Python-heavy kernels) or periodic stack samples
+PROFILE_MODES = ('deterministic', 'sampling')
+
+# Seconds between stack samples
+DEFAULT_SAMPLE_INTERVAL = 0.005
+# Functions listed in the hotspots summary
+HOTSPOT_COUNT = 30
+
+def profile_settings(value: Optional[str]) -> Tuple[Optional[str], str]:
+    """Parse a profile switch such as ``"operation:sampling"`` into (scope, mode)."""
+    if not value:
+        return None, 'deterministic'
+    scope, _, mode = value.strip().lower().partition(':')
+    mode = mode or 'deterministic'
+    if scope not in PROFILE_SCOPES or mode not in PROFILE_MODES:
+        raise ValueError(f"Unsupported profile setting: {value}")
+    return scope, mode
+
+def profile_dir(output_path: str) -> str:
+    """Directory receiving the profiles of a save, kept next to its (first) output."""
+    return f"{output_path}.profile"
+
+def _file_name(label: str) -> str:
+    return re.sub(r'[^\w.-]+', '_', label) + '.pstats'
+
+class DeterministicProfiler:
+    """One ``cProfile`` profile per section label, accumulated over every chunk."""
+    def __init__(self):
+        self._profiles: Dict[str, cProfile.Profile] = {}
+
+    @contextmanager
+    def section(self, label: str):
+        profile = self._profiles.setdefault(label, cProfile.Profile())
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+
+    def stop(self):
+        pass
+
+    def dump(self, directory: str) -> Dict[str, str]:
+        """Write one ``.pstats`` file per section; returns label -> path."""
+        paths = {}
+        for label, profile in self._profiles.items():
+            paths[label] = os.path.join(directory, _file_name(label))
+            profile.dump_stats(paths[label])
+        return paths
+
+class SamplingProfiler:
+    """Sample the stack of the profiled thread every ``interval`` seconds.
+
+    A background thread reads the frames of the thread that entered the
+    current section, so the profiled code runs at full speed. Each sample
+    stands for the time since the previous one (waiting for the GIL makes
+    that longer than ``interval``). The samples are written in the
+    ``pstats`` layout, with sample counts as call counts.
+    """
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self._label = None
+        self._thread_id = None
+        # label -> function -> [samples, own seconds, cumulative seconds, {caller: samples}]
+        self._stats = defaultdict(lambda: defaultdict(lambda: [0, 0.0, 0.0, defaultdict(int)]))
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+        self._thread.start()
+
+    @contextmanager
+    def section(self, label: str):
+        previous = self._label, self._thread_id
+        self._thread_id = threading.get_ident()
+        self._label = label
+        try:
+            yield
+        finally:
+            self._label, self._thread_id = previous
+
+    def _run(self):
+        previous = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            now = time.perf_counter()
+            elapsed, previous = now - previous, now
+            label = self._label
+            frame = sys._current_frames().get(self._thread_id)
+            if label is None or frame is None:
+                continue
+            stats = self._stats[label]
+            callee = None
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_filename, code.co_firstlineno, code.co_name)
+                entry = stats[key]
+                if callee is None:
+                    entry[1] += elapsed
+                else:
+                    stats[callee][3][key] += 1
+                if key not in seen:
+                    # Recursive functions count once per sample
+                    entry[0] += 1
+                    entry[2] += elapsed
+                    seen.add(key)
+                callee = key
+                frame = frame.f_back
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def dump(self, directory: str) -> Dict[str, str]:
+        """Write one ``.pstats`` file per section; returns label -> path."""
+        paths = {}
+        for label, stats in list(self._stats.items()):
+            converted = {
+                key: (samples, samples, own, cumulative, dict(callers))
+                for key, (samples, own, cumulative, callers) in stats.items()
+            }
+            paths[label] = os.path.join(directory, _file_name(label))
+            with open(paths[label], 'wb') as f:
+                marshal.dump(converted, f)
+        return paths
+
+def make_profiler(mode: str):
+    if mode == 'sampling':
+        return SamplingProfiler()
+    return DeterministicProfiler()
+
+def write_profiles(profiler, directory: str, top: int = HOTSPOT_COUNT) -> Optional[str]:
+    """Stop ``profiler``, write its ``.pstats`` files and a merged hotspots summary.
+
+    Returns the summary path, or None when nothing was profiled.
+    """
+    profiler.stop()
+    if os.path.isdir(directory):
+        # Profiles of an earlier save to the same output
+        for name in os.listdir(directory):
+            if name.endswith('.pstats') or name == 'hotspots.txt':
+                os.remove(os.path.join(directory, name))
+    os.makedirs(directory, exist_ok=True)
+    paths = profiler.dump(directory)
+    if not paths:
+        return None
+    text = io.StringIO()
+    text.write("Time per profiled section\n")
+    for label, path in paths.items():
+        text.write(f"  {pstats.Stats(path).total_tt:10.3f}s  {label}\n")
+    text.write(f"\nTop {top} functions over all sections by own time\n")
+    merged = pstats.Stats(*paths.values(), stream=text)
+    merged.sort_stats('tottime').print_stats(top)
+    summary = os.path.join(directory, 'hotspots.txt')
+    with open(summary, 'w', encoding='utf-8') as f:
+        f.write(text.getvalue())
+    return summary
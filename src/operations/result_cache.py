@@ -0,0 +1,271 @@
+# operations/result_cache.py
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # the cache is skipped without pyarrow
+    pa = None
+
+def _user_cache_root() -> str:
+    if os.name == 'nt':
+        return os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    return os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+
+# Suggested location (per user, never a shared temp directory) and size cap of the on-disk cache
+DEFAULT_CACHE_DIR = os.path.join(_user_cache_root(), 'ExcelTableTools', 'result_cache')
+DEFAULT_CACHE_BYTES = 2 << 30
+
+# Extra columns holding the per-chunk masks next to the data
+_HEADER_COLUMN = '__cache_header_row__'
+_MASK_PREFIXES = {'_styled_columns': '__cache_styled__:', '_modified_columns': '__cache_modified__:'}
+_META_FILE = 'meta.json'
+# Schema metadata listing the columns stored as tagged text (object columns
+# with mixed values) and the string columns backed by Arrow, which pandas
+# restores as Python strings
+_COLUMNS_KEY = b'cache_columns'
+
+# Value type -> (tag, encoder) for mixed object columns; each value is stored
+# as "<tag>:<text>" and decoded by _DECODERS[tag]
+_ENCODERS = {
+    str: ('s', str),
+    bool: ('b', str),
+    np.bool_: ('B', str),
+    int: ('i', str),
+    np.int64: ('I', str),
+    float: ('f', repr),
+    np.float64: ('F', repr),
+    type(None): ('n', lambda value: ''),
+    type(pd.NA): ('a', lambda value: ''),
+    type(pd.NaT): ('t', lambda value: ''),
+    pd.Timestamp: ('T', lambda value: value.isoformat()),
+    datetime: ('d', lambda value: value.isoformat()),
+    date: ('D', lambda value: value.isoformat()),
+}
+_DECODERS = {
+    's': str,
+    'b': lambda text: text == 'True',
+    'B': lambda text: np.bool_(text == 'True'),
+    'i': int,
+    'I': lambda text: np.int64(int(text)),
+    'f': float,
+    'F': lambda text: np.float64(float(text)),
+    'n': lambda text: None,
+    'a': lambda text: pd.NA,
+    't': lambda text: pd.NaT,
+    'T': pd.Timestamp,
+    'd': datetime.fromisoformat,
+    'D': date.fromisoformat,
+}
+
+def _encode_mixed(column: pd.Series) -> List[str]:
+    """Tag every value with its type; raises TypeError for types the cache doesn't store."""
+    encoded = []
+    for value in column:
+        try:
+            tag, encode = _ENCODERS[type(value)]
+        except KeyError:
+            raise TypeError(f"Can't cache values of type {type(value).__name__}") from None
+        encoded.append(f'{tag}:{encode(value)}')
+    return encoded
+
+def _decode_mixed(column: pd.Series) -> List[Any]:
+    return [_DECODERS[text[0]](text[2:]) for text in column]
+
+def prefix_keys(base: Dict[str, Any], operations: List[Dict[str, Any]]) -> List[str]:
+    """Cache key of every operation prefix; ``keys[k]`` identifies the result of the first ``k`` operations."""
+    keys = []
+    digest = hashlib.sha256(json.dumps(base, sort_keys=True, default=str).encode('utf-8'))
+    keys.append(digest.hexdigest())
+    for op in operations:
+        digest.update(json.dumps(op, sort_keys=True, default=str).encode('utf-8'))
+        keys.append(digest.hexdigest())
+    return keys
+
+def _arrow_table(chunk: pd.DataFrame):
+    """Convert a chunk losslessly; object columns Arrow can't type (mixed values) become tagged text."""
+    columns = {
+        'mixed': [],
+        'arrow_strings': [str(col) for col, dtype in chunk.dtypes.items()
+                          if isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow'],
+    }
+    try:
+        table = pa.Table.from_pandas(chunk, preserve_index=True)
+    except (pa.ArrowException, TypeError, ValueError):
+        data = chunk.copy(deep=False)
+        for col_idx in range(chunk.shape[1]):
+            column = chunk.iloc[:, col_idx]
+            if column.dtype != object:
+                continue
+            try:
+                pa.array(column, from_pandas=True)
+            except (pa.ArrowException, TypeError, ValueError):
+                data.isetitem(col_idx, _encode_mixed(column))
+                columns['mixed'].append(str(chunk.columns[col_idx]))
+        table = pa.Table.from_pandas(data, preserve_index=True)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_COLUMNS_KEY] = json.dumps(columns).encode('utf-8')
+    return table.replace_schema_metadata(metadata)
+
+def _to_table(chunk: pd.DataFrame, header_mask: Optional[pd.Series]):
+    table = _arrow_table(chunk)
+    if header_mask is None:
+        header = np.zeros(len(chunk), dtype=bool)
+    else:
+        # Operations may drop rows, so align the input mask with what is left
+        header = header_mask.reindex(chunk.index, fill_value=False).to_numpy(dtype=bool)
+    table = table.append_column(_HEADER_COLUMN, pa.array(header))
+    for attr, prefix in _MASK_PREFIXES.items():
+        for col, mask in getattr(chunk, attr, {}).items():
+            values = pd.Series(mask).fillna(False).to_numpy(dtype=bool)
+            if len(values) == len(chunk):
+                table = table.append_column(f'{prefix}{col}', pa.array(values))
+    return table
+
+def _from_table(table) -> Tuple[pd.DataFrame, pd.Series]:
+    names = table.column_names
+    extra = [name for name in names
+             if name == _HEADER_COLUMN or any(name.startswith(p) for p in _MASK_PREFIXES.values())]
+    masks = {name: table.column(name).to_numpy(zero_copy_only=False) for name in extra}
+    chunk = table.select([name for name in names if name not in extra]).to_pandas()
+    columns = json.loads(table.schema.metadata[_COLUMNS_KEY])
+    for col in columns['mixed']:
+        chunk[col] = pd.Series(_decode_mixed(chunk[col]), index=chunk.index, dtype=object)
+    for col in columns['arrow_strings']:
+        chunk[col] = chunk[col].astype(pd.StringDtype('pyarrow'))
+    header_mask = pd.Series(masks.pop(_HEADER_COLUMN), index=chunk.index)
+    for attr, prefix in _MASK_PREFIXES.items():
+        found = {name[len(prefix):]: values for name, values in masks.items() if name.startswith(prefix)}
+        if found:
+            object.__setattr__(chunk, attr, found)
+    return chunk, header_mask
+
+class CacheEntryWriter:
+    """Write the processed chunks of one save as an entry; abandoned if it outgrows ``max_bytes``."""
+    def __init__(self, cache: 'ResultCache', key: str, input_columns: List[str]):
+        self.cache = cache
+        self.key = key
+        self.path = os.path.join(cache.directory, key)
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.makedirs(self.path)
+        self._meta = {'input_columns': [str(c) for c in input_columns], 'chunk_rows': []}
+        self._bytes = 0
+        self.active = True
+
+    def write(self, chunk: pd.DataFrame, header_mask: Optional[pd.Series], input_rows: int):
+        """Store one processed chunk; ``input_rows`` is the number of input rows it came from."""
+        if not self.active:
+            return
+        path = os.path.join(self.path, f'chunk-{len(self._meta["chunk_rows"]):06d}.arrow')
+        try:
+            table = _to_table(chunk, header_mask)
+            with pa.OSFile(path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        except (pa.ArrowException, TypeError, ValueError, OSError):
+            # Values that can't be stored or a full disk: skip caching
+            self.abandon()
+            return
+        self._meta['chunk_rows'].append(input_rows)
+        self._bytes += os.path.getsize(path)
+        if self._bytes > self.cache.max_bytes:
+            self.abandon()
+
+    def commit(self):
+        """Mark the entry complete and make room for it under the size cap."""
+        if not self.active:
+            return
+        with open(os.path.join(self.path, _META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(self._meta, f)
+        self.active = False
+        self.cache.evict(keep=self.key)
+
+    def abandon(self):
+        self.active = False
+        shutil.rmtree(self.path, ignore_errors=True)
+
+class ResultCache:
+    """On-disk cache of processed chunks, one entry per (input, operation prefix).
+
+    Chunks are stored as uncompressed Arrow IPC files, read back through a
+    memory map, together with the repeated-header mask and the highlight
+    masks. Entries are evicted least recently used first once the cache
+    holds more than ``max_bytes``.
+
+    The directory is kept private to the current user (mode 0700); one
+    owned by someone else is refused with PermissionError, since cached
+    chunks are read back into saves.
+    """
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_BYTES):
+        if pa is None:
+            raise ImportError("The result cache requires pyarrow to be installed.")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if hasattr(os, 'getuid'):
+            if os.stat(directory).st_uid != os.getuid():
+                raise PermissionError(f"Result cache directory {directory} belongs to another user")
+            os.chmod(directory, 0o700)
+
+    def _meta(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.directory, key, _META_FILE), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def longest_prefix(self, keys: List[str]) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Return (number of operations, entry metadata) of the longest cached prefix, or (0, None)."""
+        for count in range(len(keys) - 1, 0, -1):
+            meta = self._meta(keys[count])
+            if meta is not None:
+                # Touch the entry so eviction sees it as recently used
+                os.utime(os.path.join(self.directory, keys[count], _META_FILE))
+                return count, meta
+        return 0, None
+
+    def read(self, key: str, meta: Dict[str, Any]) -> Iterator[Tuple[pd.DataFrame, pd.Series, int]]:
+        """Yield (chunk, header mask, input rows) for every chunk of an entry."""
+        for index, input_rows in enumerate(meta['chunk_rows']):
+            path = os.path.join(self.directory, key, f'chunk-{index:06d}.arrow')
+            with pa.memory_map(path, 'r') as source:
+                table = pa.ipc.open_file(source).read_all()
+            chunk, header_mask = _from_table(table)
+            yield chunk, header_mask, input_rows
+
+    def writer(self, key: str, input_columns: List[str]) -> CacheEntryWriter:
+        return CacheEntryWriter(self, key, input_columns)
+
+    def evict(self, keep: Optional[str] = None):
+        """Remove least recently used entries (and leftovers of unfinished ones) above ``max_bytes``."""
+        entries = []
+        for key in os.listdir(self.directory):
+            path = os.path.join(self.directory, key)
+            if not os.path.isdir(path):
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+            meta_path = os.path.join(path, _META_FILE)
+            if os.path.exists(meta_path):
+                used = os.path.getmtime(meta_path)
+            elif time.time() - os.path.getmtime(path) > 24 * 3600:
+                # An entry nobody finished writing within a day
+                used = float('-inf')
+            else:
+                used = os.path.getmtime(path)
+            entries.append((used, key, size))
+        total = sum(size for _, _, size in entries)
+        for used, key, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+            total -= size
@@ -0,0 +1,140 @@
+# operations/run_metrics.py
+import logging
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+import psutil
+
+from .tracing import span
+
+# Environment variable read by configure_logging (DEBUG, INFO, WARNING, ...)
+LOG_LEVEL_VARIABLE = 'EXCELTABLETOOLS_LOG_LEVEL'
+
+def configure_logging(level: Optional[str] = None):
+    """Log to stderr at ``level`` (default: the environment variable, else WARNING)."""
+    level = (level or os.environ.get(LOG_LEVEL_VARIABLE) or 'WARNING').upper()
+    logging.basicConfig(level=getattr(logging, level, logging.WARNING),
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+def report_path(output_path: str) -> str:
+    """Run report of a save, kept next to its (first) output."""
+    return f"{output_path}.report.json"
+
+def cells_changed(before: pd.DataFrame, after: pd.DataFrame, column: Optional[str]) -> int:
+    """Cells an operation changed: differing values in ``column`` plus the cells of added columns."""
+    added = len([col for col in after.columns if col not in before.columns]) * len(after)
+    if column is None or column not in before.columns or column not in after.columns:
+        return added
+    old = before[column]
+    new = after[column]
+    if old is new:
+        return added
+    if not old.index.equals(new.index):
+        # Operations that drop rows: compare the rows that are left
+        old = old.reindex(new.index)
+    # Plain object arrays compare much faster than pandas' NA-aware ``==``
+    old_values = old.to_numpy(dtype=object)
+    new_values = new.to_numpy(dtype=object)
+    try:
+        differs = ~np.asarray(old_values == new_values, dtype=bool)
+    except (TypeError, ValueError):
+        # pd.NA has no truth value: compare the present values only
+        present = ~(pd.isna(old_values) | pd.isna(new_values))
+        differs = np.ones(len(new_values), dtype=bool)
+        differs[present] = ~np.asarray(old_values[present] == new_values[present], dtype=bool)
+    # Missing on both sides is no change, although NaN != NaN
+    changed = np.flatnonzero(differs)
+    was_missing = changed[pd.isna(old_values[changed])]
+    differs[was_missing[pd.isna(new_values[was_missing])]] = False
+    return added + int(differs.sum())
+
+class RunMetrics:
+    """Collect wall time, row counts, changed cells and peak RSS of one save.
+
+    Stages (reading, processing, writing, ...) and operations are timed
+    separately; peak RSS is the largest resident set size sampled at the end
+    of a stage or operation. ``report`` returns everything as a JSON-ready dict.
+    Counting changed cells compares each operation's column before and after
+    it; ``count_cells=False`` skips that.
+    """
+    def __init__(self, input_path: str, output_paths: List[str], count_cells: bool = True):
+        self.count_cells = count_cells
+        self._process = psutil.Process()
+        self._start = time.perf_counter()
+        self.info = {
+            'input': input_path,
+            'outputs': list(output_paths),
+            'started': datetime.now().isoformat(timespec='seconds'),
+            'status': 'running',
+        }
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.operations: Dict[int, Dict[str, Any]] = {}
+        self.peak_rss = 0
+
+    def _rss(self) -> int:
+        rss = self._process.memory_info().rss
+        self.peak_rss = max(self.peak_rss, rss)
+        return rss
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block as one call of stage ``name`` (and trace it as a span)."""
+        start = time.perf_counter()
+        try:
+            with span(name, 'stage'):
+                yield
+        finally:
+            entry = self.stages.setdefault(name, {'calls': 0, 'seconds': 0.0, 'peak_rss_bytes': 0})
+            entry['calls'] += 1
+            entry['seconds'] += time.perf_counter() - start
+            entry['peak_rss_bytes'] = max(entry['peak_rss_bytes'], self._rss())
+
+    def timed(self, name: str, iterable: Iterable) -> Iterator:
+        """Iterate ``iterable``, timing every ``next`` as stage ``name``."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def operation(self, index: int, op: Dict[str, Any]) -> Dict[str, Any]:
+        """The report entry of operation ``index``."""
+        return self.operations.setdefault(index, {
+            'index': index, 'key': op.get('key'), 'column': op.get('column'), 'cached': False,
+            'calls': 0, 'seconds': 0.0, 'rows_in': 0, 'rows_out': 0,
+            'cells_changed': 0 if self.count_cells else None, 'peak_rss_bytes': 0,
+        })
+
+    def record_operation(self, index: int, op: Dict[str, Any], seconds: float,
+                         before: pd.DataFrame, after: pd.DataFrame):
+        """Add one chunk's run of operation ``index``."""
+        entry = self.operation(index, op)
+        entry['calls'] += 1
+        entry['seconds'] += seconds
+        entry['rows_in'] += len(before)
+        entry['rows_out'] += len(after)
+        if self.count_cells:
+            entry['cells_changed'] += cells_changed(before, after, op.get('column'))
+        entry['peak_rss_bytes'] = max(entry['peak_rss_bytes'], self._rss())
+
+    def finish(self, status: str, **info):
+        self.info['status'] = status
+        self.info.update(info)
+
+    def report(self) -> Dict[str, Any]:
+        return dict(
+            self.info,
+            wall_seconds=round(time.perf_counter() - self._start, 6),
+            peak_rss_bytes=max(self.peak_rss, self._rss()),
+            stages={name: dict(entry, seconds=round(entry['seconds'], 6)) for name, entry in self.stages.items()},
+            operations=[dict(entry, seconds=round(entry['seconds'], 6))
+                        for _, entry in sorted(self.operations.items())],
+        )
@@ -0,0 +1,153 @@
+# operations/schema_inference.py
+import re
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+
+# Rows read from the top of the file to decide the column types
+DEFAULT_SAMPLE_ROWS = 50000
+
+# Dtype for columns carried through verbatim: no NA detection, no parsing
+RAW_TEXT_DTYPE = 'str'
+
+# Dtypes that parse values and can therefore fail on unexpected text
+TYPED_DTYPES = ('Int64', 'Float64', 'boolean')
+
+# Column names that usually hold identifiers rather than quantities
+ID_NAME_PATTERN = re.compile(
+    r'(^|[\s_\-.])(id|ids|code|zip|postcode|postal|phone|tel|gsm|iban|account|sku|tckn|vkn)([\s_\-.]|$)',
+    re.IGNORECASE
+)
+
+def is_id_like(column_name, values: Optional[pd.Series] = None) -> bool:
+    """Return True if a column looks like it holds identifiers.
+
+    A column is ID-like when its name says so (``customer_id``, ``Zip Code``)
+    or when any sampled value has a leading zero that a numeric dtype would
+    drop (``00123``).
+    """
+    if ID_NAME_PATTERN.search(str(column_name)):
+        return True
+    if values is not None and not values.empty:
+        return bool(values.str.match(r'^[+-]?0\d').any())
+    return False
+
+def _infer_column_dtype(values: pd.Series) -> str:
+    """Pick a nullable dtype for a column from its sampled text values."""
+    values = values.dropna()
+    if values.empty:
+        # Nothing to go on; text accepts whatever later rows contain
+        return 'string'
+
+    lowered = values.str.strip().str.lower()
+    if lowered.isin(['true', 'false']).all():
+        return 'boolean'
+
+    numeric = pd.to_numeric(values, errors='coerce')
+    if numeric.isna().any():
+        return 'string'
+    if pd.api.types.is_integer_dtype(numeric) and numeric.dtype != 'uint64':
+        return 'Int64'
+    if pd.api.types.is_float_dtype(numeric):
+        return 'Float64'
+    return 'string'
+
+def drop_header_echoes(sample: pd.DataFrame) -> pd.DataFrame:
+    """Drop rows of a text sample that repeat the header line.
+
+    A row is a header echo when every non-empty value equals its own column
+    name (the header lines left behind when exports are concatenated);
+    judging types on them would turn every column into text.
+    """
+    if sample.empty:
+        return sample
+    all_match = pd.Series(True, index=sample.index)
+    any_match = pd.Series(False, index=sample.index)
+    for col in sample.columns:
+        matches = (sample[col] == str(col)).fillna(False).astype(bool)
+        all_match &= matches | sample[col].isna()
+        any_match |= matches
+    return sample[~(all_match & any_match)]
+
+def header_na_values(schema: Dict[str, str]) -> Dict[str, list]:
+    """``na_values`` reading a typed column's own name as missing, so header echoes don't break the dtypes."""
+    return {col: [str(col)] for col, dtype in schema.items() if dtype in TYPED_DTYPES}
+
+def infer_csv_schema(file_path: str, sample_rows: int = DEFAULT_SAMPLE_ROWS,
+                     ids_as_text: bool = False,
+                     text_columns: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """Infer one dtype per column from a sample of a CSV file.
+
+    The sample is read as text so every column is judged on the same raw
+    values, then mapped to a nullable dtype (``Int64``, ``Float64``,
+    ``boolean`` or ``string``). Rows repeating the header are left out
+    (see ``drop_header_echoes``). Passing the result as ``dtype=`` to every
+    chunk keeps column types identical across chunks and skips pandas'
+    per-chunk inference.
+
+    Args:
+        file_path: Path of the CSV file
+        sample_rows: Number of data rows to sample from the top of the file
+        ids_as_text: Keep ID-like columns (see ``is_id_like``) as text
+        text_columns: Columns that are always kept as text
+
+    Returns:
+        Mapping of column name to dtype string
+    """
+    sample = drop_header_echoes(pd.read_csv(file_path, nrows=sample_rows, dtype=str, keep_default_na=True))
+    forced = set(text_columns or [])
+
+    schema = {}
+    for col in sample.columns:
+        values = sample[col]
+        if col in forced or (ids_as_text and is_id_like(col, values.dropna())):
+            schema[col] = 'string'
+        else:
+            schema[col] = _infer_column_dtype(values)
+    return schema
+
+def relax_schema(schema: Dict[str, str], raw_chunk: pd.DataFrame) -> Dict[str, str]:
+    """Demote columns whose values in ``raw_chunk`` don't fit the schema.
+
+    ``raw_chunk`` must be read with ``dtype=str``. Columns that no longer
+    parse as their inferred type fall back to ``string``; header echoes
+    are ignored as in ``infer_csv_schema``.
+    """
+    raw_chunk = drop_header_echoes(raw_chunk)
+    relaxed = dict(schema)
+    for col, dtype in schema.items():
+        if dtype not in TYPED_DTYPES or col not in raw_chunk.columns:
+            continue
+        values = raw_chunk[col].dropna()
+        if values.empty:
+            continue
+        inferred = _infer_column_dtype(values)
+        if inferred == dtype or (dtype == 'Float64' and inferred == 'Int64'):
+            continue
+        if dtype == 'Int64' and inferred == 'Float64':
+            relaxed[col] = 'Float64'
+        else:
+            relaxed[col] = 'string'
+    return relaxed
+
+def parse_raw_text(values: pd.Series, dtype: str, column_name=None) -> pd.Series:
+    """Parse a column read verbatim (``RAW_TEXT_DTYPE``) to ``dtype`` as ``read_csv`` would.
+
+    Default NA markers become missing, and so does ``column_name`` in typed
+    columns (header echoes, see ``header_na_values``). Raises ValueError or
+    TypeError when a value doesn't fit ``dtype``.
+    """
+    text = values.astype(object)
+    missing = text.isna() | text.isin(STR_NA_VALUES)
+    if dtype in TYPED_DTYPES and column_name is not None:
+        missing |= text == str(column_name)
+    text = text.mask(missing)
+    if dtype in ('Int64', 'Float64'):
+        return pd.to_numeric(text).astype(dtype)
+    if dtype == 'boolean':
+        lowered = text.str.strip().str.lower()
+        if not lowered[~missing].isin(['true', 'false']).all():
+            raise ValueError(f"Values of column {column_name} are not all boolean")
+        return (lowered == 'true').astype('boolean').mask(missing)
+    return text.astype(dtype)
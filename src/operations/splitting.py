@@ -19,7 +19,7 @@ def split_surname(full_name, column_name=None):
         # Handle single names - return name as is, empty surname
         return name_str, ""
 
-def apply_split_surname(dataframe, col, texts):
+def apply_split_surname(dataframe, col, texts, header_mask=None):
     """Applies surname splitting. Returns modified dataframe and status message info."""
     if col not in dataframe.columns:
         return dataframe, ('error', texts['column_not_found'].format(col=col))
@@ -27,10 +27,15 @@ def apply_split_surname(dataframe, col, texts):
     # Create a copy to avoid modifying the original DataFrame
     new_df = dataframe.copy()
     
-    split_results = new_df[col].apply(split_surname, column_name=col)
+    split_results = new_df[col].apply(split_surname)
     name_series = split_results.apply(lambda x: x[0])
     surname_series = split_results.apply(lambda x: x[1])
 
+    # Repeated header rows keep their original value and get an empty surname
+    if header_mask is not None and header_mask.any():
+        name_series[header_mask] = new_df.loc[header_mask, col]
+        surname_series[header_mask] = ""
+
     new_surname_col_name = f"{col}_Surname"
     counter = 1
     base_name = new_surname_col_name
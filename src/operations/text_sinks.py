@@ -0,0 +1,148 @@
+# operations/text_sinks.py
+import html
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from .csv_sink import TextChunkWriter
+
+def cells_as_text(df: pd.DataFrame) -> np.ndarray:
+    """Render a frame as a 2D array of display strings, one column at a time.
+
+    Missing values become empty strings. This is only used where the output
+    format needs text, so the pipeline itself can keep native dtypes.
+    """
+    text = np.empty(df.shape, dtype=object)
+    for col_idx in range(df.shape[1]):
+        column = df.iloc[:, col_idx]
+        missing = column.isna().to_numpy(dtype=bool)
+        values = column.astype(object).to_numpy()
+        rendered = np.array([str(v) for v in values], dtype=object) if len(values) else values
+        rendered[missing] = ''
+        text[:, col_idx] = rendered
+    return text
+
+def column_masks(df: pd.DataFrame, attr: str) -> Dict[int, np.ndarray]:
+    """Read per-column highlight masks (``_styled_columns``/``_modified_columns``) by column position."""
+    masks = {}
+    for col_name, mask in getattr(df, attr, {}).items():
+        if col_name in df.columns:
+            masks[df.columns.get_loc(col_name)] = pd.Series(mask).fillna(False).to_numpy(dtype=bool)
+    return masks
+
+def _json_lines(chunk: pd.DataFrame) -> str:
+    """One JSON object per row and line; dates as ISO 8601, missing values as null."""
+    if chunk.empty:
+        return ''
+    text = chunk.to_json(orient='records', lines=True, date_format='iso',
+                         force_ascii=False, default_handler=str)
+    return text if text.endswith('\n') else text + '\n'
+
+class JsonLinesChunkWriter(TextChunkWriter):
+    """JSON Lines sink: one object per row, so every chunk is written independently."""
+    format_name = 'jsonl'
+
+    def _format_chunk(self, chunk: pd.DataFrame, first: bool) -> str:
+        return _json_lines(chunk)
+
+class JsonChunkWriter(TextChunkWriter):
+    """JSON array sink: the array brackets are written once and chunks are joined with commas."""
+    format_name = 'json'
+
+    def _prefix(self) -> str:
+        return '[\n'
+
+    def _suffix(self) -> str:
+        return ']\n' if self._first else '\n]\n'
+
+    def _format_chunk(self, chunk: pd.DataFrame, first: bool) -> str:
+        lines = _json_lines(chunk)
+        if not lines:
+            return ''
+        # JSON strings escape newlines, so each line is exactly one record
+        records = lines[:-1].replace('\n', ',\n')
+        return records if first else ',\n' + records
+
+def _escaped_columns(text: np.ndarray, escape) -> list:
+    """Apply ``escape`` to the columns of a text array that contain characters it changes."""
+    columns = []
+    for col_idx in range(text.shape[1]):
+        column = text[:, col_idx]
+        joined = '\x00'.join(column)
+        if escape(joined) != joined:
+            column = np.array([escape(t) for t in column], dtype=object)
+        columns.append(column)
+    return columns
+
+def _html_escape(text: str) -> str:
+    return html.escape(text, quote=False)
+
+HTML_STYLE = (
+    'table{border-collapse:collapse}th,td{border:1px solid #ccc;padding:2px 6px}'
+    'td.invalid{background:#FFCCCC}td.modified{background:#FFFFCC}'
+)
+
+class HtmlChunkWriter(TextChunkWriter):
+    """HTML table sink; the header row is written with the first chunk, even an empty one.
+
+    Invalid and modified cells get the ``invalid``/``modified`` classes.
+    """
+    format_name = 'html'
+    _header_written = False
+    _state_attributes = TextChunkWriter._state_attributes + ('_header_written',)
+
+    def _prefix(self) -> str:
+        return (
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            f'<style>{HTML_STYLE}</style>\n</head>\n<body>\n<table>\n'
+        )
+
+    def _suffix(self) -> str:
+        # Without any chunk (and no header_columns) the table sections were never opened
+        opening = '' if self._header_written else '<thead>\n</thead>\n<tbody>\n'
+        return opening + '</tbody>\n</table>\n</body>\n</html>\n'
+
+    def _format_chunk(self, chunk: pd.DataFrame, first: bool) -> str:
+        header = ''
+        if not self._header_written:
+            cells = ''.join(f'<th>{_html_escape(str(col))}</th>' for col in chunk.columns)
+            header = f'<thead>\n<tr>{cells}</tr>\n</thead>\n<tbody>\n'
+            self._header_written = True
+        if chunk.empty:
+            return header
+        invalid = column_masks(chunk, '_styled_columns')
+        modified = column_masks(chunk, '_modified_columns')
+        cells = []
+        for col_idx, column in enumerate(_escaped_columns(cells_as_text(chunk), _html_escape)):
+            opening = np.full(len(column), '<td>', dtype=object)
+            if col_idx in modified:
+                opening[modified[col_idx]] = '<td class="modified">'
+            if col_idx in invalid:
+                opening[invalid[col_idx]] = '<td class="invalid">'
+            cells.append(opening + column + '</td>')
+        return header + ''.join(['<tr>' + ''.join(row) + '</tr>\n' for row in zip(*cells)])
+
+def _markdown_escape(text: str) -> str:
+    # Markdown renders inline HTML, so markup characters are escaped too
+    return _html_escape(text).replace('|', '\\|').replace('\r\n', '<br>').replace('\n', '<br>').replace('\r', '<br>')
+
+class MarkdownChunkWriter(TextChunkWriter):
+    """Markdown (GitHub pipe) table sink; pipes and markup are escaped and line breaks become ``<br>``.
+
+    The header row is written with the first chunk, even an empty one.
+    """
+    format_name = 'md'
+    _header_written = False
+    _state_attributes = TextChunkWriter._state_attributes + ('_header_written',)
+
+    def _format_chunk(self, chunk: pd.DataFrame, first: bool) -> str:
+        header = ''
+        if not self._header_written:
+            names = ' | '.join(_markdown_escape(str(col)) for col in chunk.columns)
+            header = f'| {names} |\n|' + ' --- |' * len(chunk.columns) + '\n'
+            self._header_written = True
+        if chunk.empty:
+            return header
+        columns = _escaped_columns(cells_as_text(chunk), _markdown_escape)
+        return header + ''.join(['| ' + ' | '.join(row) + ' |\n' for row in zip(*columns)])
@@ -0,0 +1,72 @@
+# operations/tracing.py
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional
+
+def trace_path(output_path: str) -> str:
+    """Timeline of a save, kept next to its (first) output."""
+    return f"{output_path}.trace.json"
+
+class Tracer:
+    """Record spans from any thread as Chrome trace events.
+
+    ``write`` produces the JSON object format understood by chrome://tracing
+    and Perfetto: one complete ("X") event per span with its thread ID, plus
+    the thread names, so stalls and missing overlap between reading,
+    operations and the writer threads show up on the timeline.
+    """
+    def __init__(self):
+        self._start = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+
+    @contextmanager
+    def span(self, name: str, category: str = '', **args):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            thread = threading.current_thread()
+            self._threads[thread.ident] = thread.name
+            event = {
+                'name': name, 'cat': category, 'ph': 'X', 'pid': self._pid, 'tid': thread.ident,
+                'ts': (start - self._start) / 1000, 'dur': (end - start) / 1000,
+            }
+            if args:
+                event['args'] = args
+            # list.append is atomic, so worker threads need no lock
+            self._events.append(event)
+
+    def events(self) -> List[Dict[str, Any]]:
+        names = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in list(self._threads.items())
+        ]
+        return names + list(self._events)
+
+    def write(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events(), 'displayTimeUnit': 'ms'}, f, default=str)
+
+# The tracer of the running save, if it is traced
+_tracer: Optional[Tracer] = None
+
+def start_tracing() -> Tracer:
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+def stop_tracing():
+    global _tracer
+    _tracer = None
+
+def span(name: str, category: str = '', **args):
+    """Context manager recording a span while tracing is on; does nothing otherwise."""
+    if _tracer is None:
+        return nullcontext()
+    return _tracer.span(name, category, **args)
@@ -137,7 +137,7 @@ def validate_url(value, column_name=None):
         return False, "Invalid Format"
 
 
-def apply_validation(dataframe, col, validation_type, texts):
+def apply_validation(dataframe, col, validation_type, texts, header_mask=None):
     """Applies validation to a column based on the selected type and colors invalid cells red."""
     if col not in dataframe.columns:
         return dataframe, ('error', texts['column_not_found'].format(col=col))
@@ -158,8 +158,12 @@ def apply_validation(dataframe, col, validation_type, texts):
     
     validation_function = validation_functions[validation_type]
     
-    validation_results = new_df[col].apply(lambda x: validation_function(x, col))
+    validation_results = new_df[col].apply(validation_function)
     is_valid_series = validation_results.apply(lambda x: x[0])
+
+    # Repeated header rows are never valid data
+    if header_mask is not None and header_mask.any():
+        is_valid_series[header_mask] = False
     
     valid_count = is_valid_series.sum()
     total_count = len(new_df)
@@ -169,9 +173,6 @@ def apply_validation(dataframe, col, validation_type, texts):
         object.__setattr__(new_df, '_styled_columns', {})
     new_df._styled_columns[col] = ~is_valid_series
 
-    # Ensure column stays as string (prevents .0 for numbers)
-    new_df[col] = new_df[col].apply(lambda v: str(v) if not pd.isna(v) else "")
-
     success_message = texts['check_valid_inputs_success'].format(
         col=col, 
         type=texts.get(f'validation_{validation_type}', validation_type)
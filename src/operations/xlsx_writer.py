@@ -0,0 +1,553 @@
+# operations/xlsx_writer.py
+import os
+import re
+import tempfile
+from typing import Dict, Iterable, List, Optional
+
+from .parallel_zip import ParallelZipWriter
+
+import numpy as np
+import pandas as pd
+
+# Excel's row limit per worksheet
+EXCEL_MAX_ROWS = 1048576
+
+# Excel's limit on the length of one cell's text
+MAX_CELL_CHARS = 32767
+
+# Cell kinds; each has one shared number format
+KIND_GENERAL = 0
+KIND_TEXT = 1
+KIND_DATE = 2
+KIND_DATETIME = 3
+_KIND_NUM_FMTS = (0, 49, 164, 165)  # General, '@' and the two custom formats below
+
+# Highlight variants of every kind; invalid takes priority over modified
+HIGHLIGHT_NONE = 0
+HIGHLIGHT_INVALID = 1
+HIGHLIGHT_MODIFIED = 2
+_HIGHLIGHT_FILLS = (0, 2, 3)
+
+# Highlight runs at least this long become one conditional-format range
+MIN_RANGE_RUN = 64
+
+# Ranges listed in one conditionalFormatting element
+_RANGES_PER_RULE = 1000
+
+# Day zero of Excel's 1900 date system, valid for dates from 1900-03-01
+_EXCEL_EPOCH = np.datetime64('1899-12-30', 'ns')
+_FIRST_EXCEL_DATE = np.datetime64('1900-03-01', 'ns')
+_NS_PER_DAY = 86400 * 10**9
+
+def style_id(kind: int, highlight: int) -> int:
+    """Index into cellXfs for a kind and highlight; plain General is 0, the default."""
+    return kind * 3 + highlight
+
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_SHEET_START = _XML_HEADER + f'<worksheet xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+# Room for the widest dimension record (A1:XFD1048576); it is filled in when
+# the sheet is finished, the rest of the slot is whitespace
+_DIMENSION_SLOT = 40
+_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+def _styles_xml() -> str:
+    xfs = []
+    for num_fmt in _KIND_NUM_FMTS:
+        for fill in _HIGHLIGHT_FILLS:
+            attrs = f'numFmtId="{num_fmt}" fontId="{1 if fill else 0}" fillId="{fill}" borderId="0" xfId="0"'
+            if num_fmt:
+                attrs += ' applyNumberFormat="1"'
+            if fill:
+                attrs += ' applyFont="1" applyFill="1"'
+            xfs.append(f'<xf {attrs}/>')
+    return (
+        _XML_HEADER +
+        f'<styleSheet xmlns="{_MAIN_NS}">'
+        '<numFmts count="2">'
+        '<numFmt numFmtId="164" formatCode="yyyy-mm-dd"/>'
+        '<numFmt numFmtId="165" formatCode="yyyy-mm-dd hh:mm:ss"/>'
+        '</numFmts>'
+        '<fonts count="2">'
+        '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+        '<font><sz val="11"/><color rgb="FF000000"/><name val="Calibri"/><family val="2"/></font>'
+        '</fonts>'
+        '<fills count="4">'
+        '<fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill>'
+        '<fill><patternFill patternType="solid"><fgColor rgb="FFFFCCCC"/><bgColor indexed="64"/></patternFill></fill>'
+        '<fill><patternFill patternType="solid"><fgColor rgb="FFFFFFCC"/><bgColor indexed="64"/></patternFill></fill>'
+        '</fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        f'<cellXfs count="{len(xfs)}">{"".join(xfs)}</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        # Differential formats for highlight ranges, in HIGHLIGHT_INVALID/HIGHLIGHT_MODIFIED order
+        '<dxfs count="2">'
+        '<dxf><font><color rgb="FF000000"/></font><fill><patternFill patternType="solid"><bgColor rgb="FFFFCCCC"/></patternFill></fill></dxf>'
+        '<dxf><font><color rgb="FF000000"/></font><fill><patternFill patternType="solid"><bgColor rgb="FFFFFFCC"/></patternFill></fill></dxf>'
+        '</dxfs>'
+        '</styleSheet>'
+    )
+
+STYLES_XML = _styles_xml()
+
+# Characters XML 1.0 can't hold, and text Excel would read back as such an escape
+_NEEDS_ESCAPE = re.compile(r'[&<>\x00-\x08\x0b\x0c\x0e-\x1f]|_x[0-9A-Fa-f]{4}_')
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+_EXCEL_ESCAPE = re.compile(r'_(x[0-9A-Fa-f]{4}_)')
+
+def column_letter(index: int) -> str:
+    """Zero-based column index to an Excel column name (0 -> A, 26 -> AA)."""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def escape_text(text: str) -> str:
+    """Escape one string for an inline string cell the way Excel expects."""
+    if len(text) > MAX_CELL_CHARS:
+        text = text[:MAX_CELL_CHARS]
+    if not _NEEDS_ESCAPE.search(text):
+        return text
+    text = _EXCEL_ESCAPE.sub(r'_x005F_\1', text)
+    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return _CONTROL_CHARS.sub(lambda m: f'_x{ord(m.group()):04X}_', text)
+
+# Leading or trailing whitespace of any value in a newline-joined column
+_EDGE_SPACE = re.compile(r'(?:^|\n)\s|\s(?:\n|$)')
+
+def _escape_column(text: np.ndarray) -> np.ndarray:
+    """Escape a column of cell text, skipping the per-value work when nothing needs it."""
+    joined = '\n'.join(text)
+    if _NEEDS_ESCAPE.search(joined) or max(map(len, text), default=0) > MAX_CELL_CHARS:
+        return np.array([escape_text(t) for t in text], dtype=object)
+    return text
+
+def _text_bodies(text: np.ndarray) -> np.ndarray:
+    """Inline string cell bodies (everything after the style attribute) for a column of text."""
+    escaped = _escape_column(text)
+    if _EDGE_SPACE.search('\n'.join(escaped)):
+        preserve = np.array([t[:1].isspace() or t[-1:].isspace() for t in escaped], dtype=bool)
+        body = np.where(preserve, ' t="inlineStr"><is><t xml:space="preserve">', ' t="inlineStr"><is><t>') + escaped
+    else:
+        body = ' t="inlineStr"><is><t>' + escaped
+    return body + '</t></is></c>'
+
+def _as_text(values: np.ndarray) -> np.ndarray:
+    return np.array([str(v) for v in values], dtype=object)
+
+def dates_only(column: pd.Series) -> Optional[bool]:
+    """Whether a datetime column holds only midnight values; None when it has no datetime values."""
+    if not pd.api.types.is_datetime64_any_dtype(column.dtype) or not column.notna().any():
+        return None
+    if getattr(column.dtype, 'tz', None) is not None:
+        column = column.dt.tz_localize(None)
+    values = column.dropna().to_numpy(dtype='datetime64[ns]')
+    return bool((values.astype(np.int64) % _NS_PER_DAY == 0).all())
+
+def column_cells(column: pd.Series, force_text: bool = False, date_only: Optional[bool] = None):
+    """Work out the cell kinds and cell bodies of one column.
+
+    Numbers become numeric cells, booleans boolean cells and datetimes date
+    serials with a shared date or date-time format; ``date_only`` picks the
+    format (decided from this column with ``dates_only`` when None), so a
+    writer can keep one format per column across chunks. Everything else, and
+    every value of a ``force_text`` column, becomes a string cell. Values
+    Excel can't store natively (infinity, dates before 1900-03-01) are
+    written as text. Missing values get an empty body.
+
+    Returns:
+        (kinds, bodies): an int8 array of cell kinds and an object array
+        of cell XML following the style attribute
+    """
+    n_rows = len(column)
+    missing = column.isna().to_numpy(dtype=bool)
+    kinds = np.full(n_rows, KIND_TEXT if force_text else KIND_GENERAL, dtype=np.int8)
+    bodies = np.full(n_rows, '/>', dtype=object)
+    present = ~missing
+    dtype = column.dtype
+
+    if force_text or not (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype)):
+        if present.any():
+            bodies[present] = _text_bodies(_as_text(column.to_numpy(dtype=object)[present]))
+        return kinds, bodies
+
+    if pd.api.types.is_bool_dtype(dtype):
+        values = column.to_numpy(dtype=object)[present]
+        bodies[present] = np.where(values.astype(bool), ' t="b"><v>1</v></c>', ' t="b"><v>0</v></c>')
+        return kinds, bodies
+
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        if getattr(dtype, 'tz', None) is not None:
+            column = column.dt.tz_localize(None)
+        values = column.to_numpy(dtype='datetime64[ns]')
+        in_range = present & (values >= _FIRST_EXCEL_DATE)
+        if date_only is None:
+            date_only = bool((values[present].astype(np.int64) % _NS_PER_DAY == 0).all())
+        ticks = (values[in_range] - _EXCEL_EPOCH).astype(np.int64)
+        kinds[in_range] = KIND_DATE if date_only else KIND_DATETIME
+        # A time of day is kept in the serial even where the column shows dates only
+        whole_days = date_only and (ticks % _NS_PER_DAY == 0).all()
+        serials = (ticks // _NS_PER_DAY).astype(str) if whole_days else (ticks / _NS_PER_DAY).astype(str)
+        bodies[in_range] = '><v>' + serials.astype(object) + '</v></c>'
+        early = present & ~in_range
+        if early.any():
+            bodies[early] = _text_bodies(_as_text(column[early].dt.strftime('%Y-%m-%d' if date_only else '%Y-%m-%d %H:%M:%S').to_numpy()))
+        return kinds, bodies
+
+    if pd.api.types.is_integer_dtype(dtype):
+        numbers = column.to_numpy(dtype='int64', na_value=0)[present].astype(str)
+        bodies[present] = '><v>' + numbers.astype(object) + '</v></c>'
+        return kinds, bodies
+
+    if pd.api.types.is_complex_dtype(dtype):
+        bodies[present] = _text_bodies(_as_text(column.to_numpy(dtype=object)[present]))
+        return kinds, bodies
+
+    values = column.to_numpy(dtype='float64', na_value=np.nan)
+    finite = present & np.isfinite(values)
+    bodies[finite] = '><v>' + values[finite].astype(str).astype(object) + '</v></c>'
+    special = present & ~finite
+    if special.any():
+        bodies[special] = _text_bodies(_as_text(values[special]))
+    return kinds, bodies
+
+def cell_highlights(n_rows: int, invalid: Optional[np.ndarray], modified: Optional[np.ndarray]) -> np.ndarray:
+    """Highlight per row of one column; invalid takes priority over modified."""
+    highlights = np.full(n_rows, HIGHLIGHT_NONE, dtype=np.int8)
+    if modified is not None:
+        highlights[modified] = HIGHLIGHT_MODIFIED
+    if invalid is not None:
+        highlights[invalid] = HIGHLIGHT_INVALID
+    return highlights
+
+def mask_runs(mask: np.ndarray):
+    """Return (starts, ends) of the runs of True in a boolean array; ends are exclusive."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+_STYLE_ATTRS = np.array(
+    ['"' if i == 0 else f'" s="{i}"' for i in range(style_id(KIND_DATETIME, HIGHLIGHT_MODIFIED) + 1)],
+    dtype=object
+)
+
+def workbook_part_path(output_path: str, index: int) -> str:
+    """Path of the ``index``-th workbook of a split save: ``out.xlsx``, ``out_2.xlsx``, ..."""
+    if index == 1:
+        return output_path
+    base, ext = os.path.splitext(output_path)
+    return f"{base}_{index}{ext}"
+
+def _last_index(items: list, item) -> int:
+    """Position of ``item`` (by identity) in ``items``, searching from the end."""
+    for index in range(len(items) - 1, -1, -1):
+        if items[index] is item:
+            return index
+    raise ValueError("item not in list")
+
+class XlsxChunkWriter:
+    """Stream processed chunks into an .xlsx workbook, building sheet XML rows directly.
+
+    Each chunk is turned into row XML with column-wise array operations,
+    so no per-cell writer call is made. Cells keep their type (see
+    ``column_cells``); ``text_columns`` are written as text cells with
+    the text number format. ``write`` takes per-column boolean masks for
+    invalid and modified cells. Each mask is split into runs: with
+    ``highlight_ranges`` runs of at least ``MIN_RANGE_RUN`` rows become
+    conditional-format ranges (``B2:B5000``) instead of a fill on every
+    cell; shorter runs use a highlighted cell style. The sheet XML is
+    spooled to ``tmpdir`` and zipped into the workbook by ``close``.
+
+    A sheet holds at most ``max_rows`` rows including its header. Beyond
+    that the writer rolls over to ``Sheet2``, ``Sheet3``... with the header
+    repeated, or with ``split_workbooks`` to a new workbook file
+    (``workbook_part_path``). ``output_paths`` lists the files written.
+
+    The workbook container is written by ``ParallelZipWriter``: sheet XML
+    is deflated in blocks across ``compression_workers`` threads at
+    ``compression_level`` (0 stores it uncompressed).
+
+    For resumable saves ``checkpoint`` flushes the spooled sheet and
+    returns the writer state; a writer created with that ``resume_state``
+    (and the same ``tmpdir``) cuts the sheet back to it and continues.
+    """
+    def __init__(self, output_path: str, tmpdir: Optional[str] = None,
+                 text_columns: Optional[Iterable[str]] = None, highlight_ranges: bool = True,
+                 max_rows: int = EXCEL_MAX_ROWS, split_workbooks: bool = False,
+                 compression_level: int = 6, compression_workers: Optional[int] = None,
+                 resume_state: Optional[dict] = None):
+        if max_rows < 2:
+            raise ValueError("max_rows must leave room for the header and one data row")
+        self.output_path = output_path
+        self.output_paths = []
+        self.text_columns = set(text_columns or [])
+        self.highlight_ranges = highlight_ranges
+        self.max_rows = max_rows
+        self.split_workbooks = split_workbooks
+        self.compression_level = compression_level
+        self.compression_workers = compression_workers
+        self._tmpdir = tmpdir or os.path.dirname(os.path.abspath(output_path))
+        self._columns = None
+        self._letters = None
+        # Column index -> date (True) or date-time (False) format, fixed by the first values seen
+        self._date_only = {}
+        # Spooled XML of the finished sheets of the current workbook
+        self._sheet_paths = []
+        self._sheet_path = None
+        self._sheet = None
+        self._row = 0
+        # Highlight -> [column index, first row, last row] ranges (1-based rows) of the open sheet
+        self._ranges = {}
+        self._last_range = {}
+        if resume_state is not None:
+            self._resume(resume_state)
+
+    def checkpoint(self) -> dict:
+        """Flush the open sheet and return the state to resume from."""
+        if self._sheet is not None:
+            self._sheet.flush()
+        return {
+            'columns': None if self._columns is None else [str(c) for c in self._columns],
+            'output_paths': list(self.output_paths),
+            'sheet_paths': list(self._sheet_paths),
+            'sheet_path': self._sheet_path,
+            'sheet_size': os.path.getsize(self._sheet_path) if self._sheet_path else 0,
+            'row': self._row,
+            'date_only': {str(col): date_only for col, date_only in self._date_only.items()},
+            'ranges': {str(h): [[int(v) for v in r] for r in ranges] for h, ranges in self._ranges.items()},
+            'last_range': [[int(col), h, _last_index(self._ranges[h], last)]
+                           for (col, h), last in self._last_range.items()],
+        }
+
+    def _resume(self, state: dict):
+        self.output_paths = state['output_paths']
+        self._sheet_paths = state['sheet_paths']
+        self._date_only = {int(col): date_only for col, date_only in state.get('date_only', {}).items()}
+        if state['columns'] is None:
+            return
+        self._columns = state['columns']
+        self._letters = np.array([column_letter(i) for i in range(len(self._columns))], dtype=object)
+        self._sheet_path = state['sheet_path']
+        # Drop rows spooled after the checkpoint
+        os.truncate(self._sheet_path, state['sheet_size'])
+        self._sheet = open(self._sheet_path, 'a', encoding='utf-8', buffering=8 << 20)
+        self._row = state['row']
+        self._ranges = {int(h): ranges for h, ranges in state['ranges'].items()}
+        self._last_range = {(col, h): self._ranges[h][index] for col, h, index in state['last_range']}
+
+    def suspend(self):
+        """Close the spooled sheet without packaging, keeping it for a resumed save."""
+        if self._sheet is not None:
+            self._sheet.close()
+            self._sheet = None
+
+    def _open_sheet(self):
+        fd, self._sheet_path = tempfile.mkstemp(suffix='.xml', dir=self._tmpdir)
+        self._sheet = open(fd, 'w', encoding='utf-8', buffering=8 << 20)
+        self._sheet.write(
+            _SHEET_START + ' ' * _DIMENSION_SLOT +
+            '<sheetFormatPr defaultRowHeight="15"/><sheetData>'
+        )
+        self._row = 0
+        self._ranges = {HIGHLIGHT_INVALID: [], HIGHLIGHT_MODIFIED: []}
+        self._last_range = {}
+        self._write_rows(
+            [_text_bodies(np.array([str(c)], dtype=object)) for c in self._columns],
+            [np.zeros(1, dtype=np.int8)] * len(self._columns)
+        )
+
+    def _finish_sheet(self):
+        self._sheet.write('</sheetData>' + self._conditional_formats() + '</worksheet>')
+        self._sheet.close()
+        self._sheet = None
+        # Readers such as openpyxl's read-only mode take the row count from here
+        last = f'{self._letters[-1]}{self._row}' if len(self._columns) else 'A1'
+        with open(self._sheet_path, 'r+b') as f:
+            f.seek(len(_SHEET_START.encode('utf-8')))
+            f.write(f'<dimension ref="A1:{last}"/>'.ljust(_DIMENSION_SLOT).encode('ascii'))
+        self._sheet_paths.append(self._sheet_path)
+        self._sheet_path = None
+
+    def _finish_workbook(self):
+        path = workbook_part_path(self.output_path, len(self.output_paths) + 1)
+        self._package(path)
+        self.output_paths.append(path)
+        self._remove_spools()
+
+    def _remove_spools(self):
+        for path in self._sheet_paths + ([self._sheet_path] if self._sheet_path else []):
+            if os.path.exists(path):
+                os.remove(path)
+        self._sheet_paths = []
+
+    def _rollover(self):
+        """Start the next sheet, or the next workbook with ``split_workbooks``."""
+        self._finish_sheet()
+        if self.split_workbooks:
+            self._finish_workbook()
+        self._open_sheet()
+
+    def _write_rows(self, columns_bodies: List[np.ndarray], columns_styles: List[np.ndarray]):
+        n_rows = len(columns_bodies[0]) if columns_bodies else 0
+        row_numbers = np.arange(self._row + 1, self._row + n_rows + 1).astype(str).astype(object)
+        cells = []
+        for col_idx, (bodies, styles) in enumerate(zip(columns_bodies, columns_styles)):
+            column_xml = ('<c r="' + self._letters[col_idx]) + row_numbers + _STYLE_ATTRS[styles] + bodies
+            # Unstyled empty cells are left out entirely
+            blank = (styles == 0) & (bodies == '/>')
+            if blank.any():
+                column_xml[blank] = ''
+            cells.append(column_xml)
+        row_open = '<row r="' + row_numbers + '">'
+        self._sheet.write(''.join([
+            ''.join(row) + '</row>' for row in zip(row_open, *cells)
+        ]))
+        self._row += n_rows
+
+    def write(self, chunk: pd.DataFrame,
+              invalid: Optional[Dict[int, np.ndarray]] = None,
+              modified: Optional[Dict[int, np.ndarray]] = None):
+        """Append the rows of a processed chunk.
+
+        ``invalid`` and ``modified`` map column positions to boolean masks
+        over the rows. The header row is written at the top of every sheet.
+        """
+        if self._columns is None:
+            self._columns = list(chunk.columns)
+            self._letters = np.array([column_letter(i) for i in range(len(self._columns))], dtype=object)
+            self._open_sheet()
+        invalid = invalid or {}
+        modified = modified or {}
+        n_rows, n_cols = chunk.shape
+        if n_rows == 0:
+            return
+        cells, highlights = [], []
+        for i in range(n_cols):
+            column = chunk.iloc[:, i]
+            if i not in self._date_only:
+                date_only = dates_only(column)
+                if date_only is not None:
+                    self._date_only[i] = date_only
+            cells.append(column_cells(column, chunk.columns[i] in self.text_columns, self._date_only.get(i)))
+            highlights.append(cell_highlights(n_rows, invalid.get(i), modified.get(i)))
+
+        start = 0
+        while start < n_rows:
+            if self._row >= self.max_rows:
+                self._rollover()
+            end = min(n_rows, start + self.max_rows - self._row)
+            styles = []
+            for i in range(n_cols):
+                part = highlights[i][start:end]
+                if self.highlight_ranges and part.any():
+                    self._take_ranges(i, part)
+                styles.append(cells[i][0][start:end] * 3 + part)
+            self._write_rows([bodies[start:end] for _, bodies in cells], styles)
+            start = end
+
+    def _take_ranges(self, col_idx: int, highlights: np.ndarray):
+        """Move long highlight runs of one column into ranges, clearing them from ``highlights``."""
+        first_row = self._row + 1
+        for highlight, ranges in self._ranges.items():
+            starts, ends = mask_runs(highlights == highlight)
+            long_runs = (ends - starts) >= MIN_RANGE_RUN
+            for start, end in zip(starts[long_runs], ends[long_runs]):
+                highlights[start:end] = HIGHLIGHT_NONE
+                key = (col_idx, highlight)
+                last = self._last_range.get(key)
+                if last is not None and last[2] == first_row + start - 1:
+                    # Continues a run from the previous chunk
+                    last[2] = first_row + end - 1
+                else:
+                    last = [col_idx, first_row + start, first_row + end - 1]
+                    ranges.append(last)
+                    self._last_range[key] = last
+
+    def _conditional_formats(self) -> str:
+        rules = []
+        priority = 1
+        for highlight, ranges in self._ranges.items():
+            for i in range(0, len(ranges), _RANGES_PER_RULE):
+                sqref = ' '.join(
+                    f'{self._letters[col]}{first}:{self._letters[col]}{last}'
+                    for col, first, last in ranges[i:i + _RANGES_PER_RULE]
+                )
+                rules.append(
+                    f'<conditionalFormatting sqref="{sqref}">'
+                    f'<cfRule type="expression" dxfId="{highlight - 1}" priority="{priority}">'
+                    '<formula>TRUE</formula></cfRule></conditionalFormatting>'
+                )
+                priority += 1
+        return ''.join(rules)
+
+    def close(self, commit: bool = True):
+        """Finish the last sheet and package the workbook; without ``commit`` only clean up."""
+        try:
+            if not commit:
+                if self._sheet is not None:
+                    self._sheet.close()
+                    self._sheet = None
+                return
+            if self._columns is None:
+                self._columns = []
+                self._letters = np.array([], dtype=object)
+                self._open_sheet()
+            if self._sheet is not None:
+                self._finish_sheet()
+                self._finish_workbook()
+        finally:
+            self._remove_spools()
+
+    def _package(self, path: str):
+        sheet_numbers = range(1, len(self._sheet_paths) + 1)
+        content_types = (
+            _XML_HEADER +
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            + ''.join(
+                f'<Override PartName="/xl/worksheets/sheet{n}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for n in sheet_numbers
+            ) +
+            '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            '</Types>'
+        )
+        root_rels = (
+            _XML_HEADER +
+            f'<Relationships xmlns="{_PKG_REL_NS}">'
+            f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        )
+        workbook = (
+            _XML_HEADER +
+            f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheets>'
+            + ''.join(f'<sheet name="Sheet{n}" sheetId="{n}" r:id="rId{n}"/>' for n in sheet_numbers) +
+            '</sheets></workbook>'
+        )
+        workbook_rels = (
+            _XML_HEADER +
+            f'<Relationships xmlns="{_PKG_REL_NS}">'
+            + ''.join(
+                f'<Relationship Id="rId{n}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{n}.xml"/>'
+                for n in sheet_numbers
+            ) +
+            f'<Relationship Id="rId{len(self._sheet_paths) + 1}" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+            '</Relationships>'
+        )
+        zf = ParallelZipWriter(path, self.compression_level, self.compression_workers)
+        try:
+            zf.writestr('[Content_Types].xml', content_types)
+            zf.writestr('_rels/.rels', root_rels)
+            zf.writestr('xl/workbook.xml', workbook)
+            zf.writestr('xl/_rels/workbook.xml.rels', workbook_rels)
+            zf.writestr('xl/styles.xml', STYLES_XML)
+            # The sheet XML is nearly all of the workbook; its blocks deflate in parallel
+            for n, sheet_path in zip(sheet_numbers, self._sheet_paths):
+                zf.write_file(sheet_path, f'xl/worksheets/sheet{n}.xml')
+        finally:
+            zf.close()
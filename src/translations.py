@@ -145,6 +145,11 @@ LANGUAGES = {
         'select_at_least_one_more_column': "Please select at least one more column to concatenate with the selected column.",
         'position': "Position:",
         'refresh_preview': "Refresh Preview",
+        'select_columns_button': "Columns...",
+        'select_columns_title': "Columns to Load",
+        'select_columns_prompt': "Select the columns to load, process and save:",
+        'select_columns_none': "Please select at least one column.",
+        'columns_selected': "Loading {count} of {total} columns.",
         'ready': "Ready.",
         'output_format': "Output Format:",
         'processing': "Processing...",
@@ -168,7 +173,10 @@ LANGUAGES = {
         'save_failed_no_data': "Save operation failed: No data to save.",
         'save_cancelled': "Save operation cancelled.",
         'file_saved': "File saved successfully to {filename}.",
-        'save_error_or_cancelled': "Save operation was cancelled or encountered an error."
+        'save_error_or_cancelled': "Save operation was cancelled or encountered an error.",
+        'resumable_save': "Resumable save",
+        'resume_save_title': "Resume Save",
+        'resume_save_message': "An earlier save to this file was interrupted. Continue from where it stopped?"
     },
     'tr': {
         'title': "Excel Tablo Araçları",
@@ -316,6 +324,11 @@ LANGUAGES = {
         'select_at_least_one_more_column': "Lütfen seçili sütunla birleştirmek için en az bir sütun daha seçin.",
         'position': "Konum:",
         'refresh_preview': "Önizlemeyi Yenile",
+        'select_columns_button': "Sütunlar...",
+        'select_columns_title': "Yüklenecek Sütunlar",
+        'select_columns_prompt': "Yüklenecek, işlenecek ve kaydedilecek sütunları seçin:",
+        'select_columns_none': "Lütfen en az bir sütun seçin.",
+        'columns_selected': "{total} sütundan {count} tanesi yükleniyor.",
         'ready': "Hazır.",
         'output_format': "Çıktı Formatı:",
         'processing': "İşleniyor...",
@@ -339,7 +352,10 @@ LANGUAGES = {
         'save_failed_no_data': "Kaydetme işlemi başarısız: Kaydedilecek veri yok.",
         'save_cancelled': "Kaydetme işlemi iptal edildi.",
         'file_saved': "Dosya başarıyla kaydedildi: {filename}.",
-        'save_error_or_cancelled': "Kaydetme işlemi iptal edildi veya bir hata oluştu."
+        'save_error_or_cancelled': "Kaydetme işlemi iptal edildi veya bir hata oluştu.",
+        'resumable_save': "Devam ettirilebilir kayıt",
+        'resume_save_title': "Kaydetmeye Devam Et",
+        'resume_save_message': "Bu dosyaya yapılan önceki bir kayıt yarıda kaldı. Kaldığı yerden devam edilsin mi?"
     },
     'ru': {
         'title': "Инструменты для таблиц Excel",
@@ -487,6 +503,11 @@ LANGUAGES = {
         'select_at_least_one_more_column': "Пожалуйста, выберите как минимум еще один столбец для объединения с выбранным столбцом.",
         'position': "Позиция:",
         'refresh_preview': "Обновить предпросмотр",
+        'select_columns_button': "Столбцы...",
+        'select_columns_title': "Загружаемые столбцы",
+        'select_columns_prompt': "Выберите столбцы для загрузки, обработки и сохранения:",
+        'select_columns_none': "Пожалуйста, выберите хотя бы один столбец.",
+        'columns_selected': "Загружается {count} из {total} столбцов.",
         'ready': "Готово.",
         'output_format': "Формат вывода:",
         'processing': "Обработка...",
@@ -510,6 +531,9 @@ LANGUAGES = {
         'save_failed_no_data': "Ошибка сохранения: нет данных для сохранения.",
         'save_cancelled': "Сохранение отменено.",
         'file_saved': "Файл успешно сохранен: {filename}.",
-        'save_error_or_cancelled': "Сохранение было отменено или произошла ошибка."
+        'save_error_or_cancelled': "Сохранение было отменено или произошла ошибка.",
+        'resumable_save': "Возобновляемое сохранение",
+        'resume_save_title': "Продолжить сохранение",
+        'resume_save_message': "Предыдущее сохранение в этот файл было прервано. Продолжить с места остановки?"
     }
 }
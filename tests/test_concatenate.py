@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+
+from operations.concatenate import apply_concatenate
+from translations import LANGUAGES
+
+TEXTS = LANGUAGES['en']
+
+def test_renders_values_like_str():
+    df = pd.DataFrame({
+        'a': pd.array(['x', None], dtype='string'),
+        'b': pd.array([1, None], dtype='Int64'),
+        'c': [1.5, np.nan],
+    })
+    result, (status, _) = apply_concatenate(df, ['a', 'b', 'c'], 'joined', ' - ', TEXTS)
+    assert status == 'success'
+    assert result['joined'].tolist() == ['x - 1 - 1.5', '<NA> - <NA> - nan']
+
+def test_empty_selection_is_an_error():
+    df = pd.DataFrame({'a': ['x']})
+    result, (status, message) = apply_concatenate(df, [], 'joined', ' - ', TEXTS)
+    assert status == 'error'
+    assert message == TEXTS['no_columns_selected']
+    assert result is df
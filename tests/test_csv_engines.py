@@ -0,0 +1,33 @@
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from operations.delayed_operations import DelayedOperationManager
+
+CSV = (
+    'id,note,comment,flag\n'
+    '100,first,NA,true\n'
+    '200,,,false\n'
+    '300,NA,n/a,true\n'
+    '400,NA,,true\n'
+)
+
+def save(tmp_path, engine):
+    input_path = tmp_path / 'input.csv'
+    input_path.write_text(CSV, encoding='utf-8')
+    output_path = tmp_path / f'output_{engine}.csv'
+    manager = DelayedOperationManager()
+    manager.write_run_report = False
+    manager.csv_engine = engine
+    manager.load_preview(str(input_path), 'head')
+    manager.add_operation({'type': 'column_operation', 'key': 'op_upper', 'column': 'note'})
+    assert manager.save_with_operations(str(output_path))
+    return output_path.read_text(encoding='utf-8')
+
+def test_engines_agree_with_a_raw_column(tmp_path):
+    pandas_output = save(tmp_path, 'pandas')
+    arrow_output = save(tmp_path, 'arrow')
+    assert arrow_output == pandas_output
+    # The untouched comment column is copied verbatim; the edited note column reads NA and '' as missing
+    assert arrow_output.splitlines()[1:] == ['100,FIRST,NA,true', '200,<NA>,,false', '300,<NA>,n/a,true',
+                                             '400,<NA>,,true']
@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+pq = pytest.importorskip('pyarrow.parquet')
+
+from operations.parquet_io import ParquetChunkWriter
+
+def write_chunks(path, chunks, parts_dir=None):
+    writer = ParquetChunkWriter(str(path), parts_dir=parts_dir)
+    for chunk in chunks:
+        writer.write(chunk)
+    writer.close()
+    return pq.read_table(str(path))
+
+@pytest.mark.parametrize('use_parts', [False, True])
+def test_column_relaxed_to_text_in_a_later_chunk(tmp_path, use_parts):
+    parts_dir = None
+    if use_parts:
+        parts_dir = tmp_path / 'parts'
+        parts_dir.mkdir()
+    chunks = [
+        pd.DataFrame({'id': pd.array([1, 2], dtype='Int64'), 'amount': pd.array([1.5, None], dtype='Float64')}),
+        pd.DataFrame({'id': pd.array([3, 4], dtype='Int64'), 'amount': pd.array(['383', 'n/a'], dtype='string')}),
+    ]
+    table = write_chunks(tmp_path / 'out.parquet', chunks, parts_dir and str(parts_dir))
+    assert str(table.schema.field('amount').type) == 'string'
+    assert str(table.schema.field('id').type) == 'int64'
+    assert table.column('amount').to_pylist() == ['1.5', None, '383', 'n/a']
+    assert pd.read_parquet(tmp_path / 'out.parquet')['id'].tolist() == [1, 2, 3, 4]
+
+def test_integers_then_mixed_values(tmp_path):
+    chunks = [
+        pd.DataFrame({'code': pd.array([10, 20], dtype='Int64')}),
+        pd.DataFrame({'code': pd.Series([30, 'A1'], dtype=object)}),
+        pd.DataFrame({'code': pd.array([40, None], dtype='Int64')}),
+    ]
+    table = write_chunks(tmp_path / 'out.parquet', chunks)
+    assert table.column('code').to_pylist() == ['10', '20', '30', 'A1', '40', None]
+
+def test_integers_then_decimals_become_float(tmp_path):
+    chunks = [
+        pd.DataFrame({'qty': pd.array([1, 2], dtype='Int64')}),
+        pd.DataFrame({'qty': pd.array([2.5, None], dtype='Float64')}),
+    ]
+    table = write_chunks(tmp_path / 'out.parquet', chunks)
+    assert str(table.schema.field('qty').type) == 'double'
+    assert table.column('qty').to_pylist() == [1.0, 2.0, 2.5, None]
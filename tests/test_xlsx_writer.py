@@ -0,0 +1,17 @@
+import openpyxl
+import pandas as pd
+
+from operations.xlsx_writer import XlsxChunkWriter
+
+def test_datetime_format_is_fixed_per_column(tmp_path):
+    path = tmp_path / 'out.xlsx'
+    writer = XlsxChunkWriter(str(path))
+    writer.write(pd.DataFrame({'when': pd.to_datetime(['2024-01-01', None])}))
+    writer.write(pd.DataFrame({'when': pd.to_datetime(['2024-01-02 12:30', '1850-06-01 08:00'])}))
+    writer.close()
+    sheet = openpyxl.load_workbook(path).active
+    cells = [sheet.cell(row, 1) for row in range(2, 6)]
+    assert {cells[0].number_format, cells[2].number_format} == {'yyyy-mm-dd'}
+    # The time of day stays in the serial; dates Excel can't store use the column's format as text
+    assert cells[2].value == pd.Timestamp('2024-01-02 12:30')
+    assert cells[3].value == '1850-06-01'